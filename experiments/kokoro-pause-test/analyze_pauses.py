@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""Measure pauses in the Kokoro pause experiment clips.
+
+Replaces listening through every clip: each MP3 in audio/ is decoded and
+split into 20 ms frames (10 ms hop). A frame is silent when its RMS energy
+is far below the clip's speech level, unless a high zero-crossing rate marks
+it as an unvoiced consonant (す, し, ツ are quiet but not pauses). Runs of
+silent frames inside the speech are the pauses.
+
+For particle (A) and adverb (B) variations, the pause nearest to the target
+word is located from its mora position in the sentence, and compared with
+the baseline clip of the same sentence:
+
+    target_pause_ms   pause at the target word (0 = none)
+    gain_ms           target pause minus the baseline's
+    extra_speech_ms   speech added over the baseline (e.g. SSML tags read aloud)
+
+Per-clip measurements are written to pause_scores.csv (next to
+pause_variations.csv, keyed by filename), followed by tables ranking the
+patterns for each target word and overall. pause_policy.py learn turns the
+scores into pause rules.
+
+Analyses are cached in .cache/pause-analysis.json by clip content, so
+re-scoring after a grid change only decodes clips that are new.
+
+Usage:
+    uv run python experiments/kokoro-pause-test/analyze_pauses.py
+    uv run python experiments/kokoro-pause-test/analyze_pauses.py --audio-dir /tmp/clips
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+# Experiment directory
+EXPERIMENT_DIR = Path(__file__).parent
+AUDIO_DIR = EXPERIMENT_DIR / "audio"
+CSV_PATH = EXPERIMENT_DIR / "pause_variations.csv"
+SCORES_PATH = EXPERIMENT_DIR / "pause_scores.csv"
+
+sys.path.insert(0, str(EXPERIMENT_DIR.parent.parent / "scripts"))
+from corpus import CACHE_DIR  # noqa: E402
+
+ANALYSIS_CACHE_PATH = CACHE_DIR / "pause-analysis.json"
+# Bump when the thresholds or the measurement change
+ANALYSIS_VERSION = 1
+
+# Categories whose target is a pause position (C/D test pronunciation)
+PAUSE_CATEGORIES = ('A', 'B')
+
+# Framing
+FRAME_MS = 20
+HOP_MS = 10
+
+# Silence: RMS this far below the clip's speech level (95th percentile frame)...
+SILENCE_DB = -35
+# ...unless the frame is noisy rather than quiet (unvoiced consonant)
+UNVOICED_DB = -45
+UNVOICED_ZCR = 0.25
+
+# Shorter silent runs are stop closures and gaps between morae, not pauses
+MIN_PAUSE_MS = 60
+
+# How far from the estimated target position a pause may start or end
+WINDOW_MS = 300
+
+SCORE_FIELDS = [
+    'filename', 'sentence_id', 'category', 'pattern', 'target_word', 'context',
+    'duration_ms', 'speech_ms', 'pause_count', 'total_pause_ms',
+    'target_pause_ms', 'target_offset_ms', 'gain_ms', 'extra_speech_ms',
+]
+
+# Small kana merge with the preceding mora
+SMALL_KANA = set('ャュョァィゥェォヮゃゅょぁぃぅぇぉゎ')
+
+_tagger = None
+
+
+def get_tagger():
+    """Shared fugashi tagger (created on first use; loading UniDic is slow)."""
+    global _tagger
+    if _tagger is None:
+        import fugashi
+        _tagger = fugashi.Tagger()
+    return _tagger
+
+
+def count_morae(text: str) -> int:
+    """Mora count of a text from UniDic pronunciations (punctuation counts 0)."""
+    morae = 0
+    for token in get_tagger()(text):
+        if token.feature.pos1 == '補助記号':
+            continue
+        pron = getattr(token.feature, 'pron', None)
+        reading = pron if pron and pron != '*' else token.surface
+        morae += sum(1 for char in reading if char not in SMALL_KANA)
+    return morae
+
+
+def target_fraction(original: str, modified_texts: list[str], target: str) -> float | None:
+    """Mora position of the end of the target word, as a fraction of the sentence.
+
+    The occurrence of the target is the one next to where the variations
+    edit the sentence (so が in プログラムが is not confused with an earlier が).
+    """
+    starts = []
+    idx = original.find(target)
+    while idx != -1:
+        starts.append(idx)
+        idx = original.find(target, idx + 1)
+    if not starts:
+        return None
+
+    # First position where any variation differs from the original
+    edits = []
+    for text in modified_texts:
+        diff = next((i for i, (a, b) in enumerate(zip(original, text)) if a != b), None)
+        if diff is not None:
+            edits.append(diff)
+    edit = min(edits) if edits else starts[0]
+    start = min(starts, key=lambda s: min(abs(s - edit), abs(s + len(target) - edit)))
+
+    total = count_morae(original)
+    if not total:
+        return None
+    return count_morae(original[:start + len(target)]) / total
+
+
+def decode(path: Path) -> tuple[np.ndarray, int]:
+    """Decode a clip to mono float32."""
+    audio, sample_rate = sf.read(str(path), dtype='float32', always_2d=True)
+    return audio.mean(axis=1), sample_rate
+
+
+def frame_features(audio: np.ndarray, sample_rate: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-frame RMS (dB) and zero-crossing rate."""
+    frame = sample_rate * FRAME_MS // 1000
+    hop = sample_rate * HOP_MS // 1000
+    if len(audio) < frame:
+        audio = np.pad(audio, (0, frame - len(audio)))
+
+    frames = np.lib.stride_tricks.sliding_window_view(audio, frame)[::hop]
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    rms_db = 20 * np.log10(np.maximum(rms, 1e-10))
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+    return rms_db, zcr
+
+
+def silent_runs(silent: np.ndarray) -> list[tuple[int, int]]:
+    """(start, end) frame ranges of consecutive silent frames."""
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    return list(zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+
+class ClipAnalysis:
+    """Speech span and internal pauses of one clip (times in ms)."""
+
+    def __init__(self, duration_ms: float, speech_start: int, speech_end: int,
+                 pauses: list[tuple[int, int]]):
+        self.duration_ms = duration_ms
+        self.speech_start = speech_start
+        self.speech_end = speech_end
+        self.pauses = pauses
+
+    @classmethod
+    def measure(cls, audio: np.ndarray, sample_rate: int) -> 'ClipAnalysis':
+        rms_db, zcr = frame_features(audio, sample_rate)
+        level = np.percentile(rms_db, 95)
+        unvoiced = (rms_db > level + UNVOICED_DB) & (zcr > UNVOICED_ZCR)
+        silent = (rms_db < level + SILENCE_DB) & ~unvoiced
+
+        duration_ms = len(audio) * 1000 / sample_rate
+        voiced = np.flatnonzero(~silent)
+        if not len(voiced):
+            return cls(duration_ms, 0, 0, [])
+
+        min_frames = MIN_PAUSE_MS // HOP_MS
+        # Leading and trailing silence is not a pause
+        pauses = [(int(start) * HOP_MS, int(end) * HOP_MS) for start, end in silent_runs(silent)
+                  if start > voiced[0] and end <= voiced[-1] and end - start >= min_frames]
+        return cls(duration_ms, int(voiced[0]) * HOP_MS, int(voiced[-1]) * HOP_MS + FRAME_MS, pauses)
+
+    def as_dict(self) -> dict:
+        return {'duration_ms': self.duration_ms, 'speech_start': self.speech_start,
+                'speech_end': self.speech_end, 'pauses': self.pauses}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ClipAnalysis':
+        return cls(data['duration_ms'], data['speech_start'], data['speech_end'],
+                   [tuple(pause) for pause in data['pauses']])
+
+    @property
+    def pause_ms(self) -> float:
+        return sum(end - start for start, end in self.pauses)
+
+    @property
+    def speech_ms(self) -> float:
+        return self.speech_end - self.speech_start - self.pause_ms
+
+    def time_at(self, fraction: float) -> float:
+        """Clip time where this fraction of the speech (pauses excluded) is reached."""
+        remaining = fraction * self.speech_ms
+        position = self.speech_start
+        for start, end in self.pauses:
+            if start - position >= remaining:
+                break
+            remaining -= start - position
+            position = end
+        return position + remaining
+
+    def pause_near(self, time_ms: float) -> tuple[float, float]:
+        """(length, center offset) of the longest pause near a time, (0, 0) if none."""
+        near = [(end - start, (start + end) / 2 - time_ms) for start, end in self.pauses
+                if start - WINDOW_MS <= time_ms <= end + WINDOW_MS]
+        return max(near, default=(0, 0))
+
+
+class AnalysisCache:
+    """Clip analyses keyed by the SHA-256 of the clip, persisted between runs."""
+
+    def __init__(self, path: Path = ANALYSIS_CACHE_PATH):
+        self.path = path
+        self.analyses = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            data = {}
+        if data.get('version') == ANALYSIS_VERSION:
+            self.analyses = data.get('analyses', {})
+
+    def analyze(self, path: Path) -> ClipAnalysis | None:
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError as e:
+            print(f"  Error reading {path.name}: {e}")
+            return None
+
+        cached = self.analyses.get(digest)
+        if cached is not None:
+            self.hits += 1
+            return ClipAnalysis.from_dict(cached)
+
+        try:
+            clip = ClipAnalysis.measure(*decode(path))
+        except (RuntimeError, sf.LibsndfileError) as e:
+            print(f"  Error decoding {path.name}: {e}")
+            return None
+        self.misses += 1
+        self.analyses[digest] = clip.as_dict()
+        return clip
+
+    def save(self):
+        self.path.parent.mkdir(exist_ok=True)
+        self.path.write_text(json.dumps({'version': ANALYSIS_VERSION, 'analyses': self.analyses}),
+                             encoding='utf-8')
+
+
+def score_variations(variations: list[dict], clips: dict[str, ClipAnalysis]) -> list[dict]:
+    """One score row per decoded clip."""
+    groups = defaultdict(list)
+    for row in variations:
+        groups[row['sentence_id'], row['category']].append(row)
+
+    scores = []
+    for (sentence_id, category), rows in groups.items():
+        fraction = None
+        if category in PAUSE_CATEGORIES:
+            fraction = target_fraction(rows[0]['original'], [r['modified'] for r in rows], rows[0]['target_word'])
+
+        measured = {}
+        for row in rows:
+            clip = clips.get(row['filename'])
+            if clip is None:
+                continue
+            score = {
+                'filename': row['filename'],
+                'sentence_id': sentence_id,
+                'category': category,
+                'pattern': row['pattern'],
+                'target_word': row['target_word'],
+                'context': row.get('context', ''),
+                'duration_ms': round(clip.duration_ms),
+                'speech_ms': round(clip.speech_ms),
+                'pause_count': len(clip.pauses),
+                'total_pause_ms': round(clip.pause_ms),
+                'target_pause_ms': '',
+                'target_offset_ms': '',
+                'gain_ms': '',
+                'extra_speech_ms': '',
+            }
+            if fraction is not None:
+                length, offset = clip.pause_near(clip.time_at(fraction))
+                score['target_pause_ms'] = round(length)
+                score['target_offset_ms'] = round(offset) if length else ''
+            measured[row['pattern']] = score
+            scores.append(score)
+
+        baseline = measured.get('baseline')
+        if baseline is None or fraction is None:
+            continue
+        for score in measured.values():
+            score['gain_ms'] = score['target_pause_ms'] - baseline['target_pause_ms']
+            score['extra_speech_ms'] = score['speech_ms'] - baseline['speech_ms']
+
+    return scores
+
+
+def ranking(scores: list[dict]) -> list[tuple[str, float, float, int]]:
+    """(pattern, mean gain, mean extra speech, clips) sorted by gain."""
+    by_pattern = defaultdict(list)
+    for score in scores:
+        if score['gain_ms'] != '':
+            by_pattern[score['pattern']].append(score)
+
+    rows = []
+    for pattern, group in by_pattern.items():
+        gain = np.mean([s['gain_ms'] for s in group])
+        extra = np.mean([s['extra_speech_ms'] for s in group])
+        rows.append((pattern, float(gain), float(extra), len(group)))
+    return sorted(rows, key=lambda r: -r[1])
+
+
+def print_ranking(title: str, rows: list[tuple[str, float, float, int]]):
+    print(f"\n{title}")
+    print(f"  {'Pattern':<18} {'Pause gain':>11} {'Extra speech':>13} {'Clips':>6}")
+    for pattern, gain, extra, count in rows:
+        print(f"  {pattern:<18} {gain:>9.0f}ms {extra:>11.0f}ms {count:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Score pause length and position in the pause experiment clips",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python experiments/kokoro-pause-test/analyze_pauses.py
+  uv run python experiments/kokoro-pause-test/analyze_pauses.py --audio-dir /tmp/clips -o /tmp/scores.csv
+        """
+    )
+    parser.add_argument("--audio-dir", type=Path, default=AUDIO_DIR,
+                        help=f"Directory with the clips (default: {AUDIO_DIR.name}/)")
+    parser.add_argument("--output", "-o", type=Path, default=SCORES_PATH,
+                        help=f"Scores CSV (default: {SCORES_PATH.name})")
+
+    args = parser.parse_args()
+
+    with open(CSV_PATH, 'r', encoding='utf-8') as f:
+        variations = list(csv.DictReader(f))
+
+    paths = {row['filename']: args.audio_dir / row['filename'] for row in variations}
+    missing = [name for name, path in paths.items() if not path.exists()]
+    if len(missing) == len(paths):
+        print(f"Error: no clips in {args.audio_dir} (run generate_experiment.py first)")
+        sys.exit(1)
+    if missing:
+        print(f"Warning: {len(missing)} clips missing, skipping them")
+
+    present = [name for name in paths if name not in missing]
+    cache = AnalysisCache()
+    with ThreadPoolExecutor() as pool:
+        analyses = pool.map(cache.analyze, (paths[name] for name in present))
+        clips = {name: clip for name, clip in zip(present, analyses) if clip is not None}
+    cache.save()
+
+    scores = score_variations(variations, clips)
+    with open(args.output, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=SCORE_FIELDS)
+        writer.writeheader()
+        writer.writerows(scores)
+    print(f"Analyzed {len(clips)} clips ({cache.misses} decoded, {cache.hits} cached) → {args.output}")
+
+    targets = defaultdict(list)
+    for score in scores:
+        targets[score['category'], score['target_word']].append(score)
+    for (category, target), group in sorted(targets.items()):
+        if category in PAUSE_CATEGORIES:
+            print_ranking(f"{target} ({category})", ranking(group))
+
+    print_ranking("All particles and adverbs", ranking(scores))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,140 +3,128 @@
 
 Tests different punctuation/pause patterns for Japanese particles and adverbs
 to find optimal patterns for natural-sounding speech.
+
+Variations come from pause_variations.csv (see generate_grid.py). Each
+distinct text is synthesized once per voice into the shared audio cache
+(.cache/tts-audio, see tts.AudioCache), in parallel, and copied to every
+variation that uses it. Re-runs only render texts that are new.
 """
 
+import argparse
 import csv
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import lameenc
-import numpy as np
-from kokoro import KPipeline
-
 # Experiment directory
 EXPERIMENT_DIR = Path(__file__).parent
 AUDIO_DIR = EXPERIMENT_DIR / "audio"
 CSV_PATH = EXPERIMENT_DIR / "pause_variations.csv"
 
-# Voice settings
-VOICE = 'jm_kumo'  # Male voice
-
-
-def generate_audio(pipeline: KPipeline, text: str, output_path: Path) -> bool:
-    """Generate MP3 audio for given text.
-
-    Args:
-        pipeline: Initialized Kokoro pipeline
-        text: Japanese text to synthesize
-        output_path: Path for output MP3 file
-
-    Returns:
-        True if successful, False otherwise
-    """
-    try:
-        audio_chunks = []
-        for gs, ps, audio in pipeline(text, voice=VOICE):
-            audio_chunks.append(audio.numpy() if hasattr(audio, 'numpy') else audio)
+# Shared TTS module (uses the daemon from scripts/tts.py serve if running)
+sys.path.insert(0, str(EXPERIMENT_DIR.parent.parent / "scripts"))
+from tts import VOICE_FEMALE, VOICE_MALE, AudioCache, get_synthesizer  # noqa: E402
 
-        if not audio_chunks:
-            return False
+# Output directory per voice (like tier*-audio and tier*-audio-female)
+VOICE_DIRS = {
+    VOICE_MALE: AUDIO_DIR,
+    VOICE_FEMALE: EXPERIMENT_DIR / "audio-female",
+}
 
-        # Concatenate audio chunks
-        if len(audio_chunks) == 1:
-            audio_data = audio_chunks[0]
-        else:
-            audio_data = np.concatenate(audio_chunks)
 
-        # Convert float32 audio to int16 for MP3 encoding
-        audio_int16 = (audio_data * 32767).astype(np.int16)
+def render_texts(synth, cache: AudioCache, texts: list[str], voice: str, jobs: int) -> dict[str, Path]:
+    """Render texts into the cache in parallel. Returns text → cached clip."""
+    clips = {}
+    rendered = failed = 0
 
-        # Encode directly to MP3 using lameenc
-        encoder = lameenc.Encoder()
-        encoder.set_bit_rate(128)
-        encoder.set_in_sample_rate(24000)
-        encoder.set_channels(1)
-        encoder.set_quality(2)
+    def render(text: str):
+        try:
+            return text, *cache.render(synth, text, voice)
+        except Exception as e:
+            print(f"    Error ({voice}): {text[:40]}: {e}")
+            return text, None, False
 
-        mp3_data = encoder.encode(audio_int16.tobytes()) + encoder.flush()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for num, (text, path, was_rendered) in enumerate(pool.map(render, texts), 1):
+            if path is None:
+                failed += 1
+                continue
+            clips[text] = path
+            if was_rendered:
+                rendered += 1
+                print(f"[{voice} {num}/{len(texts)}] {text[:60]}{'...' if len(text) > 60 else ''}")
 
-        with open(output_path, 'wb') as f:
-            f.write(mp3_data)
-
-        return True
-
-    except Exception as e:
-        print(f"    Error: {e}")
-        return False
+    print(f"  {voice}: {rendered} rendered, {len(texts) - rendered - failed} cached, {failed} failed")
+    return clips
 
 
 def main():
-    # Ensure output directory exists
-    AUDIO_DIR.mkdir(exist_ok=True)
+    parser = argparse.ArgumentParser(
+        description="Render the pause experiment clips",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python experiments/kokoro-pause-test/generate_experiment.py
+  uv run python experiments/kokoro-pause-test/generate_experiment.py --both --jobs 4
+  uv run python experiments/kokoro-pause-test/generate_experiment.py --variations /tmp/grid.csv
+        """
+    )
+    parser.add_argument("--female", action="store_true",
+                        help=f"Use the female voice ({VOICE_FEMALE}) and save to audio-female/")
+    parser.add_argument("--both", action="store_true",
+                        help="Render both voices")
+    parser.add_argument("--jobs", "-j", type=int, default=4,
+                        help="Parallel renders (default: 4)")
+    parser.add_argument("--variations", type=Path, default=CSV_PATH,
+                        help=f"Variations CSV (default: {CSV_PATH.name})")
+
+    args = parser.parse_args()
 
     # Read variations
-    if not CSV_PATH.exists():
-        print(f"Error: {CSV_PATH} not found")
+    if not args.variations.exists():
+        print(f"Error: {args.variations} not found")
         sys.exit(1)
 
-    with open(CSV_PATH, 'r', encoding='utf-8') as f:
+    with open(args.variations, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         variations = list(reader)
 
+    if args.both:
+        voices = [VOICE_MALE, VOICE_FEMALE]
+    else:
+        voices = [VOICE_FEMALE if args.female else VOICE_MALE]
+
+    # Identical texts (baselines shared by several targets, ...) render once
+    texts = list(dict.fromkeys(row['modified'] for row in variations))
+
     total = len(variations)
     print(f"Kokoro TTS Pause Pattern Experiment")
     print(f"====================================")
-    print(f"Total variations: {total}")
-    print(f"Output directory: {AUDIO_DIR}")
-    print(f"Voice: {VOICE}\n")
-
-    # Initialize pipeline
-    print("Initializing Kokoro TTS pipeline...")
-    pipeline = KPipeline(lang_code='j')
-    print("Pipeline ready.\n")
-
-    # Track statistics
-    success = 0
-    skipped = 0
-    failed = 0
-
-    # Generate audio for each variation
-    for idx, row in enumerate(variations):
-        num = idx + 1
-        sentence_id = row['sentence_id']
-        category = row['category']
-        variation_id = row['variation_id']
-        pattern = row['pattern']
-        text = row['modified']
-        filename = row['filename']
-
-        output_path = AUDIO_DIR / filename
-
-        # Skip if already exists
-        if output_path.exists():
-            print(f"[{num}/{total}] Skipping (exists): {filename}")
-            skipped += 1
-            continue
-
-        # Display progress
-        print(f"[{num}/{total}] {sentence_id}_{category}{variation_id} ({pattern})")
-        print(f"         {text[:60]}{'...' if len(text) > 60 else ''}")
-
-        if generate_audio(pipeline, text, output_path):
-            success += 1
-        else:
-            failed += 1
+    print(f"Total variations: {total} ({len(texts)} unique texts)")
+    print(f"Voices: {', '.join(voices)}\n")
+
+    # Initialize synthesizer (daemon client, or Kokoro loaded here)
+    synth = get_synthesizer()
+    cache = AudioCache()
+
+    # Voices render concurrently (each pipeline handles one text at a time)
+    with ThreadPoolExecutor(max_workers=len(voices)) as pool:
+        results = list(pool.map(lambda voice: render_texts(synth, cache, texts, voice, args.jobs), voices))
 
     # Summary
     print(f"\n====================================")
     print(f"Generation complete!")
-    print(f"  Success: {success}")
-    print(f"  Skipped: {skipped}")
-    print(f"  Failed:  {failed}")
-    print(f"  Total:   {success + skipped}/{total}")
-
-    # Verify files
-    generated_files = list(AUDIO_DIR.glob("*.mp3"))
-    print(f"\nAudio files in {AUDIO_DIR}: {len(generated_files)}")
+    for voice, clips in zip(voices, results):
+        output_dir = VOICE_DIRS[voice]
+        output_dir.mkdir(exist_ok=True)
+        copied = 0
+        for row in variations:
+            clip = clips.get(row['modified'])
+            if clip is not None:
+                shutil.copyfile(clip, output_dir / row['filename'])
+                copied += 1
+        print(f"  {voice}: {copied}/{total} files in {output_dir}")
 
 
 if __name__ == "__main__":
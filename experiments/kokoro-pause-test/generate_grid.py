@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Generate pause_variations.csv from sentences and pattern rules.
+
+Each row of grid_sentences.csv names a sentence, a category and the target
+word (with its occurrence, for words that appear more than once). Every
+target is expanded with the patterns of its category:
+
+- A (particles): punctuation, spaces or an SSML break around the particle
+- B (adverbs): the same after the adverb
+- C (small tsu, long vowels): baseline only
+- D (long vowels): respellings of the katakana word (サーバー → サアバア, さーばー)
+
+With --tier, sentences from the vocabulary CSVs are added as well, with
+the targets of the pause policy (data/pause_policy.csv): its particles where
+fugashi tags them as particles, and its sentence-initial words.
+
+Each variation records the part of speech after its target (context), which
+pause_policy.py learn uses to choose a pattern per context.
+
+Usage:
+    uv run python experiments/kokoro-pause-test/generate_grid.py
+    uv run python experiments/kokoro-pause-test/generate_grid.py --tier 1 --tier 2 -o /tmp/grid.csv
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+import jaconv
+
+# Experiment directory
+EXPERIMENT_DIR = Path(__file__).parent
+SENTENCES_PATH = EXPERIMENT_DIR / "grid_sentences.csv"
+CSV_PATH = EXPERIMENT_DIR / "pause_variations.csv"
+
+sys.path.insert(0, str(EXPERIMENT_DIR.parent.parent / "scripts"))
+from corpus import load_rows  # noqa: E402
+from pause_policy import context_after, read_policy, tokenize  # noqa: E402
+
+FIELDNAMES = ['sentence_id', 'category', 'variation_id', 'pattern', 'target_word',
+              'context', 'original', 'modified', 'filename']
+
+SSML_BREAK = '<break time="200ms"/>'
+
+# Katakana by vowel, for spelling out ー
+VOWEL_ROWS = {
+    'ア': 'アカサタナハマヤラワガザダバパャァ',
+    'イ': 'イキシチニヒミリギジヂビピィ',
+    'ウ': 'ウクスツヌフムユルグズヅブプュゥヴ',
+    'エ': 'エケセテネヘメレゲゼデベペェ',
+    'オ': 'オコソトノホモヨロヲゴゾドボポョォ',
+}
+VOWELS = {kana: vowel for vowel, row in VOWEL_ROWS.items() for kana in row}
+SMALL_VOWELS = dict(zip('アイウエオ', 'ァィゥェォ'))
+
+
+def insert(before: str, after: str):
+    """Pattern that puts text before and after the target."""
+    def apply(text: str, start: int, end: int) -> str:
+        return text[:start] + before + text[start:end] + after + text[end:]
+    return apply
+
+
+def spell_long_vowels(word: str, small: bool = False) -> str:
+    """Replace ー with the vowel it lengthens: サーバー → サアバア (or サァバァ)."""
+    chars = []
+    for char in word:
+        vowel = VOWELS.get(chars[-1]) if char == 'ー' and chars else None
+        if vowel:
+            char = SMALL_VOWELS[vowel] if small else vowel
+        chars.append(char)
+    return ''.join(chars)
+
+
+def is_katakana(char: str) -> bool:
+    return 'ァ' <= char <= 'ヶ' or char == 'ー'
+
+
+def respell(convert):
+    """Pattern that rewrites the katakana word containing the target."""
+    def apply(text: str, start: int, end: int) -> str:
+        while start > 0 and is_katakana(text[start - 1]):
+            start -= 1
+        while end < len(text) and is_katakana(text[end]):
+            end += 1
+        return text[:start] + convert(text[start:end]) + text[end:]
+    return apply
+
+
+PATTERNS = {
+    'A': [
+        ('baseline', insert('', '')),
+        ('comma_before', insert('、', '')),
+        ('comma_after', insert('', '、')),
+        ('space_half', insert(' ', ' ')),
+        ('space_full', insert('　', '　')),
+        ('period_after', insert('', '。')),
+        ('ellipsis_before', insert('...', '')),
+        ('ellipsis_after', insert('', '...')),
+        ('double_comma', insert('、、', '')),
+        ('ssml_break', insert(SSML_BREAK, '')),
+    ],
+    'B': [
+        ('baseline', insert('', '')),
+        ('comma_after', insert('', '、')),
+        ('space_half', insert('', ' ')),
+        ('space_full', insert('', '　')),
+        ('ellipsis_after', insert('', '...')),
+        ('ssml_break', insert('', SSML_BREAK)),
+    ],
+    'C': [
+        ('baseline', insert('', '')),
+    ],
+    'D': [
+        ('baseline', insert('', '')),
+        ('vowel_kana', respell(spell_long_vowels)),
+        ('small_vowel', respell(lambda word: spell_long_vowels(word, small=True))),
+        ('hiragana', respell(jaconv.kata2hira)),
+        ('hiragana_expanded', respell(lambda word: jaconv.kata2hira(spell_long_vowels(word)))),
+    ],
+}
+
+
+class Target:
+    """One target word in one sentence."""
+
+    def __init__(self, sentence_id: str, category: str, word: str, sentence: str, start: int):
+        self.sentence_id = sentence_id
+        self.category = category
+        self.word = word
+        self.sentence = sentence
+        self.start = start
+
+    def variations(self) -> list[dict]:
+        rows = []
+        end = self.start + len(self.word)
+        context = context_after(tokenize(self.sentence), end)
+        for num, (pattern, apply) in enumerate(PATTERNS[self.category], 1):
+            variation_id = f"{num:02d}"
+            rows.append({
+                'sentence_id': self.sentence_id,
+                'category': self.category,
+                'variation_id': variation_id,
+                'pattern': pattern,
+                'target_word': self.word,
+                'context': context,
+                'original': self.sentence,
+                'modified': apply(self.sentence, self.start, end),
+                'filename': f"{self.sentence_id}_{self.category}{variation_id}_{pattern}.mp3",
+            })
+        return rows
+
+
+def find_occurrence(text: str, word: str, occurrence: int) -> int:
+    """Index of the nth occurrence of word in text (っ also matches ッ)."""
+    haystack, needle = jaconv.kata2hira(text), jaconv.kata2hira(word)
+    start = -1
+    for _ in range(occurrence):
+        start = haystack.find(needle, start + 1)
+        if start == -1:
+            raise ValueError(f"'{word}' does not occur {occurrence}x in {text}")
+    return start
+
+
+def read_targets(path: Path = SENTENCES_PATH) -> list[Target]:
+    targets = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            start = find_occurrence(row['sentence'], row['target_word'], int(row['occurrence'] or 1))
+            targets.append(Target(row['sentence_id'], row['category'], row['target_word'], row['sentence'], start))
+    return targets
+
+
+def tier_targets(tier: int) -> list[Target]:
+    """Policy particles (A) and sentence-initial words (B) of a tier's sentences.
+
+    Sentence ids are t{tier}_{row}, with a letter per target when a
+    sentence has more than one (t1_004a, t1_004b).
+    """
+    rules = read_policy()
+    particles = {rule.target for rule in rules if rule.pos == '助詞' and rule.position == 'any'}
+    # Longest first, so 具体的には wins over shorter matches
+    initial = sorted({rule.target for rule in rules if rule.position == 'initial'}, key=len, reverse=True)
+
+    targets = []
+    for row in load_rows(tier, ['Sentence']):
+        sentence = row.Sentence
+        found = []
+
+        adverb = next((word for word in initial if sentence.startswith(word)), None)
+        if adverb:
+            found.append(('B', adverb, 0))
+
+        for start, _, surface, pos1 in tokenize(sentence):
+            if pos1 == '助詞' and surface in particles and start > 0:
+                found.append(('A', surface, start))
+
+        base_id = f"t{tier}_{row.row:03d}"
+        for idx, (category, word, start) in enumerate(found):
+            sentence_id = base_id if len(found) == 1 else f"{base_id}{chr(ord('a') + idx)}"
+            targets.append(Target(sentence_id, category, word, sentence, start))
+    return targets
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Expand sentences × targets × patterns into pause_variations.csv",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python experiments/kokoro-pause-test/generate_grid.py
+  uv run python experiments/kokoro-pause-test/generate_grid.py --tier 1 -o /tmp/grid.csv
+        """
+    )
+    parser.add_argument("--tier", type=int, action="append", choices=range(1, 7),
+                        help="Also expand particles and adverbs of this tier's sentences (repeatable)")
+    parser.add_argument("--output", "-o", type=Path, default=CSV_PATH,
+                        help=f"Output CSV (default: {CSV_PATH.name})")
+
+    args = parser.parse_args()
+
+    targets = read_targets()
+    for tier in args.tier or []:
+        targets.extend(tier_targets(tier))
+
+    variations = [row for target in targets for row in target.variations()]
+    filenames = [row['filename'] for row in variations]
+    if len(set(filenames)) != len(filenames):
+        print("Error: duplicate variation filenames (repeated sentence_id and category?)")
+        sys.exit(1)
+
+    with open(args.output, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(variations)
+
+    unique = len({row['modified'] for row in variations})
+    print(f"{len(targets)} targets → {len(variations)} variations ({unique} unique texts) → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
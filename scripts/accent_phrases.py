@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Accent phrases from OpenJTalk's frontend.
+
+pyopenjtalk.run_frontend() returns one NJD node per word with a
+chain_flag: 1 when the word joins the accent phrase before it, 0 (or -1
+for the first word) when it starts a new one. Punctuation nodes end the
+phrase before them.
+
+Breath groups are not kept: OpenJTalk also pauses on an ellipsis, where
+Kokoro does not, so they cannot tell where a comma is redundant.
+
+pause_policy.py only inserts a pause where a word ends an accent phrase, so
+a comma never splits words OpenJTalk reads as one phrase (a compound that
+fugashi split, a particle inside a set phrase). Texts whose nodes cannot be
+aligned with the input are not gated.
+
+Parses are cached in .cache/accent-phrases.json by text hash, so only
+new or edited sentences go through the frontend; phrase_all() parses a
+batch of misses in worker processes. Workers are spawned rather than forked
+(build.py calls this from several threads), and only after the first parse
+in this process has made sure the dictionary is installed.
+
+Usage:
+    uv run python scripts/accent_phrases.py まず問題が発生しました。
+    uv run python scripts/accent_phrases.py --all    # Parse every tier, report timing
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+import jaconv
+
+from corpus import CACHE_DIR
+
+CACHE_PATH = CACHE_DIR / "accent-phrases.json"
+# Bump when the boundary rules change (pause_policy fingerprints include it)
+PHRASING_VERSION = 2
+
+# Misses below this are parsed in-process (worker startup loads the dictionary)
+POOL_THRESHOLD = 200
+
+
+class Phrasing:
+    """Offsets in the text where accent phrases start."""
+
+    __slots__ = ('accent',)
+
+    def __init__(self, accent: Iterable[int]):
+        self.accent = frozenset(accent)
+
+    def as_list(self) -> list[int]:
+        return sorted(self.accent)
+
+    def describe(self, text: str) -> str:
+        """The text with / between accent phrases."""
+        parts = []
+        last = 0
+        for pos in sorted(self.accent):
+            parts.append(text[last:pos])
+            parts.append(' / ')
+            last = pos
+        return ''.join(parts) + text[last:]
+
+
+def normalize(text: str) -> str:
+    """OpenJTalk returns full-width ASCII and digits; compare half-width."""
+    return jaconv.z2h(text, kana=False, ascii=True, digit=True)
+
+
+def align(text: str, strings: list[str]) -> list[int] | None:
+    """Start offset in text of each node string, or None if they differ."""
+    text = normalize(text)
+    starts = []
+    cursor = 0
+    for string in strings:
+        string = normalize(string).strip()
+        while cursor < len(text) and text[cursor].isspace():
+            cursor += 1
+        if not text.startswith(string, cursor):
+            return None
+        starts.append(cursor)
+        cursor += len(string)
+    if text[cursor:].strip():
+        return None
+    return starts
+
+
+def parse(text: str) -> Phrasing | None:
+    """Accent-phrase starts of a text (None if unaligned)."""
+    import pyopenjtalk
+
+    nodes = pyopenjtalk.run_frontend(text)
+    starts = align(text, [node['string'] for node in nodes])
+    if starts is None:
+        return None
+
+    accent = set()
+    for node, start in zip(nodes, starts):
+        if start > 0 and node['chain_flag'] != 1:
+            accent.add(start)
+        if node['pos'] == '記号':
+            # Punctuation ends the phrase; the next word starts a new one
+            accent.add(start + len(node['string']))
+    end = len(text)
+    return Phrasing(pos for pos in accent if pos < end)
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class PhrasingCache:
+    """Parses keyed by text hash, persisted between runs."""
+
+    def __init__(self, path: Path = CACHE_PATH):
+        self.path = path
+        self.entries = {}
+        self.lock = threading.Lock()
+        # One batch at a time, so concurrent callers share one worker pool
+        self.fill_lock = threading.Lock()
+        self.dirty = False
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            data = {}
+        if data.get('version') == self.version:
+            self.entries = data.get('phrasing', {})
+
+    @property
+    def version(self) -> str:
+        import pyopenjtalk
+        return f"{PHRASING_VERSION}:{pyopenjtalk.__version__}"
+
+    def get(self, text: str) -> Phrasing | None:
+        """Cached parse of a text, parsing it on a miss."""
+        key = text_key(text)
+        if key not in self.entries:
+            phrasing = parse(text)
+            with self.lock:
+                self.entries[key] = phrasing.as_list() if phrasing else None
+                self.dirty = True
+        entry = self.entries[key]
+        return Phrasing(entry) if entry is not None else None
+
+    def fill(self, texts: Iterable[str]) -> int:
+        """Parse the texts missing from the cache, in batch. Returns how many."""
+        texts = list(texts)
+        with self.fill_lock:
+            return self._fill(texts)
+
+    def _fill(self, texts: list[str]) -> int:
+        missing = list({text_key(text): text for text in texts if text_key(text) not in self.entries}.items())
+        if not missing:
+            return 0
+
+        texts = [text for _, text in missing]
+        # In-process first: downloads the dictionary once, before any worker needs it
+        parsed = [parse(texts[0])]
+        if len(texts) < POOL_THRESHOLD:
+            parsed += [parse(text) for text in texts[1:]]
+        else:
+            # Forking a threaded process can deadlock the children on inherited locks
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as pool:
+                parsed += pool.map(parse, texts[1:], chunksize=64)
+
+        with self.lock:
+            for (key, _), phrasing in zip(missing, parsed):
+                self.entries[key] = phrasing.as_list() if phrasing else None
+            self.dirty = True
+        return len(missing)
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            self.path.parent.mkdir(exist_ok=True)
+            self.path.write_text(json.dumps({'version': self.version, 'phrasing': self.entries}),
+                                 encoding='utf-8')
+            self.dirty = False
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> PhrasingCache:
+    """Shared phrasing cache (loaded on first use)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PhrasingCache()
+    return _cache
+
+
+def phrasing(text: str) -> Phrasing | None:
+    return get_cache().get(text)
+
+
+def phrase_all(texts: Iterable[str]) -> int:
+    """Parse and persist every uncached text. Returns the number parsed."""
+    cache = get_cache()
+    parsed = cache.fill(texts)
+    cache.save()
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Show OpenJTalk accent phrases, or pre-parse the corpus into the cache",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/accent_phrases.py まず問題が発生しました。
+  uv run python scripts/accent_phrases.py --all
+        """
+    )
+    parser.add_argument("text", nargs="?", help="Text to split into accent phrases")
+    parser.add_argument("--all", action="store_true",
+                        help="Parse the Pronunciation of every tier (readings removed)")
+
+    args = parser.parse_args()
+
+    if args.all:
+        from corpus import TIERS, load_rows, tier_csv_path
+        from pause_policy import strip_readings
+
+        texts = [strip_readings(row.Pronunciation)[0]
+                 for tier in TIERS if tier_csv_path(tier).exists()
+                 for row in load_rows(tier, ['Pronunciation'])]
+        started = time.perf_counter()
+        parsed = phrase_all(texts)
+        elapsed = time.perf_counter() - started
+        unaligned = sum(1 for text in texts if phrasing(text) is None)
+        unique = len(set(texts))
+        print(f"{unique} texts: {parsed} parsed, {unique - parsed} cached "
+              f"({unaligned} unaligned) in {elapsed:.2f}s")
+    elif args.text:
+        result = phrasing(args.text)
+        get_cache().save()
+        if result is None:
+            print("Error: could not align OpenJTalk's words with the text")
+            sys.exit(1)
+        print(result.describe(args.text))
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,98 +2,41 @@
 """Add TTSPronunciation column to vocabulary CSVs.
 
 Migration script that:
-1. Creates TTSPronunciation column from Pronunciation (keeps TTS commas)
-2. Removes TTS-specific commas from Sentence and Pronunciation fields
+1. Removes TTS-specific commas from Sentence and Pronunciation fields
+   (commas the pause policy would insert, see pause_policy.py)
+2. Creates TTSPronunciation column from the clean Pronunciation with the
+   pause policy
 
 This separates display text (clean) from TTS input (with pause commas).
 """
 
 import csv
-import re
 import sys
+from bisect import bisect_right
 from pathlib import Path
 
-ROOT = Path(__file__).parent.parent
-
-# Import comma-adding functions from existing scripts
-from fix_ga_commas import add_ga_commas, should_add_comma_after_ga
-from fix_adverb_commas import add_adverb_commas, ADVERBS
-
-
-def remove_ga_commas(text: str) -> str:
-    """Remove TTS-specific commas after が subject markers.
-
-    Reverses the effect of add_ga_commas() by removing commas that were
-    added after が when it functions as a subject marker particle.
-    """
-    result = []
-    i = 0
-
-    while i < len(text):
-        if text[i] == 'が' and i + 1 < len(text) and text[i + 1] == '、':
-            # Check if this が、 was likely added by our script
-            # by applying the same logic used to add it
-            before = text[:i]
-            # Check what would come after the comma
-            after = text[i + 2:] if i + 2 < len(text) else ''
-
-            # Reconstruct what the original text would have looked like
-            test_text = before + 'が' + after
-
-            # If add_ga_commas would have added a comma here, remove it
-            if should_add_comma_after_ga(test_text, i):
-                result.append('が')
-                i += 2  # Skip が and 、
-                continue
-
-        result.append(text[i])
-        i += 1
-
-    return ''.join(result)
-
-
-def adverb_to_furigana_pattern(adverb: str) -> str:
-    """Convert adverb to non-capturing regex pattern that matches with optional furigana.
-
-    Example: 実は → 実(?:【[^】]+】)?は
-    This allows matching both 実は and 実【じつ】は
-    """
-    parts = []
-    for char in adverb:
-        # Each character can optionally be followed by furigana annotation (non-capturing)
-        parts.append(re.escape(char) + r'(?:【[^】]+】)?')
-    return ''.join(parts)
+from accent_phrases import phrasing
+from pause_policy import apply_pauses, load_policy, strip_readings
 
+ROOT = Path(__file__).parent.parent
 
-def remove_adverb_commas(text: str) -> str:
-    """Remove TTS-specific commas after introductory adverbs.
 
-    Reverses the effect of add_adverb_commas() by removing commas that were
-    added after specific introductory adverbs.
+def remove_pause_commas(text: str) -> str:
+    """Remove the commas the pause policy would have inserted.
 
-    Handles both plain text (実は、) and furigana-annotated text (実【じつ】は、).
+    A comma is a TTS comma if, with it removed, the policy puts it back at
+    the same place. Works on plain text and furigana-annotated text.
     """
+    policy = load_policy()
     result = text
-
-    for adverb in ADVERBS:
-        # Create pattern that matches adverb with optional furigana
-        furigana_pattern = adverb_to_furigana_pattern(adverb)
-
-        # At start of sentence: adverb、X → adverbX
-        # Use a function to remove just the comma while preserving the matched adverb
-        def remove_comma_start(m):
-            return m.group(1) + m.group(2)
-
-        pattern = f'^({furigana_pattern})、([^。！？])'
-        result = re.sub(pattern, remove_comma_start, result)
-
-        # After period: 。adverb、X → 。adverbX
-        def remove_comma_after_period(m):
-            return '。' + m.group(1) + m.group(2)
-
-        pattern = f'。({furigana_pattern})、([^。！？])'
-        result = re.sub(pattern, remove_comma_after_period, result)
-
+    # Right to left, so earlier offsets stay valid
+    for offset in reversed([idx for idx, char in enumerate(text) if char == '、']):
+        without = result[:offset] + result[offset + 1:]
+        plain, ends = strip_readings(without)
+        # Plain position of the removed comma: characters (with readings) before it
+        pos = bisect_right(ends, offset)
+        if (pos, '、') in policy.pauses(plain, phrasing(plain)):
+            result = without
     return result
 
 
@@ -128,15 +71,12 @@ def process_csv(csv_path: Path, dry_run: bool = True) -> dict:
             original_sentence = row['Sentence']
             original_pronunciation = row['Pronunciation']
 
-            # TTSPronunciation keeps the TTS commas (copy from current Pronunciation)
-            # Also ensure all TTS comma patterns are applied
-            tts_pronunciation = original_pronunciation
-            tts_pronunciation = add_ga_commas(tts_pronunciation)
-            tts_pronunciation = add_adverb_commas(tts_pronunciation)
-
             # Clean versions for display (remove TTS-specific commas)
-            clean_sentence = remove_adverb_commas(remove_ga_commas(original_sentence))
-            clean_pronunciation = remove_adverb_commas(remove_ga_commas(original_pronunciation))
+            clean_sentence = remove_pause_commas(original_sentence)
+            clean_pronunciation = remove_pause_commas(original_pronunciation)
+
+            # TTSPronunciation: the pause policy applied to the clean Pronunciation
+            tts_pronunciation = apply_pauses(clean_pronunciation)
 
             if clean_sentence != original_sentence:
                 stats['sentence_changes'] += 1
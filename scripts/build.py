@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+"""Incremental build: CSV fixes → conjugations → audio → validation → deck.
+
+Runs the README workflow as a graph of per-tier stages:
+
+    normalize ─┬→ furigana → pauses ─┬──────────→ audio ─┐
+               └→ conjugations ──────┴→ write CSV ───────┴→ validate → deck
+
+normalize puts Sentence, Cloze and Pronunciation in canonical form
+(normalize.py); furigana fills empty Pronunciation fields of new rows
+(generate_furigana.py); pauses regenerates TTSPronunciation from
+Pronunciation with the pause policy (see pause_policy.py); editing
+data/pause_policy.csv re-runs it.
+
+Each stage records a fingerprint per row (or per file) of what it last
+processed in .cache/build-state.json, and on the next run only touches
+rows whose input changed. Editing one sentence re-renders one audio clip
+and rewrites the package once; a run with nothing changed does nothing.
+A clip the build has no record of (rendered by generate_audio.py, or
+before the first build) may be out of date and is rendered again, unless
+--trust-existing adopts it as is.
+
+Independent stages run in parallel (e.g. validating tier 1 while tier 2
+audio renders). Kokoro and the morphological tagger are not thread-safe,
+so each is used by one stage at a time. Audio goes through the TTS daemon
+when it is running (see tts.py).
+
+With --watch, the build stays running: it polls the tier CSVs, reports
+which rows were added, modified or removed since the last snapshot, and
+rebuilds only what those rows affect. The TTS model stays loaded
+between edits, so a changed sentence is re-rendered in seconds.
+
+Usage:
+    uv run python scripts/build.py                # Build everything that is stale
+    uv run python scripts/build.py --female       # Female voice audio and deck
+    uv run python scripts/build.py --no-audio     # CSV stages, validation, deck without audio
+    uv run python scripts/build.py --force        # Ignore fingerprints, rebuild all
+    uv run python scripts/build.py --trust-existing  # Keep clips rendered outside the build
+    uv run python scripts/build.py --watch        # Rebuild on every CSV save
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from accent_phrases import phrase_all
+from corpus import CACHE_DIR, TIERS, source_versions, tier_csv_path
+from normalize import NORMALIZED_FIELDS, normalize
+from pause_policy import apply_pauses, policy_version, strip_readings
+from pronunciation import preprocess_for_tts
+from tts import VOICE_FEMALE, VOICE_MALE, get_synthesizer, write_mp3
+
+ROOT = Path(__file__).parent.parent
+
+STATE_PATH = CACHE_DIR / "build-state.json"
+
+# Bump to invalidate all recorded fingerprints
+STATE_VERSION = 1
+
+# Seconds between checks of the tier CSVs in --watch mode
+WATCH_INTERVAL = 1.0
+
+
+class BuildError(Exception):
+    """A stage failed; dependent stages must not run."""
+
+
+def fingerprint(*values: str) -> str:
+    """Hash of the given values."""
+    return hashlib.sha1('\x1f'.join(values).encode('utf-8')).hexdigest()
+
+
+def file_fingerprint(path: Path) -> str:
+    """Cheap fingerprint of a file (size and mtime), '' if missing."""
+    if not path.exists():
+        return ''
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class BuildState:
+    """Fingerprints recorded by each stage, persisted between runs."""
+
+    def __init__(self, path: Path = STATE_PATH, force: bool = False):
+        self.path = path
+        self.stages = {}
+        self.lock = threading.Lock()
+
+        if not force and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                data = {}
+            if data.get('version') == STATE_VERSION:
+                self.stages = data.get('stages', {})
+
+    def get(self, stage: str, tier: int):
+        return self.stages.get(stage, {}).get(str(tier))
+
+    def set(self, stage: str, tier: int, value):
+        with self.lock:
+            self.stages.setdefault(stage, {})[str(tier)] = value
+
+    def save(self):
+        self.path.parent.mkdir(exist_ok=True)
+        with self.lock:
+            self.path.write_text(json.dumps({
+                'version': STATE_VERSION,
+                'stages': self.stages,
+            }, ensure_ascii=False), encoding='utf-8')
+
+
+class TierData:
+    """A tier CSV held in memory while the text stages edit it."""
+
+    def __init__(self, tier: int):
+        self.tier = tier
+        self.path = tier_csv_path(tier)
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            self.fieldnames = reader.fieldnames
+            self.rows = list(reader)
+
+        self.dirty = False
+
+    def write(self):
+        with open(self.path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
+            writer.writeheader()
+            writer.writerows(self.rows)
+        self.dirty = False
+
+
+def diff_rows(old: list[dict], new: list[dict]) -> tuple[list[int], list[int], list[int]]:
+    """Row numbers (from 1) that were added, modified and removed."""
+    modified = [num for num, (a, b) in enumerate(zip(old, new), 1) if a != b]
+    added = list(range(len(old) + 1, len(new) + 1))
+    removed = list(range(len(new) + 1, len(old) + 1))
+    return added, modified, removed
+
+
+class Task:
+    """A node of the build graph."""
+
+    def __init__(self, name: str, deps: list[str], run):
+        self.name = name
+        self.deps = deps
+        self.run = run
+
+
+def run_graph(tasks: dict[str, Task], jobs: int):
+    """Run tasks as soon as their dependencies are done.
+
+    Raises the first task failure after letting running tasks finish; tasks
+    that depend on a failed task are never started.
+    """
+    pending = dict(tasks)
+    done = set()
+    running = {}
+    failure = None
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while running or (pending and failure is None):
+            if failure is None:
+                for name, task in list(pending.items()):
+                    if all(dep in done for dep in task.deps):
+                        running[pool.submit(task.run)] = name
+                        del pending[name]
+
+            if not running:
+                raise BuildError(f"Unresolvable dependencies: {', '.join(sorted(pending))}")
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    future.result()
+                    done.add(name)
+                except Exception as e:
+                    failure = failure or e
+
+    if failure is not None:
+        raise failure
+
+
+class Build:
+    """The stages of one build run and the state they share."""
+
+    def __init__(self, female: bool = False, audio: bool = True, force: bool = False,
+                 output: str | None = None, trust_existing: bool = False):
+        self.female = female
+        self.audio = audio
+        self.force = force
+        self.trust_existing = trust_existing
+        self.voice = VOICE_FEMALE if female else VOICE_MALE
+        self.output = Path(output or f"nihongo-it-vocab-complete{'-female' if female else ''}.apkg")
+        self.state = BuildState(force=force)
+        self.tiers = {tier: TierData(tier) for tier in TIERS if tier_csv_path(tier).exists()}
+
+        self.print_lock = threading.Lock()
+        self.tagger_lock = threading.Lock()
+        self.synth_lock = threading.Lock()
+        self.synth = None
+        self.validation_lock = threading.Lock()
+        self.validation_cache = None
+
+    def log(self, message: str):
+        with self.print_lock:
+            print(message, flush=True)
+
+    def audio_dir(self, tier: int) -> Path:
+        return ROOT / (f"tier{tier}-audio-female" if self.female else f"tier{tier}-audio")
+
+    def tasks(self) -> dict[str, Task]:
+        tasks = {}
+
+        def add(name, deps, run):
+            tasks[name] = Task(name, deps, run)
+
+        for tier in self.tiers:
+            add(f"normalize:{tier}", [],
+                lambda tier=tier: self.normalize_stage(tier))
+            add(f"furigana:{tier}", [f"normalize:{tier}"],
+                lambda tier=tier: self.furigana_stage(tier))
+            add(f"pauses:{tier}", [f"furigana:{tier}"],
+                lambda tier=tier: self.pause_stage(tier))
+            add(f"conjugations:{tier}", [f"normalize:{tier}"],
+                lambda tier=tier: self.conjugation_stage(tier))
+            add(f"write:{tier}", [f"pauses:{tier}", f"conjugations:{tier}"],
+                lambda tier=tier: self.write_stage(tier))
+
+            validate_deps = [f"write:{tier}"]
+            if self.audio:
+                add(f"audio:{tier}", [f"pauses:{tier}"],
+                    lambda tier=tier: self.audio_stage(tier))
+                validate_deps.append(f"audio:{tier}")
+            add(f"validate:{tier}", validate_deps,
+                lambda tier=tier: self.validate_stage(tier))
+
+        add("deck", [f"validate:{tier}" for tier in self.tiers], self.deck_stage)
+        return tasks
+
+    # Stages
+
+    def text_stage(self, stage: str, tier: int, source: str, target: str, transform, version: str = ''):
+        """Apply a text transform to the rows whose source field changed.
+
+        The recorded fingerprint is of the source field after the stage ran
+        (and of the transform's version), so a row stays up to date until
+        someone edits it or the transform changes.
+
+        When the target is another field, its value and the last value this
+        stage generated are recorded too. A target that differs from both the
+        new and the last generated value was edited by hand: it is kept (and
+        logged) instead of overwritten. Clear the field to regenerate it.
+        Without a record (first build), the current target counts as the last
+        generated value, so only edits made after that build are kept.
+        """
+        data = self.tiers[tier]
+        if source not in data.fieldnames:
+            raise BuildError(f"Tier {tier}: {source} column not found (run add_tts_column.py first)")
+        if target not in data.fieldnames:
+            data.fieldnames.append(target)
+
+        seen = self.state.get(stage, tier) or {}
+        fingerprints = {}
+        processed = changed = 0
+        kept = []
+
+        def source_fingerprint(value):
+            return fingerprint(version, value) if version else fingerprint(value)
+
+        for num, row in enumerate(data.rows, 1):
+            key = str(num)
+            expected = source_fingerprint(row[source])
+
+            if source == target:
+                if seen.get(key) != expected:
+                    processed += 1
+                    value = transform(row[source])
+                    if value != row[target]:
+                        row[target] = value
+                        data.dirty = True
+                        changed += 1
+                fingerprints[key] = source_fingerprint(row[target])
+                continue
+
+            # [source, current target, last generated target] fingerprints
+            current = row.get(target, '')
+            record = seen.get(key)
+            if not isinstance(record, list):
+                # Recorded before targets were tracked: treated like a first build
+                record = None
+            if record and record[:2] == [expected, fingerprint(current)]:
+                fingerprints[key] = record
+                continue
+
+            processed += 1
+            generated = record[2] if record else fingerprint(current)
+            value = transform(row[source])
+            if current and current != value and fingerprint(current) != generated:
+                kept.append(num)
+                fingerprints[key] = [expected, fingerprint(current), generated]
+                continue
+            if value != current:
+                row[target] = value
+                data.dirty = True
+                changed += 1
+            fingerprints[key] = [expected, fingerprint(value), fingerprint(value)]
+
+        self.state.set(stage, tier, fingerprints)
+        if changed:
+            self.log(f"[{stage}] tier {tier}: {changed} of {processed} checked rows changed")
+        if kept:
+            self.log(f"[{stage}] tier {tier}: kept hand-edited {target} in rows "
+                     f"{', '.join(map(str, kept))} (clear the field to regenerate)")
+
+    def normalize_stage(self, tier: int):
+        for field in NORMALIZED_FIELDS:
+            if field in self.tiers[tier].fieldnames:
+                self.text_stage(f"normalize_{field.lower()}", tier, field, field, normalize)
+
+    def furigana_stage(self, tier: int):
+        """Generate Pronunciation for rows that have none (only empty fields)."""
+        from generate_furigana import fill_pronunciations
+
+        data = self.tiers[tier]
+        if 'Pronunciation' not in data.fieldnames:
+            return
+        with self.tagger_lock:
+            filled = fill_pronunciations(data.rows)
+        if filled:
+            data.dirty = True
+            self.log(f"[furigana] tier {tier}: {len(filled)} rows annotated")
+            for num, review in filled.items():
+                if review:
+                    self.log(f"[furigana] tier {tier} row {num}: review {', '.join(review)}")
+
+    def pause_stage(self, tier: int):
+        # Parse new sentences through OpenJTalk in one batch (cached by text)
+        phrase_all(strip_readings(row.get('Pronunciation', ''))[0] for row in self.tiers[tier].rows)
+
+        def transform(pronunciation):
+            with self.tagger_lock:
+                return apply_pauses(pronunciation)
+
+        self.text_stage('pauses', tier, 'Pronunciation', 'TTSPronunciation', transform, policy_version())
+
+    def conjugation_stage(self, tier: int):
+        from generate_conjugations import get_conjugation_key
+
+        def transform(cloze):
+            if not cloze:
+                return ''
+            with self.tagger_lock:
+                return get_conjugation_key(cloze)
+
+        self.text_stage('conjugations', tier, 'Cloze', 'Conjugations', transform)
+
+    def write_stage(self, tier: int):
+        data = self.tiers[tier]
+        if data.dirty:
+            data.write()
+            self.log(f"[write] {data.path.name}")
+
+    def audio_stage(self, tier: int):
+        """Render clips whose TTS input (or voice) changed, or that are missing.
+
+        A clip without a record was not rendered by the build, so its TTS
+        input is unknown: it is rendered again unless trust_existing is set.
+        """
+        audio_dir = self.audio_dir(tier)
+        seen = self.state.get(f"audio:{self.voice}", tier) or {}
+        fingerprints = {}
+        stale = []
+        untrusted = 0
+
+        for num, row in enumerate(self.tiers[tier].rows, 1):
+            key = str(num)
+            tts_input = preprocess_for_tts(row['TTSPronunciation'])
+            expected = fingerprint(self.voice, tts_input)
+            output_path = audio_dir / f"tier{tier}_{num:03d}.mp3"
+
+            recorded = None if self.force else seen.get(key)
+            if recorded is None and not self.force and output_path.exists():
+                if self.trust_existing:
+                    recorded = expected
+                else:
+                    untrusted += 1
+            if recorded == expected and output_path.exists():
+                fingerprints[key] = expected
+            else:
+                stale.append((key, tts_input, expected, output_path))
+
+        if untrusted:
+            self.log(f"[audio] tier {tier}: {untrusted} existing clips have no build record "
+                     f"and are rendered again (--trust-existing keeps them)")
+
+        failed = 0
+        if stale:
+            audio_dir.mkdir(exist_ok=True)
+            synth = self.get_synthesizer()
+
+            for key, tts_input, expected, output_path in stale:
+                self.log(f"[audio] {output_path.name}: {tts_input[:50]}")
+                try:
+                    write_mp3(synth.stream(tts_input, self.voice), output_path)
+                except Exception as e:
+                    self.log(f"    Error: {e}")
+                    failed += 1
+                    continue
+                fingerprints[key] = expected
+
+        self.state.set(f"audio:{self.voice}", tier, fingerprints)
+        if failed:
+            raise BuildError(f"Tier {tier}: {failed} clips failed to render")
+
+    def get_synthesizer(self):
+        """TTS daemon client or local Kokoro pipelines, created on first use."""
+        with self.synth_lock:
+            if self.synth is None:
+                self.synth = get_synthesizer()
+        return self.synth
+
+    def warm_up(self):
+        """Load the voice and run one short synthesis so the first edit renders fast."""
+        self.log("Warming up TTS...")
+        self.get_synthesizer().warm_up(self.voice)
+
+    def get_validation_cache(self):
+        """Verdict cache shared by the validate stages, created on first use."""
+        from validate import ValidationCache
+
+        with self.validation_lock:
+            if self.validation_cache is None:
+                self.validation_cache = ValidationCache()
+        return self.validation_cache
+
+    def validate_stage(self, tier: int):
+        from validate import print_result, validate_tier
+
+        audio_files = sorted(self.audio_dir(tier).glob('*.mp3')) if self.audio else []
+        expected = fingerprint(
+            file_fingerprint(tier_csv_path(tier)), str(self.audio),
+            *(f"{path.name}={file_fingerprint(path)}" for path in audio_files))
+
+        if self.state.get(f"validate:{self.voice}", tier) == expected:
+            return
+
+        result = validate_tier(tier, check_audio=self.audio, female=self.female,
+                               deep_audio=self.audio, cache=self.get_validation_cache())
+        if result.has_errors:
+            with self.print_lock:
+                print_result(result, verbose=True)
+            raise BuildError(f"Tier {tier}: validation failed ({len(result.errors)} errors)")
+
+        self.state.set(f"validate:{self.voice}", tier, expected)
+        self.log(f"[validate] tier {tier}: passed ({len(result.warnings)} warnings)")
+
+    def deck_stage(self):
+        import genanki
+        from create_deck import create_combined_deck
+
+        # The card template lives in create_deck.py, so it is an input too
+        inputs = [file_fingerprint(tier_csv_path(tier)) for tier in self.tiers]
+        inputs.append(hashlib.sha1((ROOT / "scripts" / "create_deck.py").read_bytes()).hexdigest())
+        inputs.append(str(self.audio))
+        if self.audio:
+            for tier in self.tiers:
+                for path in sorted(self.audio_dir(tier).glob('*.mp3')):
+                    inputs.append(f"{path.name}={file_fingerprint(path)}")
+        expected = fingerprint(*inputs)
+
+        key = str(self.output.resolve())
+        if self.state.get('deck', key) == expected and self.output.exists():
+            return
+
+        decks, media_files, counts = create_combined_deck(self.audio, self.female)
+        package = genanki.Package(decks)
+        package.media_files = media_files
+        package.write_to_file(str(self.output))
+
+        self.state.set('deck', key, expected)
+        self.log(f"[deck] {self.output} ({sum(counts.values())} notes, {len(media_files)} audio files)")
+
+    def run(self, jobs: int):
+        try:
+            run_graph(self.tasks(), jobs)
+        finally:
+            # Keep the progress of stages that finished, even on failure
+            self.state.save()
+            if self.validation_cache is not None:
+                self.validation_cache.save()
+
+    def reload(self) -> bool:
+        """Re-read tier CSVs that changed on disk, printing the row diff.
+
+        Returns True if any tier changed.
+        """
+        changed = False
+        for tier in TIERS:
+            if not tier_csv_path(tier).exists():
+                continue
+            old = self.tiers.get(tier)
+            new = TierData(tier)
+            added, modified, removed = diff_rows(old.rows if old else [], new.rows)
+            if old is not None and new.fieldnames == old.fieldnames and not (added or modified or removed):
+                continue
+
+            self.tiers[tier] = new
+            changed = True
+            parts = [f"{len(rows)} {label} ({', '.join(map(str, rows[:5]))}{', ...' if len(rows) > 5 else ''})"
+                     for label, rows in (('added', added), ('modified', modified), ('removed', removed)) if rows]
+            self.log(f"Tier {tier}: {'; '.join(parts) or 'columns changed'}")
+        return changed
+
+    def watch(self, jobs: int, interval: float = WATCH_INTERVAL):
+        """Rebuild whenever a tier CSV changes, until interrupted."""
+        if self.audio:
+            self.warm_up()
+
+        while True:
+            try:
+                self.run(jobs)
+                self.log("Build complete.")
+            except BuildError as e:
+                self.log(f"Build failed: {e}")
+            self.force = False
+
+            # Snapshot after the build so its own CSV writes do not retrigger it
+            versions = source_versions()
+            self.log("Watching tier CSVs for changes (Ctrl+C to stop)...")
+            while True:
+                time.sleep(interval)
+                if source_versions() != versions:
+                    versions = source_versions()
+                    if self.reload():
+                        break
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild CSV fixes, audio, validation and the deck incrementally",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/build.py
+  uv run python scripts/build.py --female
+  uv run python scripts/build.py --no-audio --output /tmp/deck.apkg
+  uv run python scripts/build.py --force --jobs 8
+  uv run python scripts/build.py --trust-existing   # Adopt clips rendered by generate_audio.py
+  uv run python scripts/build.py --watch --no-audio
+        """
+    )
+    parser.add_argument("--female", action="store_true",
+                        help="Use female voice (jf_alpha) audio from tier*-audio-female/")
+    parser.add_argument("--no-audio", action="store_true",
+                        help="Skip audio rendering and build the deck without audio")
+    parser.add_argument("--force", action="store_true",
+                        help="Ignore recorded fingerprints and rebuild everything")
+    parser.add_argument("--trust-existing", action="store_true",
+                        help="Treat existing clips the build has no record of as up to date")
+    parser.add_argument("--jobs", "-j", type=int, default=4,
+                        help="Stages to run in parallel (default: 4)")
+    parser.add_argument("--output", type=str,
+                        help="Deck filename (default: nihongo-it-vocab-complete[-female].apkg)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and rebuild when a tier CSV changes")
+
+    args = parser.parse_args()
+
+    build = Build(female=args.female, audio=not args.no_audio, force=args.force, output=args.output,
+                  trust_existing=args.trust_existing)
+
+    if args.watch:
+        try:
+            build.watch(args.jobs)
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+        return
+
+    try:
+        build.run(args.jobs)
+    except BuildError as e:
+        print(f"\nBuild failed: {e}")
+        sys.exit(1)
+
+    print("\nBuild complete.")
+
+
+if __name__ == "__main__":
+    main()
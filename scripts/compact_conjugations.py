@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Convert Conjugations HTML to compact conjugation keys.
+
+Migration script that replaces the full <details class="conjugation-section">
+HTML stored in each row with the 'type:base' key written by
+generate_conjugations.py:
+
+    <details ...>Conjugations for 完了 (する動詞)...</details> → suru_verb:完了する
+
+A row is only converted if re-rendering the key reproduces the stored HTML
+exactly, so hand-edited tables are left untouched and reported.
+"""
+
+import csv
+import re
+import sys
+from pathlib import Path
+
+from generate_conjugations import render_conjugation_key
+
+ROOT = Path(__file__).parent.parent
+
+# Type label shown in the table summary → word type used in keys
+TYPE_LABELS = {
+    'する動詞': 'suru_verb',
+    '五段動詞': 'godan_verb',
+    '一段動詞': 'ichidan_verb',
+    'カ変動詞': 'kuru_verb',
+    'い形容詞': 'i_adj',
+}
+
+SUMMARY_PATTERN = re.compile(r'<summary>Conjugations for .*? \(([^)]*)\)</summary>')
+DICTIONARY_FORM_PATTERN = re.compile(r'<td>Dictionary 辞書形</td><td>([^<]*)</td>')
+
+
+def html_to_key(html: str) -> str | None:
+    """Recover the conjugation key from a rendered table, or None if unrecognized."""
+    summary = SUMMARY_PATTERN.search(html)
+    dictionary_form = DICTIONARY_FORM_PATTERN.search(html)
+    if not summary or not dictionary_form:
+        return None
+
+    word_type = TYPE_LABELS.get(summary.group(1))
+    if not word_type:
+        return None
+
+    return f"{word_type}:{dictionary_form.group(1)}"
+
+
+def process_csv(csv_path: Path, dry_run: bool = True) -> dict:
+    """Process a CSV file and compact its Conjugations column.
+
+    Returns dict with statistics about changes made.
+    """
+    stats = {
+        'total_rows': 0,
+        'converted': 0,
+        'skipped': [],
+        'bytes_before': 0,
+        'bytes_after': 0,
+    }
+    rows = []
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+
+        if 'Conjugations' not in fieldnames:
+            print(f"  Conjugations column not found in {csv_path.name}")
+            return stats
+
+        for row in reader:
+            stats['total_rows'] += 1
+            html = row['Conjugations']
+            stats['bytes_before'] += len(html.encode('utf-8'))
+
+            # Rows that are already compact (or empty) pass through unchanged
+            if html.startswith('<'):
+                key = html_to_key(html)
+                if key and render_conjugation_key(row['Cloze'], key) == html:
+                    row['Conjugations'] = key
+                    stats['converted'] += 1
+                else:
+                    stats['skipped'].append(row['Cloze'])
+
+            stats['bytes_after'] += len(row['Conjugations'].encode('utf-8'))
+            rows.append(row)
+
+    if not dry_run and stats['converted']:
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    return stats
+
+
+def main():
+    dry_run = '--apply' not in sys.argv
+
+    if dry_run:
+        print("DRY RUN - use --apply to make changes\n")
+
+    total_before = 0
+    total_after = 0
+
+    for tier in range(1, 7):
+        csv_path = ROOT / f"tier{tier}-vocabulary.csv"
+        if csv_path.exists():
+            print(f"Processing {csv_path.name}...")
+            stats = process_csv(csv_path, dry_run=dry_run)
+
+            print(f"  Rows: {stats['total_rows']}")
+            print(f"  Converted: {stats['converted']}")
+            print(f"  Conjugations size: {stats['bytes_before']:,} → {stats['bytes_after']:,} bytes")
+            for cloze in stats['skipped']:
+                print(f"  Skipped (does not match generated table): {cloze}")
+
+            total_before += stats['bytes_before']
+            total_after += stats['bytes_after']
+
+    print(f"\n{'Would shrink' if dry_run else 'Shrank'} Conjugations from {total_before:,} to {total_after:,} bytes")
+
+    if dry_run:
+        print("\nRun with --apply to make changes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+"""Corpus access for the tier vocabulary CSVs.
+
+The tier CSVs stay the source of truth (they are what gets edited and
+committed). Two ways to read them, both loading only the columns a tool
+needs:
+
+    # Lazy CSV loader: lightweight rows, cached in-process by file mtime
+    for row in iter_rows(1, ['Pronunciation']):
+        row.Pronunciation
+
+    # Indexed SQLite mirror: tier/category/row filters
+    store = CorpusStore()
+    for row in store.select(['TTSPronunciation'], tiers=[1]):
+        ...
+
+    # Category index: Note → [(tier, row), ...]
+    load_category_index()['Git - Commit']
+    category_rows(['Git - *'])
+
+The store re-imports a tier automatically when its CSV changes (by mtime and
+size) or is deleted, and records per-row changes with a revision number so tools can ask
+what changed since their last run.
+
+Usage:
+    uv run python scripts/corpus.py sync             # Import changed CSVs
+    uv run python scripts/corpus.py status           # Show tiers and revision
+    uv run python scripts/corpus.py changes --since 3
+    uv run python scripts/corpus.py export --tier 1  # Write store back to CSV
+"""
+
+import argparse
+import csv
+import fnmatch
+import hashlib
+import io
+import itertools
+import json
+import sqlite3
+import subprocess
+import sys
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Local build artifacts (databases, indexes, caches) - not committed
+CACHE_DIR = ROOT / ".cache"
+DB_PATH = CACHE_DIR / "corpus.db"
+CATEGORY_INDEX_PATH = CACHE_DIR / "category_index.json"
+
+TIERS = range(1, 7)
+
+# CSV column order
+COLUMNS = [
+    'Sentence',
+    'Translation',
+    'Cloze',
+    'Pronunciation',
+    'TTSPronunciation',
+    'Note',
+    'KeyMeaning',
+    'Conjugations',
+]
+
+SCHEMA = f'''
+CREATE TABLE IF NOT EXISTS rows (
+    tier INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    {', '.join(f'"{c}" TEXT NOT NULL DEFAULT ""' for c in COLUMNS)},
+    hash TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    PRIMARY KEY (tier, row)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rows_note ON rows ("Note");
+CREATE INDEX IF NOT EXISTS rows_cloze ON rows ("Cloze");
+CREATE TABLE IF NOT EXISTS sources (
+    tier INTEGER PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    revision INTEGER NOT NULL,
+    tier INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    kind TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS changes_revision ON changes (revision);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+'''
+
+
+def tier_csv_path(tier: int) -> Path:
+    """Path of a tier's vocabulary CSV."""
+    return ROOT / f"tier{tier}-vocabulary.csv"
+
+
+def row_hash(row) -> str:
+    """Content hash of a row over all CSV columns."""
+    h = hashlib.sha1()
+    for column in COLUMNS:
+        h.update(row.get(column, '').encode('utf-8'))
+        h.update(b'\x1f')
+    return h.hexdigest()
+
+
+def read_tier_at(tier: int, ref: str) -> list[dict] | None:
+    """Rows of a tier CSV as of a git ref (None if the file did not exist).
+
+    Raises ValueError if the ref is unknown.
+    """
+    if subprocess.run(['git', 'rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}'],
+                      cwd=ROOT, capture_output=True).returncode != 0:
+        raise ValueError(f"Unknown git ref: {ref}")
+
+    shown = subprocess.run(['git', 'show', f'{ref}:{tier_csv_path(tier).name}'],
+                           cwd=ROOT, capture_output=True)
+    if shown.returncode != 0:
+        return None
+    return list(csv.DictReader(io.StringIO(shown.stdout.decode('utf-8'), newline='')))
+
+
+def changed_rows(tier: int, ref: str, positional: bool = False,
+                 columns: Iterable[str] | None = None) -> set[int]:
+    """Numbers (from 1) of rows added or modified since a git ref.
+
+    Rows are matched by Sentence, so inserting or deleting a row does not
+    mark the rows after it as changed. With positional=True, a row that
+    moved to another number counts as changed too (for outputs named by
+    row number, like audio files). With columns, rows are matched and
+    compared on those columns only, so edits elsewhere in the row (e.g.
+    Translation, for audio rendered from TTSPronunciation) are ignored.
+    """
+    old_rows = read_tier_at(tier, ref)
+    csv_path = tier_csv_path(tier)
+    if not csv_path.exists():
+        return set()
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    if old_rows is None:
+        return set(range(1, len(rows) + 1))
+
+    columns = list(columns) if columns is not None else None
+
+    def key(row):
+        if columns is None:
+            return row.get('Sentence', '')
+        return tuple(row.get(column, '') for column in columns)
+
+    def content(row):
+        return row if columns is None else key(row)
+
+    # Match key → old (number, row), in order, so duplicates pair up in order
+    previous = {}
+    for num, row in enumerate(old_rows, 1):
+        previous.setdefault(key(row), []).append((num, row))
+
+    changed = set()
+    for num, row in enumerate(rows, 1):
+        candidates = previous.get(key(row))
+        if not candidates:
+            changed.add(num)
+            continue
+        old_num, old_row = candidates.pop(0)
+        if content(old_row) != content(row) or (positional and old_num != num):
+            changed.add(num)
+
+    return changed
+
+
+class CorpusRow:
+    """Base for the slotted row classes built by row_class().
+
+    Columns are attributes (row.Sentence); row['Sentence'] and row.get()
+    also work so rows can stand in for csv.DictReader dicts.
+    """
+
+    __slots__ = ('tier', 'row')
+
+    def __getitem__(self, column: str) -> str:
+        return getattr(self, column)
+
+    def get(self, column: str, default: str = '') -> str:
+        return getattr(self, column, default)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{c}={getattr(self, c)!r}" for c in self.__slots__)
+        return f"{type(self).__name__}(tier={self.tier}, row={self.row}, {values})"
+
+
+@lru_cache(maxsize=None)
+def row_class(columns: tuple[str, ...]) -> type[CorpusRow]:
+    """Slotted row class holding only the given columns."""
+    return type('Row', (CorpusRow,), {'__slots__': columns})
+
+
+def read_header(tier: int) -> list[str]:
+    """Column names of a tier CSV (empty if the file is missing or empty)."""
+    csv_path = tier_csv_path(tier)
+    if not csv_path.exists():
+        return []
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        return next(csv.reader(f), [])
+
+
+# (tier, columns) → ((mtime_ns, size), rows) for fully read tiers
+_tier_cache: dict[tuple[int, tuple[str, ...]], tuple[tuple[int, int], list[CorpusRow]]] = {}
+
+
+def iter_rows(tier: int, columns: Iterable[str] = COLUMNS) -> Iterator[CorpusRow]:
+    """Lazily yield rows of a tier CSV holding only the requested columns.
+
+    Rows are numbered from 1 (matches audio file numbers). Columns missing
+    from the CSV read as ''. Once a tier has been read to the end, later
+    calls with the same columns are served from memory until the file's
+    mtime or size changes.
+    """
+    columns = tuple(columns)
+    csv_path = tier_csv_path(tier)
+    stat = csv_path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _tier_cache.get((tier, columns))
+    if cached and cached[0] == version:
+        yield from cached[1]
+        return
+
+    cls = row_class(columns)
+    rows = []
+
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        positions = {name: idx for idx, name in enumerate(header)}
+        indices = [positions.get(c) for c in columns]
+
+        for num, fields in enumerate(reader, 1):
+            row = cls()
+            row.tier = tier
+            row.row = num
+            for column, idx in zip(columns, indices):
+                setattr(row, column, fields[idx] if idx is not None and idx < len(fields) else '')
+            rows.append(row)
+            yield row
+
+    _tier_cache[(tier, columns)] = (version, rows)
+
+
+def load_rows(tier: int, columns: Iterable[str] = COLUMNS) -> list[CorpusRow]:
+    """Read all rows of a tier (cached, see iter_rows)."""
+    return list(iter_rows(tier, columns))
+
+
+def source_versions(tiers: Iterable[int] = TIERS) -> dict[str, list[int]]:
+    """(mtime_ns, size) of each existing tier CSV, keyed by tier."""
+    versions = {}
+    for tier in tiers:
+        csv_path = tier_csv_path(tier)
+        if csv_path.exists():
+            stat = csv_path.stat()
+            versions[str(tier)] = [stat.st_mtime_ns, stat.st_size]
+    return versions
+
+
+def build_category_index(tiers: Iterable[int] = TIERS) -> dict[str, list[tuple[int, int]]]:
+    """Map each Note category to its (tier, row) pairs."""
+    index = {}
+    for tier in tiers:
+        if not tier_csv_path(tier).exists():
+            continue
+        for row in iter_rows(tier, ['Note']):
+            index.setdefault(row.Note, []).append((tier, row.row))
+    return index
+
+
+def save_category_index(index: dict[str, list[tuple[int, int]]], path: Path = CATEGORY_INDEX_PATH):
+    """Persist a category index, stamped with the current tier CSV versions."""
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps({
+        'sources': source_versions(),
+        'categories': {category: [list(pair) for pair in pairs]
+                       for category, pairs in sorted(index.items())},
+    }, ensure_ascii=False), encoding='utf-8')
+
+
+def load_category_index(path: Path = CATEGORY_INDEX_PATH) -> dict[str, list[tuple[int, int]]]:
+    """Category index from disk, rebuilt and saved if any tier CSV changed."""
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        data = {}
+
+    if data.get('sources') == source_versions():
+        return {category: [tuple(pair) for pair in pairs]
+                for category, pairs in data['categories'].items()}
+
+    index = build_category_index()
+    save_category_index(index, path)
+    return index
+
+
+def category_rows(patterns: Iterable[str], tiers: Iterable[int] | None = None) -> list[tuple[int, int]]:
+    """(tier, row) pairs whose category matches any glob pattern, in order.
+
+    Matching ignores case, so 'AWS - *' finds 'Aws - Lambda' too.
+    """
+    patterns = [pattern.lower() for pattern in patterns]
+    tiers = set(tiers) if tiers is not None else None
+
+    selected = set()
+    for category, pairs in load_category_index().items():
+        if any(fnmatch.fnmatchcase(category.lower(), pattern) for pattern in patterns):
+            selected.update(pair for pair in pairs if tiers is None or pair[0] in tiers)
+    return sorted(selected)
+
+
+class CorpusStore:
+    """SQLite mirror of the tier CSVs with projection, filters and change tracking."""
+
+    def __init__(self, db_path: Path = DB_PATH, auto_sync: bool = True):
+        db_path.parent.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        # Temp tables of row selections: numbering, and those left to drop
+        self.selections = itertools.count()
+        self.finished_selections = []
+        if auto_sync:
+            self.sync()
+
+    @property
+    def revision(self) -> int:
+        """Current store revision (bumped on every sync that changes rows)."""
+        cur = self.conn.execute("SELECT value FROM meta WHERE key = 'revision'")
+        found = cur.fetchone()
+        return found[0] if found else 0
+
+    def is_stale(self, tier: int) -> bool:
+        """True if the tier's CSV changed or was deleted since it was last imported."""
+        csv_path = tier_csv_path(tier)
+        cur = self.conn.execute("SELECT mtime_ns, size FROM sources WHERE tier = ?", (tier,))
+        found = cur.fetchone()
+        if not csv_path.exists():
+            return found is not None
+        stat = csv_path.stat()
+        return found is None or (found['mtime_ns'], found['size']) != (stat.st_mtime_ns, stat.st_size)
+
+    def sync(self, tiers: Iterable[int] = TIERS) -> int:
+        """Import tiers whose CSV changed. Returns the number of changed rows."""
+        stale = [tier for tier in tiers if self.is_stale(tier)]
+        if not stale:
+            return 0
+
+        revision = self.revision + 1
+        changed = 0
+
+        with self.conn:
+            for tier in stale:
+                changed += self._import_tier(tier, revision)
+
+            if changed:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('revision', ?)", (revision,))
+
+        return changed
+
+    def _import_tier(self, tier: int, revision: int) -> int:
+        """Import one tier CSV, recording added/modified/removed rows.
+
+        A deleted CSV removes all of the tier's rows.
+        """
+        csv_path = tier_csv_path(tier)
+        stat = csv_path.stat() if csv_path.exists() else None
+
+        existing = dict(self.conn.execute(
+            "SELECT row, hash FROM rows WHERE tier = ?", (tier,)).fetchall())
+
+        rows = load_rows(tier, COLUMNS) if stat else []
+
+        changes = []
+        placeholders = ', '.join('?' for _ in range(len(COLUMNS) + 4))
+        column_list = ', '.join(f'"{c}"' for c in COLUMNS)
+
+        for num, row in enumerate(rows, 1):
+            digest = row_hash(row)
+            old = existing.pop(num, None)
+            if old == digest:
+                continue
+            changes.append((revision, tier, num, 'added' if old is None else 'modified'))
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO rows (tier, row, {column_list}, hash, revision) "
+                f"VALUES ({placeholders})",
+                (tier, num, *(row[c] for c in COLUMNS), digest, revision))
+
+        # Rows past the new end of the file were removed
+        for num in existing:
+            changes.append((revision, tier, num, 'removed'))
+            self.conn.execute("DELETE FROM rows WHERE tier = ? AND row = ?", (tier, num))
+
+        self.conn.executemany(
+            "INSERT INTO changes (revision, tier, row, kind) VALUES (?, ?, ?, ?)", changes)
+        if stat:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sources (tier, mtime_ns, size) VALUES (?, ?, ?)",
+                (tier, stat.st_mtime_ns, stat.st_size))
+        else:
+            self.conn.execute("DELETE FROM sources WHERE tier = ?", (tier,))
+
+        return len(changes)
+
+    def select(
+        self,
+        columns: Iterable[str] = COLUMNS,
+        tiers: Iterable[int] | None = None,
+        category: str | None = None,
+        rows: Iterable[tuple[int, int]] | None = None,
+    ) -> Iterator[sqlite3.Row]:
+        """Yield rows with only the requested columns, in (tier, row) order.
+
+        Each result has 'tier' and 'row' (1-based, matches audio file numbers)
+        plus the requested columns.
+
+        Args:
+            columns: CSV columns to read
+            tiers: Restrict to these tiers
+            category: Note glob pattern, e.g. 'Git - *'
+            rows: Restrict to these (tier, row) pairs
+        """
+        columns = list(columns)
+        unknown = set(columns) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+
+        where = []
+        params = []
+
+        if tiers is not None:
+            tiers = list(tiers)
+            where.append(f"tier IN ({', '.join('?' for _ in tiers)})")
+            params.extend(tiers)
+
+        if category is not None:
+            where.append('"Note" GLOB ?')
+            params.append(category)
+
+        self.drop_selections()
+        selection = None
+        if rows is not None:
+            # Temp table keeps large selections under SQLite's parameter limit;
+            # one per call, so interleaved selects do not share it
+            selection = f"selection_{next(self.selections)}"
+            self.conn.execute(f"CREATE TEMP TABLE {selection} (tier INTEGER, row INTEGER)")
+            self.conn.executemany(f"INSERT INTO {selection} VALUES (?, ?)", rows)
+            where.append(f"(tier, row) IN (SELECT tier, row FROM {selection})")
+
+        sql = "SELECT tier, row"
+        if columns:
+            sql += ', ' + ', '.join(f'"{c}"' for c in columns)
+        sql += " FROM rows"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY tier, row"
+
+        cur = self.conn.execute(sql, params)
+        try:
+            yield from cur
+        finally:
+            cur.close()
+            if selection:
+                self.finished_selections.append(selection)
+                self.drop_selections()
+
+    def drop_selections(self):
+        """Drop temp tables of finished selects (kept while another select is still reading)."""
+        for selection in list(self.finished_selections):
+            try:
+                self.conn.execute(f"DROP TABLE temp.{selection}")
+            except sqlite3.OperationalError:
+                return
+            self.finished_selections.remove(selection)
+
+    def count(self, tier: int) -> int:
+        """Number of rows in a tier."""
+        return self.conn.execute("SELECT COUNT(*) FROM rows WHERE tier = ?", (tier,)).fetchone()[0]
+
+    def changes_since(self, revision: int) -> list[sqlite3.Row]:
+        """Row changes recorded after the given revision."""
+        return self.conn.execute(
+            "SELECT revision, tier, row, kind FROM changes WHERE revision > ? "
+            "ORDER BY revision, tier, row", (revision,)).fetchall()
+
+    def export_csv(self, tier: int, path: Path | None = None) -> Path:
+        """Write a tier from the store back to CSV (defaults to the tier CSV)."""
+        path = path or tier_csv_path(tier)
+
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            for row in self.select(COLUMNS, tiers=[tier]):
+                writer.writerow({c: row[c] for c in COLUMNS})
+
+        # Exporting to the tier CSV must not look like an external edit
+        if path == tier_csv_path(tier):
+            stat = path.stat()
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO sources (tier, mtime_ns, size) VALUES (?, ?, ?)",
+                    (tier, stat.st_mtime_ns, stat.st_size))
+
+        return path
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manage the SQLite mirror of the tier CSVs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/corpus.py sync
+  uv run python scripts/corpus.py status
+  uv run python scripts/corpus.py changes --since 3
+  uv run python scripts/corpus.py export --tier 1 --output /tmp/tier1.csv
+        """
+    )
+    parser.add_argument("command", choices=["sync", "status", "changes", "export"])
+    parser.add_argument("--tier", type=int, choices=[1, 2, 3, 4, 5, 6],
+                        help="Tier to export")
+    parser.add_argument("--since", type=int, default=0,
+                        help="Show changes after this revision (default: 0)")
+    parser.add_argument("--output", type=str,
+                        help="Export destination (default: the tier CSV)")
+
+    args = parser.parse_args()
+
+    store = CorpusStore(auto_sync=False)
+
+    if args.command == "sync":
+        changed = store.sync()
+        print(f"Synced: {changed} rows changed (revision {store.revision})")
+
+    elif args.command == "status":
+        store.sync()
+        print(f"Database: {DB_PATH}")
+        print(f"Revision: {store.revision}")
+        for tier in TIERS:
+            print(f"  Tier {tier}: {store.count(tier)} rows")
+
+    elif args.command == "changes":
+        store.sync()
+        changes = store.changes_since(args.since)
+        for change in changes:
+            print(f"  r{change['revision']} tier{change['tier']}_{change['row']:03d} {change['kind']}")
+        print(f"{len(changes)} changes since revision {args.since}")
+
+    elif args.command == "export":
+        if not args.tier:
+            print("Error: --tier is required for export")
+            sys.exit(1)
+        store.sync()
+        output = store.export_csv(args.tier, Path(args.output) if args.output else None)
+        print(f"Exported tier {args.tier} → {output}")
+
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
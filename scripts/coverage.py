@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Kanji, vocabulary and category coverage per tier.
+
+All sentences are tagged once (fugashi, UniDic lemmas of content words)
+and counted into tier × item matrices with NumPy, one each for kanji,
+lemmas and categories (Note). A cell is the number of rows of the tier
+containing the item, so the reports are matrix operations:
+
+- summary: distinct items per tier, how many are new (absent from all
+  earlier tiers) and the average number of rows using each item
+- overlap: items shared by each pair of tiers ((M > 0) @ (M > 0).T)
+- new: the items a tier introduces, most used first
+- levels: with a Kanji,Level CSV (e.g. a JLPT list), the tier × level
+  matrix, to check tiers against the levels in the README
+
+The matrices are saved in .cache/coverage.npz with a hash of the
+Sentence and Note columns, so repeated reports skip tagging until the
+corpus text changes.
+
+Usage:
+    uv run python scripts/coverage.py                        # Summary for all kinds
+    uv run python scripts/coverage.py overlap --kind lemma
+    uv run python scripts/coverage.py new --tier 3 --kind kanji
+    uv run python scripts/coverage.py levels --levels /path/to/jlpt-kanji.csv
+"""
+
+import argparse
+import csv
+import hashlib
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from corpus import CACHE_DIR, TIERS, load_rows, tier_csv_path
+from generate_furigana import get_tagger
+from normalize import normalize
+
+CACHE_PATH = CACHE_DIR / "coverage.npz"
+
+# Bump when tagging or counting changes
+COVERAGE_VERSION = 1
+
+KINDS = ('kanji', 'lemma', 'category')
+
+# Levels claimed in the README's tier table
+TIER_LEVELS = {
+    1: 'N5-N4',
+    2: 'N4-N3',
+    3: 'N3',
+    4: 'N3-N2',
+    5: 'N2',
+    6: 'N2-N1',
+}
+
+# Parts of speech counted as vocabulary (particles, auxiliaries and symbols are not)
+CONTENT_POS = {'名詞', '動詞', '形容詞', '形状詞', '副詞', '連体詞', '接続詞', '感動詞'}
+
+KANJI = re.compile(r'[一-鿿々〆ヶ]')
+
+DEFAULT_LIMIT = 30
+
+
+def corpus_hash(tiers=TIERS) -> str:
+    """Hash of every tier's Sentence and Note columns (what coverage reads)."""
+    h = hashlib.sha256(f"{COVERAGE_VERSION}".encode())
+    for tier in tiers:
+        if not tier_csv_path(tier).exists():
+            continue
+        h.update(f"\x1etier{tier}".encode())
+        for row in load_rows(tier, ['Sentence', 'Note']):
+            h.update(f"\x1f{row.Sentence}\x1f{row.Note}".encode('utf-8'))
+    return h.hexdigest()
+
+
+def lemmas(sentence: str) -> set[str]:
+    """UniDic lemmas of the content words of a sentence."""
+    # Loanword lemmas carry their origin (テーブル-table); keep the Japanese part
+    return {(word.feature.lemma or word.surface).split('-')[0] for word in get_tagger()(sentence)
+            if word.feature.pos1 in CONTENT_POS}
+
+
+class Coverage:
+    """Tier × item count matrices, one per kind, with their item labels."""
+
+    def __init__(self, tiers: np.ndarray, rows: np.ndarray, items: dict[str, np.ndarray],
+                 counts: dict[str, np.ndarray]):
+        self.tiers = tiers
+        self.rows = rows
+        self.items = items
+        self.counts = counts
+
+    @classmethod
+    def build(cls) -> 'Coverage':
+        tiers = [tier for tier in TIERS if tier_csv_path(tier).exists()]
+        # (tier position, item) per row containing the item
+        pairs = {kind: [] for kind in KINDS}
+        rows = []
+        for position, tier in enumerate(tiers):
+            tier_rows = load_rows(tier, ['Sentence', 'Note'])
+            rows.append(len(tier_rows))
+            for row in tier_rows:
+                sentence = normalize(row.Sentence)
+                pairs['kanji'].extend((position, kanji) for kanji in set(KANJI.findall(sentence)))
+                pairs['lemma'].extend((position, lemma) for lemma in lemmas(sentence))
+                if row.Note:
+                    pairs['category'].append((position, row.Note))
+
+        items = {}
+        counts = {}
+        for kind, found in pairs.items():
+            labels, columns = np.unique(np.array([item for _, item in found] or [''], dtype=str),
+                                        return_inverse=True)
+            matrix = np.zeros((len(tiers), len(labels) if found else 0), dtype=np.int32)
+            if found:
+                np.add.at(matrix, (np.array([position for position, _ in found]), columns), 1)
+            items[kind] = labels if found else labels[:0]
+            counts[kind] = matrix
+        return cls(np.array(tiers), np.array(rows), items, counts)
+
+    def save(self, path: Path, key: str):
+        path.parent.mkdir(exist_ok=True)
+        arrays = {'key': np.array(key), 'tiers': self.tiers, 'rows': self.rows}
+        for kind in KINDS:
+            arrays[f'{kind}_items'] = self.items[kind]
+            arrays[f'{kind}_counts'] = self.counts[kind]
+        # Write via a file object, so np.savez does not append .npz to the name
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: Path, key: str) -> 'Coverage | None':
+        try:
+            with np.load(path) as data:
+                if str(data['key']) != key:
+                    return None
+                return cls(data['tiers'], data['rows'],
+                           {kind: data[f'{kind}_items'] for kind in KINDS},
+                           {kind: data[f'{kind}_counts'] for kind in KINDS})
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def present(self, kind: str) -> np.ndarray:
+        """Boolean tier × item matrix: does the tier use the item."""
+        return self.counts[kind] > 0
+
+    def first_tier(self, kind: str) -> np.ndarray:
+        """Position of the first tier using each item."""
+        return self.present(kind).argmax(axis=0)
+
+    def new_items(self, kind: str) -> np.ndarray:
+        """Boolean tier × item matrix: the tier is the first to use the item."""
+        present = self.present(kind)
+        return present & (np.arange(len(self.tiers))[:, None] == self.first_tier(kind))
+
+    def overlap(self, kind: str) -> np.ndarray:
+        """Tier × tier counts of shared items."""
+        present = self.present(kind).astype(np.int32)
+        return present @ present.T
+
+
+def load_coverage(path: Path = CACHE_PATH) -> tuple[Coverage, bool]:
+    """Coverage of the current corpus, and whether it came from the cache."""
+    key = corpus_hash()
+    coverage = Coverage.load(path, key)
+    if coverage is not None:
+        return coverage, True
+    coverage = Coverage.build()
+    coverage.save(path, key)
+    return coverage, False
+
+
+def read_levels(path: Path) -> dict[str, str]:
+    """Item → level from a CSV with Kanji (or Word) and Level columns."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        column = next((name for name in ('Kanji', 'Word') if name in (reader.fieldnames or [])), None)
+        if column is None or 'Level' not in reader.fieldnames:
+            raise ValueError(f"{path.name} needs a Kanji or Word column and a Level column")
+        return {row[column].strip(): row['Level'].strip() for row in reader if row[column].strip()}
+
+
+def print_summary(coverage: Coverage):
+    print(f"{'Tier':<6}{'Rows':>6}{'Level':>8}  "
+          + ''.join(f"{kind:>10}{'new':>6}{'avg':>6}" for kind in KINDS))
+    for position, tier in enumerate(coverage.tiers):
+        cells = []
+        for kind in KINDS:
+            present = coverage.present(kind)[position]
+            new = coverage.new_items(kind)[position]
+            used = present.sum()
+            per_item = coverage.counts[kind][position][present].mean() if used else 0.0
+            cells.append(f"{used:>10}{new.sum():>6}{per_item:>6.1f}")
+        print(f"{tier:<6}{coverage.rows[position]:>6}{TIER_LEVELS.get(int(tier), ''):>8}  " + ''.join(cells))
+    totals = ''.join(f"{len(coverage.items[kind]):>10}{'':>12}" for kind in KINDS)
+    print(f"{'All':<6}{coverage.rows.sum():>6}{'':>8}  {totals}")
+
+
+def print_overlap(coverage: Coverage, kind: str):
+    shared = coverage.overlap(kind)
+    used = np.diag(shared)
+    print(f"{kind}: shared by each pair of tiers (diagonal: used by the tier)\n")
+    print(f"{'':<6}" + ''.join(f"{f'tier {tier}':>9}" for tier in coverage.tiers))
+    for position, tier in enumerate(coverage.tiers):
+        print(f"{f'tier {tier}':<6}" + ''.join(f"{count:>9}" for count in shared[position]))
+    # Share of each tier's items that an earlier tier already taught
+    earlier = np.cumsum(coverage.present(kind), axis=0) - coverage.present(kind) > 0
+    reused = (coverage.present(kind) & earlier).sum(axis=1)
+    print("\nAlready in an earlier tier: " + ', '.join(
+        f"tier {tier} {reused[position] / used[position]:.0%}" if used[position] else f"tier {tier} -"
+        for position, tier in enumerate(coverage.tiers)))
+
+
+def print_new(coverage: Coverage, kind: str, tier: int, limit: int):
+    position = list(coverage.tiers).index(tier)
+    new = coverage.new_items(kind)[position]
+    counts = coverage.counts[kind][position]
+    order = np.flatnonzero(new)[np.argsort(-counts[new], kind='stable')]
+    print(f"Tier {tier}: {len(order)} new {kind} items (rows using them)\n")
+    shown = order[:limit or None]
+    print('  ' + ', '.join(f"{coverage.items[kind][idx]} {counts[idx]}" for idx in shown))
+    if len(order) > len(shown):
+        print(f"  ... {len(order) - len(shown)} more (--limit 0 shows all)")
+
+
+def print_levels(coverage: Coverage, kind: str, levels: dict[str, str]):
+    # Descending, so JLPT levels read N5 → N1
+    names = sorted(set(levels.values()), reverse=True)
+    labels = coverage.items[kind]
+    # Level column per item (len(names) for items the list does not have)
+    level_idx = np.array([names.index(levels[item]) if item in levels else len(names) for item in labels],
+                         dtype=np.int64)
+    present = coverage.present(kind).astype(np.int32)
+    # Tier × level: one-hot level per item, summed over the items a tier uses
+    by_level = present @ np.eye(len(names) + 1, dtype=np.int32)[level_idx]
+
+    print(f"{kind}: items per level (distinct items used by the tier)\n")
+    print(f"{'Tier':<6}{'Level':>8}" + ''.join(f"{name:>8}" for name in names) + f"{'unlisted':>10}")
+    for position, tier in enumerate(coverage.tiers):
+        print(f"{tier:<6}{TIER_LEVELS.get(int(tier), ''):>8}"
+              + ''.join(f"{count:>8}" for count in by_level[position][:-1])
+              + f"{by_level[position][-1]:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report kanji, lemma and category coverage per tier",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/coverage.py
+  uv run python scripts/coverage.py overlap --kind kanji
+  uv run python scripts/coverage.py new --tier 2 --kind lemma
+  uv run python scripts/coverage.py levels --levels /path/to/jlpt-kanji.csv
+        """
+    )
+    parser.add_argument("command", nargs="?", default="summary",
+                        choices=["summary", "overlap", "new", "levels"])
+    parser.add_argument("--kind", choices=KINDS, default="kanji",
+                        help="Items to report for overlap/new/levels (default: kanji)")
+    parser.add_argument("--tier", type=int, choices=TIERS,
+                        help="Tier for 'new'")
+    parser.add_argument("--levels", type=Path,
+                        help="CSV with Kanji (or Word) and Level columns, for 'levels'")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT,
+                        help=f"Items shown by 'new' (default: {DEFAULT_LIMIT}, 0 for all)")
+
+    args = parser.parse_args()
+
+    coverage, cached = load_coverage()
+    if not cached:
+        print(f"Tagged {coverage.rows.sum()} sentences → {CACHE_PATH}\n")
+
+    if args.command == "summary":
+        print_summary(coverage)
+    elif args.command == "overlap":
+        print_overlap(coverage, args.kind)
+    elif args.command == "new":
+        if not args.tier or args.tier not in coverage.tiers:
+            print("Error: --tier is required for new (and its CSV must exist)")
+            sys.exit(1)
+        print_new(coverage, args.kind, args.tier, args.limit)
+    elif args.command == "levels":
+        if not args.levels:
+            print("Error: --levels is required for levels")
+            sys.exit(1)
+        try:
+            levels = read_levels(args.levels)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print_levels(coverage, args.kind, levels)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,14 +10,18 @@ Prerequisites:
 """
 
 import argparse
-import csv
 import hashlib
 import random
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import genanki
 
+from corpus import CorpusStore, category_rows, tier_csv_path
+from generate_conjugations import render_conjugation_key
+
 # Project root
 ROOT = Path(__file__).parent.parent
 
@@ -32,6 +36,114 @@ def get_deck_id(tier: int) -> int:
     return DECK_BASE_ID + tier
 
 
+# Renders the compact Conjugations key (e.g. 'godan_verb:取り組む') into the
+# collapsible table on the card. Mirrors generate_conjugation_html() in
+# generate_conjugations.py, so the table layout is stored once in the model
+# instead of in every note. Fields holding legacy HTML are left as-is.
+CONJUGATION_SCRIPT = '''
+<script>
+(function () {
+    var el = document.getElementById('conjugations');
+    var key = el ? el.textContent.trim() : '';
+    var m = /^(\\w+):(.+)$/.exec(key);
+    if (!m) { return; }
+    var type = m[1], base = m[2];
+
+    var GODAN = {
+        'う': ['わ', 'い', 'え', 'お', 'って', 'った'],
+        'く': ['か', 'き', 'け', 'こ', 'いて', 'いた'],
+        'ぐ': ['が', 'ぎ', 'げ', 'ご', 'いで', 'いだ'],
+        'す': ['さ', 'し', 'せ', 'そ', 'して', 'した'],
+        'つ': ['た', 'ち', 'て', 'と', 'って', 'った'],
+        'ぬ': ['な', 'に', 'ね', 'の', 'んで', 'んだ'],
+        'ぶ': ['ば', 'び', 'べ', 'ぼ', 'んで', 'んだ'],
+        'む': ['ま', 'み', 'め', 'も', 'んで', 'んだ'],
+        'る': ['ら', 'り', 'れ', 'ろ', 'って', 'った']
+    };
+    var TYPE_LABELS = {
+        suru_verb: 'する動詞', godan_verb: '五段動詞', ichidan_verb: '一段動詞',
+        kuru_verb: 'カ変動詞', i_adj: 'い形容詞'
+    };
+    var SECTIONS = [['basic', 'Basic Forms'], ['advanced', 'Advanced Forms'], ['keigo', 'Keigo 敬語']];
+    var VERB_LABELS = {
+        basic: ['Dictionary 辞書形', 'Polite ます形', 'Negative ない形', 'Te-form て形', 'Past た形'],
+        advanced: ['Potential 可能形', 'Passive 受身形', 'Causative 使役形', 'Caus-Pass 使役受身',
+                   'Conditional 仮定形', 'Conditional たら形', 'Volitional 意向形', 'Imperative 命令形',
+                   'Want to たい形', 'Should べき形'],
+        keigo: ['Respectful 尊敬語', 'Humble 謙譲語']
+    };
+
+    function verb(basic, advanced, keigo) {
+        return {basic: basic, advanced: advanced, keigo: keigo};
+    }
+
+    function conjugate() {
+        var s, e;
+        if (type === 'suru_verb') {
+            s = base.slice(0, -2);
+            return verb(
+                [s + 'する', s + 'します', s + 'しない', s + 'して', s + 'した'],
+                [s + 'できる', s + 'される', s + 'させる', s + 'させられる', s + 'すれば', s + 'したら',
+                 s + 'しよう', s + 'しろ', s + 'したい', s + 'すべき'],
+                [s + 'なさる', s + 'いたす']);
+        }
+        if (type === 'godan_verb') {
+            e = GODAN[base.slice(-1)];
+            if (!e) { return null; }
+            s = base.slice(0, -1);
+            return verb(
+                [base, s + e[1] + 'ます', s + e[0] + 'ない', s + e[4], s + e[5]],
+                [s + e[2] + 'る', s + e[0] + 'れる', s + e[0] + 'せる', s + e[0] + 'せられる', s + e[2] + 'ば',
+                 s + e[5] + 'ら', s + e[3] + 'う', s + e[2], s + e[1] + 'たい', base + 'べき'],
+                [s + e[0] + 'れる', 'お' + s + e[1] + 'する']);
+        }
+        if (type === 'ichidan_verb') {
+            s = base.slice(-1) === 'る' ? base.slice(0, -1) : base;
+            return verb(
+                [s + 'る', s + 'ます', s + 'ない', s + 'て', s + 'た'],
+                [s + 'られる', s + 'られる', s + 'させる', s + 'させられる', s + 'れば', s + 'たら',
+                 s + 'よう', s + 'ろ', s + 'たい', s + 'るべき'],
+                [s + 'られる', 'お' + s + 'する']);
+        }
+        if (type === 'kuru_verb') {
+            return verb(
+                ['来る', '来ます', '来ない', '来て', '来た'],
+                ['来られる', '来られる', '来させる', '来させられる', '来れば', '来たら',
+                 '来よう', '来い', '来たい', '来るべき'],
+                ['いらっしゃる', '参る']);
+        }
+        if (type === 'i_adj') {
+            s = base.slice(0, -1);
+            return {basic: [
+                ['Dictionary 辞書形', s + 'い'], ['Negative ない形', s + 'くない'],
+                ['Past た形', s + 'かった'], ['Past Neg なかった', s + 'くなかった'],
+                ['Te-form て形', s + 'くて'], ['Adverbial く形', s + 'く']
+            ]};
+        }
+        return null;
+    }
+
+    var forms = conjugate();
+    if (!forms) { el.textContent = ''; return; }
+
+    var word = el.getAttribute('data-word');
+    var html = '<details class="conjugation-section"><summary>Conjugations for ' + word +
+        ' (' + TYPE_LABELS[type] + ')</summary><table class="conjugation-table">';
+    SECTIONS.forEach(function (section) {
+        var rows = forms[section[0]];
+        if (!rows) { return; }
+        html += '<tr><th colspan="2">' + section[1] + '</th></tr>';
+        rows.forEach(function (row, i) {
+            var pair = Array.isArray(row) ? row : [VERB_LABELS[section[0]][i], row];
+            html += '<tr><td>' + pair[0] + '</td><td>' + pair[1] + '</td></tr>';
+        });
+    });
+    el.innerHTML = html + '</table></details>';
+})();
+</script>
+'''
+
+
 def create_model() -> genanki.Model:
     """Create the 2-card Anki model.
 
@@ -50,7 +162,7 @@ def create_model() -> genanki.Model:
             {'name': 'Audio'},          # Audio file reference
             {'name': 'Hint'},           # First character hint
             {'name': 'KeyMeaning'},     # English meaning of key word
-            {'name': 'Conjugations'},   # HTML conjugation table
+            {'name': 'Conjugations'},   # Conjugation key (type:base), rendered by CONJUGATION_SCRIPT
         ],
         templates=[
             # Card A: Comprehension (Listening + Reading)
@@ -71,8 +183,8 @@ def create_model() -> genanki.Model:
 <div class="translation">{{Translation}}</div>
 <div class="pronunciation">{{Pronunciation}}</div>
 <div class="key-vocab">Key: <span class="vocab">{{Cloze}}</span> ({{KeyMeaning}})</div>
-{{Conjugations}}
-''',
+<div id="conjugations" data-word="{{Cloze}}">{{Conjugations}}</div>
+''' + CONJUGATION_SCRIPT,
             },
             # Card B: Production (English → Japanese)
             {
@@ -260,41 +372,51 @@ hr#answer {
     )
 
 
-def create_deck(tier: int, include_audio: bool = True, female: bool = False) -> tuple[genanki.Deck, list[str]]:
-    """Create Anki deck for a specific tier.
+# Position of Conjugations in the note fields
+CONJUGATIONS_FIELD = 8
 
-    Args:
-        tier: Tier number (1-6)
-        include_audio: Whether to include audio files
-        female: If True, use audio from tier*-audio-female/ directory
 
-    Returns:
-        Tuple of (deck, list of media files)
+@lru_cache(maxsize=None)
+def legacy_conjugations(cloze: str, conjugations: str) -> str:
+    """Conjugations field as it was before keys: the rendered HTML table."""
+    if not conjugations or conjugations.startswith('<'):
+        return conjugations
+    return render_conjugation_key(cloze, conjugations)
+
+
+def note_guid(fields: list[str]) -> str:
+    """Note GUID as genanki derived it when Conjugations held HTML.
+
+    genanki hashes all fields by default, so storing keys instead of tables
+    would give every note a new GUID and duplicate it on re-import, losing
+    its review history.
     """
-    csv_path = ROOT / f"tier{tier}-vocabulary.csv"
-    audio_dir = ROOT / f"tier{tier}-audio-female" if female else ROOT / f"tier{tier}-audio"
+    legacy = list(fields)
+    legacy[CONJUGATIONS_FIELD] = legacy_conjugations(fields[2], fields[CONJUGATIONS_FIELD])
+    return genanki.guid_for(*legacy)
 
-    if not csv_path.exists():
-        print(f"Error: {csv_path} not found")
-        sys.exit(1)
 
-    # Read vocabulary
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        sentences = list(reader)
+# Columns read from the corpus store for each note
+NOTE_COLUMNS = ['Sentence', 'Translation', 'Cloze', 'Pronunciation', 'Note', 'KeyMeaning', 'Conjugations']
 
-    # Create deck
-    deck = genanki.Deck(
-        get_deck_id(tier),
-        f'Japanese IT Vocabulary - Tier {tier}'
-    )
 
+def add_notes(deck: genanki.Deck, rows, include_audio: bool = True,
+              female: bool = False) -> tuple[int, list[str]]:
+    """Add notes for corpus store rows (with NOTE_COLUMNS) to a deck.
+
+    Only the audio files of the added notes are returned as media.
+
+    Returns:
+        Tuple of (number of notes added, list of media files)
+    """
     model = create_model()
     media_files = []
+    count = 0
 
-    for idx, row in enumerate(sentences):
-        num = idx + 1
-        audio_file = f"tier{tier}_{num:03d}.mp3"
+    for row in rows:
+        tier = row['tier']
+        audio_dir = ROOT / f"tier{tier}-audio-female" if female else ROOT / f"tier{tier}-audio"
+        audio_file = f"tier{tier}_{row['row']:03d}.mp3"
         audio_path = audio_dir / audio_file
 
         # Check if audio exists
@@ -308,22 +430,148 @@ def create_deck(tier: int, include_audio: bool = True, female: bool = False) ->
         sentence = row['Sentence']
         hint = sentence[:2] + "..." if len(sentence) > 2 else sentence
 
+        fields = [
+            row['Sentence'],
+            row['Translation'],
+            row['Cloze'],
+            row['Pronunciation'],
+            row['Note'],
+            audio_ref,
+            hint,
+            row['KeyMeaning'],
+            row['Conjugations'],
+        ]
         note = genanki.Note(
             model=model,
-            fields=[
-                row['Sentence'],
-                row['Translation'],
-                row['Cloze'],
-                row['Pronunciation'],
-                row['Note'],
-                audio_ref,
-                hint,
-                row['KeyMeaning'],
-                row.get('Conjugations', ''),
-            ],
+            fields=fields,
+            guid=note_guid(fields),
             tags=[f'tier{tier}', row['Note'].replace(' ', '_').replace('-', '_')]
         )
         deck.add_note(note)
+        count += 1
+
+    return count, media_files
+
+
+def add_tier_notes(deck: genanki.Deck, store: CorpusStore, tier: int,
+                   include_audio: bool = True, female: bool = False) -> tuple[int, list[str]]:
+    """Add notes for a tier to a deck.
+
+    Returns:
+        Tuple of (number of notes added, list of media files)
+    """
+    return add_notes(deck, store.select(NOTE_COLUMNS, tiers=[tier]), include_audio, female)
+
+
+def get_filtered_deck_id(name: str) -> int:
+    """Generate stable deck ID for a filtered deck (derived from its name)."""
+    return DECK_BASE_ID + 1000 + int(hashlib.sha1(name.encode('utf-8')).hexdigest()[:6], 16)
+
+
+def create_filtered_deck(patterns: list[str], tiers: list[int] | None = None,
+                         include_audio: bool = True, female: bool = False,
+                         store: CorpusStore | None = None) -> tuple[genanki.Deck, list[str]]:
+    """Create a deck of the notes whose category matches any of the patterns.
+
+    Rows are looked up in the category index, so only the selected notes are
+    read from the store.
+
+    Args:
+        patterns: Category glob patterns, e.g. ['Git - *']
+        tiers: Restrict to these tiers (default: all)
+        include_audio: Whether to include audio files
+        female: If True, use audio from tier*-audio-female/ directories
+        store: Corpus store to read from (opened if not given)
+
+    Returns:
+        Tuple of (deck, list of media files)
+    """
+    selection = category_rows(patterns, tiers)
+    store = store or CorpusStore()
+
+    name = f"Japanese IT Vocabulary - {', '.join(patterns)}"
+    if female:
+        name += " (Female)"
+    deck = genanki.Deck(get_filtered_deck_id(name), name)
+
+    if selection:
+        _, media_files = add_notes(deck, store.select(NOTE_COLUMNS, rows=selection), include_audio, female)
+    else:
+        media_files = []
+
+    return deck, media_files
+
+
+# Tier names for subdecks of the combined deck
+TIER_NAMES = {
+    1: "Tier 1 - Foundational",
+    2: "Tier 2 - Basic Development",
+    3: "Tier 3 - Intermediate",
+    4: "Tier 4 - Advanced",
+    5: "Tier 5 - Communication",
+    6: "Tier 6 - Expert",
+}
+
+
+def create_combined_deck(include_audio: bool = True, female: bool = False,
+                         store: CorpusStore | None = None) -> tuple[list[genanki.Deck], list[str], dict[int, int]]:
+    """Create the combined deck with one subdeck per tier.
+
+    Returns:
+        Tuple of (subdecks, list of media files, notes added per tier)
+    """
+    store = store or CorpusStore()
+    voice_label = " (Female)" if female else ""
+
+    all_decks = []
+    all_media = []
+    counts = {}
+
+    for tier in range(1, 7):
+        # Create subdeck with :: notation
+        subdeck_name = f"Japanese IT Vocabulary{voice_label}::{TIER_NAMES[tier]}"
+        subdeck = genanki.Deck(
+            DECK_BASE_ID + tier + (100 if female else 0),
+            subdeck_name
+        )
+
+        count, media_files = add_tier_notes(subdeck, store, tier, include_audio, female)
+
+        all_decks.append(subdeck)
+        all_media.extend(media_files)
+        counts[tier] = count
+
+    return all_decks, all_media, counts
+
+
+def create_deck(tier: int, include_audio: bool = True, female: bool = False,
+                store: CorpusStore | None = None) -> tuple[genanki.Deck, list[str]]:
+    """Create Anki deck for a specific tier.
+
+    Args:
+        tier: Tier number (1-6)
+        include_audio: Whether to include audio files
+        female: If True, use audio from tier*-audio-female/ directory
+        store: Corpus store to read from (opened if not given)
+
+    Returns:
+        Tuple of (deck, list of media files)
+    """
+    csv_path = tier_csv_path(tier)
+
+    if not csv_path.exists():
+        print(f"Error: {csv_path} not found")
+        sys.exit(1)
+
+    store = store or CorpusStore()
+
+    # Create deck
+    deck = genanki.Deck(
+        get_deck_id(tier),
+        f'Japanese IT Vocabulary - Tier {tier}'
+    )
+
+    _, media_files = add_tier_notes(deck, store, tier, include_audio, female)
 
     return deck, media_files
 
@@ -337,6 +585,8 @@ Examples:
   uv run python scripts/create_deck.py --tier 1
   uv run python scripts/create_deck.py --all
   uv run python scripts/create_deck.py --tier 1 --no-audio
+  uv run python scripts/create_deck.py --category 'Git - *'
+  uv run python scripts/create_deck.py --domain Security --tier 4
         """
     )
     parser.add_argument("--tier", type=int, choices=[1, 2, 3, 4, 5, 6],
@@ -349,88 +599,54 @@ Examples:
                         help="Use female voice audio from tier*-audio-female/")
     parser.add_argument("--no-audio", action="store_true",
                         help="Create deck without audio files")
+    parser.add_argument("--category", action="append", default=[],
+                        help="Only notes whose category matches this glob, e.g. 'Git - *' (repeatable)")
+    parser.add_argument("--domain", action="append", default=[],
+                        help="Only notes in this category domain, e.g. Security (repeatable)")
     parser.add_argument("--output", type=str,
                         help="Output filename (default: auto-generated)")
 
     args = parser.parse_args()
 
-    if not args.tier and not args.all and not args.combined:
+    if not args.tier and not args.all and not args.combined and not args.category and not args.domain:
         parser.print_help()
         sys.exit(1)
 
     include_audio = not args.no_audio
     suffix = "-female" if args.female else ""
+    store = CorpusStore()
+
+    if args.category or args.domain:
+        # Focused deck across tiers (or within --tier)
+        patterns = args.category + [f"{domain} - *" for domain in args.domain]
+        tiers = [args.tier] if args.tier else None
+        deck, media_files = create_filtered_deck(patterns, tiers, include_audio, args.female, store)
+
+        if not deck.notes:
+            print(f"Error: no notes match {', '.join(patterns)}")
+            sys.exit(1)
+
+        slug = re.sub(r'[^a-z0-9]+', '-', ' '.join(args.category + args.domain).lower()).strip('-')
+        output = args.output or f"nihongo-it-vocab-{slug}{suffix}.apkg"
 
-    if args.combined:
+        package = genanki.Package(deck)
+        package.media_files = media_files
+        package.write_to_file(output)
+
+        print(f"\nCreated: {output}")
+        print(f"Notes: {len(deck.notes)}")
+        print(f"Cards: {len(deck.notes) * 2} (2 cards per note)")
+        print(f"Media files: {len(media_files)}")
+
+    elif args.combined:
         # Create combined deck with subdecks for each tier
         voice_label = " (Female)" if args.female else ""
         print(f"Creating combined deck with tier subdecks{voice_label}...")
 
-        # Tier names for subdecks
-        tier_names = {
-            1: "Tier 1 - Foundational",
-            2: "Tier 2 - Basic Development",
-            3: "Tier 3 - Intermediate",
-            4: "Tier 4 - Advanced",
-            5: "Tier 5 - Communication",
-            6: "Tier 6 - Expert",
-        }
-
-        all_decks = []
-        all_media = []
-        total_notes = 0
-
-        for tier in range(1, 7):
-            # Create subdeck with :: notation
-            subdeck_name = f"Japanese IT Vocabulary{voice_label}::{tier_names[tier]}"
-            subdeck = genanki.Deck(
-                DECK_BASE_ID + tier + (100 if args.female else 0),
-                subdeck_name
-            )
-
-            _, media_files = create_deck(tier, include_audio, args.female)
-            csv_path = ROOT / f"tier{tier}-vocabulary.csv"
-            audio_dir = ROOT / f"tier{tier}-audio-female" if args.female else ROOT / f"tier{tier}-audio"
-
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                sentences = list(reader)
-
-            model = create_model()
-            for idx, row in enumerate(sentences):
-                num = idx + 1
-                audio_file = f"tier{tier}_{num:03d}.mp3"
-                audio_path = audio_dir / audio_file
-
-                if include_audio and audio_path.exists():
-                    audio_ref = f"[sound:{audio_file}]"
-                else:
-                    audio_ref = "[No audio]"
-
-                sentence = row['Sentence']
-                hint = sentence[:2] + "..." if len(sentence) > 2 else sentence
-
-                note = genanki.Note(
-                    model=model,
-                    fields=[
-                        row['Sentence'],
-                        row['Translation'],
-                        row['Cloze'],
-                        row['Pronunciation'],
-                        row['Note'],
-                        audio_ref,
-                        hint,
-                        row['KeyMeaning'],
-                        row.get('Conjugations', ''),
-                    ],
-                    tags=[f'tier{tier}', row['Note'].replace(' ', '_').replace('-', '_')]
-                )
-                subdeck.add_note(note)
-
-            all_decks.append(subdeck)
-            all_media.extend(media_files)
-            total_notes += len(sentences)
-            print(f"  Added {tier_names[tier]}: {len(sentences)} notes")
+        all_decks, all_media, counts = create_combined_deck(include_audio, args.female, store)
+        for tier, count in counts.items():
+            print(f"  Added {TIER_NAMES[tier]}: {count} notes")
+        total_notes = sum(counts.values())
 
         output = args.output or f"nihongo-it-vocab-complete{suffix}.apkg"
         package = genanki.Package(all_decks)
@@ -445,7 +661,7 @@ Examples:
     elif args.all:
         # Create separate deck for each tier
         for tier in range(1, 7):
-            deck, media_files = create_deck(tier, include_audio, args.female)
+            deck, media_files = create_deck(tier, include_audio, args.female, store)
             output = f"nihongo-it-vocab-tier{tier}{suffix}.apkg"
 
             package = genanki.Package(deck)
@@ -456,7 +672,7 @@ Examples:
     else:
         # Single tier
         tier = args.tier
-        deck, media_files = create_deck(tier, include_audio, args.female)
+        deck, media_files = create_deck(tier, include_audio, args.female, store)
         output = args.output or f"nihongo-it-vocab-tier{tier}{suffix}.apkg"
 
         package = genanki.Package(deck)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Find the same or nearly the same sentence in several rows (across tiers).
+
+Each row is shingled into character 3-grams of its Sentence (normalized,
+punctuation and spaces removed) and word 2-grams of its Translation. Rows
+whose shingle sets have a Jaccard similarity above the threshold are
+near-duplicates:
+
+    まずテストを実行してください。 / First, run the tests.
+    まずテストを実行して下さい。   / First, run the tests.
+
+Comparing every pair is quadratic, so rows are indexed by MinHash
+signatures (NUM_PERM hashes, computed with NumPy in row chunks) split into
+BANDS bands: rows that agree on a whole band land in the same bucket and
+become candidates. Only candidates are compared exactly, so the run stays
+near-linear in the number of rows (100k rows in about fifteen seconds).
+
+With BANDS x ROWS_PER_BAND = 24 x 5, a pair at Jaccard 0.6 becomes a
+candidate with 86% probability, at 0.7 with 99%, and at 0.3 with 6%.
+
+Usage:
+    uv run python scripts/find_duplicates.py                   # All clusters
+    uv run python scripts/find_duplicates.py --cross-tier      # Only clusters spanning tiers
+    uv run python scripts/find_duplicates.py --threshold 0.8
+"""
+
+import argparse
+import re
+import time
+import zlib
+from collections import defaultdict
+from collections.abc import Iterator
+
+import numpy as np
+
+from corpus import TIERS, load_rows, tier_csv_path
+from normalize import normalize
+
+# MinHash / LSH parameters (NUM_PERM = BANDS * ROWS_PER_BAND)
+BANDS = 24
+ROWS_PER_BAND = 5
+NUM_PERM = BANDS * ROWS_PER_BAND
+
+# Default Jaccard similarity for a reported pair
+THRESHOLD = 0.6
+
+# Rows hashed per NumPy batch (bounds memory: shingles x NUM_PERM x 8 bytes)
+CHUNK_ROWS = 1024
+
+SENTENCE_NGRAM = 3
+TRANSLATION_NGRAM = 2
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Fixed seed, so signatures are comparable between runs
+_rng = np.random.default_rng(20240601)
+PERM_A = _rng.integers(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+PERM_B = _rng.integers(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+
+NOT_SPOKEN = re.compile(r'[\s、。！？!?,.・「」()（）]')
+WORD = re.compile(r"[a-z0-9']+")
+
+
+def shingles(sentence: str, translation: str) -> set[str]:
+    """Character n-grams of the sentence and word n-grams of the translation."""
+    text = NOT_SPOKEN.sub('', normalize(sentence))
+    grams = {f"s:{text[i:i + SENTENCE_NGRAM]}" for i in range(max(len(text) - SENTENCE_NGRAM + 1, 1))}
+    words = WORD.findall(translation.lower())
+    grams |= {f"t:{' '.join(words[i:i + TRANSLATION_NGRAM])}"
+              for i in range(max(len(words) - TRANSLATION_NGRAM + 1, 1)) if words}
+    return grams
+
+
+def shingle_hashes(grams: set[str]) -> np.ndarray:
+    return np.fromiter((zlib.crc32(gram.encode('utf-8')) for gram in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash_signatures(shingle_sets: list[set[str]]) -> np.ndarray:
+    """(rows, NUM_PERM) MinHash signatures, one NumPy pass per chunk of rows."""
+    signatures = np.full((len(shingle_sets), NUM_PERM), MAX_HASH, dtype=np.uint64)
+    for chunk_start in range(0, len(shingle_sets), CHUNK_ROWS):
+        chunk = [shingle_hashes(grams) for grams in shingle_sets[chunk_start:chunk_start + CHUNK_ROWS]]
+        lengths = np.array([len(hashes) for hashes in chunk])
+        if not lengths.sum():
+            continue
+        hashes = np.concatenate(chunk)
+        # Universal hashing: (a * x + b) mod p, truncated to 32 bits
+        permuted = ((hashes[:, None] * PERM_A + PERM_B) % MERSENNE_PRIME) & MAX_HASH
+        # Minimum per row over its shingles (rows without shingles keep MAX_HASH)
+        nonempty = lengths > 0
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))[nonempty]
+        rows = np.flatnonzero(nonempty) + chunk_start
+        signatures[rows] = np.minimum.reduceat(permuted, offsets, axis=0)
+    return signatures
+
+
+def lsh_buckets(signatures: np.ndarray) -> Iterator[list[int]]:
+    """Rows sharing a band of their signatures, per band (buckets of 2 or more)."""
+    for band in range(BANDS):
+        columns = signatures[:, band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        buckets = defaultdict(list)
+        for row, key in enumerate(map(bytes, columns)):
+            buckets[key].append(row)
+        yield from (members for members in buckets.values() if len(members) > 1)
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class Clusters:
+    """Union-find over row indices."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a: int, b: int):
+        self.parent[self.find(a)] = self.find(b)
+
+    def groups(self) -> list[list[int]]:
+        members = defaultdict(list)
+        for item in range(len(self.parent)):
+            members[self.find(item)].append(item)
+        return [group for group in members.values() if len(group) > 1]
+
+
+def find_clusters(shingle_sets: list[set[str]], threshold: float = THRESHOLD
+                  ) -> tuple[list[list[int]], dict[tuple[int, int], float], int]:
+    """(clusters of row indices, similarity per joining pair, pairs compared).
+
+    Within a bucket each row is compared with one row per cluster seen so
+    far, not with every other row, so a sentence repeated n times costs n
+    comparisons rather than n².
+    """
+    signatures = minhash_signatures(shingle_sets)
+
+    clusters = Clusters(len(shingle_sets))
+    similar = {}
+    compared = 0
+    for members in lsh_buckets(signatures):
+        representatives = []
+        for row in members:
+            for other in representatives:
+                if clusters.find(row) == clusters.find(other):
+                    break
+                compared += 1
+                similarity = jaccard(shingle_sets[row], shingle_sets[other])
+                if similarity >= threshold:
+                    similar[other, row] = similarity
+                    clusters.union(row, other)
+                    break
+            else:
+                representatives.append(row)
+    return clusters.groups(), similar, compared
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report clusters of identical or near-identical sentences across the tiers",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/find_duplicates.py
+  uv run python scripts/find_duplicates.py --cross-tier
+  uv run python scripts/find_duplicates.py --threshold 0.8
+        """
+    )
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help=f"Minimum Jaccard similarity of the shingles (default: {THRESHOLD})")
+    parser.add_argument("--cross-tier", action="store_true",
+                        help="Only report clusters with rows from more than one tier")
+
+    args = parser.parse_args()
+
+    rows = [(tier, row) for tier in TIERS if tier_csv_path(tier).exists()
+            for row in load_rows(tier, ['Sentence', 'Translation'])]
+
+    started = time.perf_counter()
+    shingle_sets = [shingles(row.Sentence, row.Translation) for _, row in rows]
+    groups, similar, compared = find_clusters(shingle_sets, args.threshold)
+    elapsed = time.perf_counter() - started
+
+    if args.cross_tier:
+        groups = [group for group in groups if len({rows[idx][0] for idx in group}) > 1]
+    groups.sort(key=lambda group: (rows[group[0]][0], rows[group[0]][1].row))
+
+    for group in groups:
+        members = set(group)
+        best = max(similarity for pair, similarity in similar.items() if pair[0] in members)
+        print(f"\n{len(group)} rows (similarity up to {best:.2f}):")
+        for idx in sorted(group, key=lambda idx: (rows[idx][0], rows[idx][1].row)):
+            tier, row = rows[idx]
+            print(f"  tier {tier} row {row.row:>3}: {row.Sentence}  /  {row.Translation}")
+
+    print(f"\n{len(rows)} rows, {compared} pairs compared, {len(groups)} clusters "
+          f"({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,30 +5,24 @@ Uses the TTSPronunciation field with preprocessing to ensure accurate readings:
 - Extracts furigana: 昼食【ちゅうしょく】 → ちゅうしょく
 - Converts acronyms: API → エーピーアイ
 - Preserves TTS pause commas: が、, まず、, を、
+
+Renders through the TTS daemon when one is running (see tts.py).
 """
 
 import argparse
-import csv
 import sys
 from pathlib import Path
 
-import lameenc
-import numpy as np
-from kokoro import KPipeline
-
+from corpus import CorpusStore, changed_rows, tier_csv_path
 from pronunciation import preprocess_for_tts
+from tts import VOICE_FEMALE, VOICE_MALE, get_synthesizer, write_mp3
 
 # Project root
 ROOT = Path(__file__).parent.parent
 
-# Japanese voice options:
-# - jf_alpha (female, best rated C+)
-# - jm_kumo (male, C-)
-VOICE_MALE = 'jm_kumo'
-VOICE_FEMALE = 'jf_alpha'
-
 
-def generate_tier_audio(tier: int, voice: str = VOICE_MALE, force: bool = False, female: bool = False):
+def generate_tier_audio(tier: int, voice: str = VOICE_MALE, force: bool = False, female: bool = False,
+                        since: str | None = None):
     """Generate audio files for a specific tier.
 
     Args:
@@ -36,8 +30,9 @@ def generate_tier_audio(tier: int, voice: str = VOICE_MALE, force: bool = False,
         voice: Kokoro voice to use
         force: If True, regenerate even if files exist
         female: If True, use female voice and separate output directory
+        since: Git ref; if given, only (re)generate rows added or modified since then
     """
-    csv_path = ROOT / f"tier{tier}-vocabulary.csv"
+    csv_path = tier_csv_path(tier)
 
     # Use separate directory for female voice
     if female:
@@ -53,65 +48,52 @@ def generate_tier_audio(tier: int, voice: str = VOICE_MALE, force: bool = False,
     # Create output directory
     output_dir.mkdir(exist_ok=True)
 
-    # Read vocabulary
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        sentences = list(reader)
+    # Read vocabulary (TTS input only)
+    sentences = list(CorpusStore().select(['TTSPronunciation'], tiers=[tier]))
 
     total = len(sentences)
+
+    # Only TTSPronunciation edits change a clip; files are named by row number,
+    # so rows that moved are rendered again too
+    only = None
+    if since:
+        try:
+            only = changed_rows(tier, since, positional=True, columns=['TTSPronunciation'])
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
     print(f"\nTier {tier}: {total} sentences")
+    if only is not None:
+        print(f"Changed since {since}: {len(only)}")
     print(f"Output: {output_dir}")
     print(f"Voice: {voice}\n")
 
-    # Initialize pipeline
-    print("Initializing Kokoro TTS pipeline...")
-    pipeline = KPipeline(lang_code='j')
-    print("Pipeline ready.\n")
+    # Uses the TTS daemon (tts.py serve) if running, else loads Kokoro here
+    synth = get_synthesizer()
 
     # Generate audio for each sentence
-    for idx, row in enumerate(sentences):
+    for row in sentences:
         # Use TTSPronunciation field (has TTS pause commas) and preprocess for accurate TTS
         tts_pronunciation = row['TTSPronunciation']
         tts_input = preprocess_for_tts(tts_pronunciation)
-        num = idx + 1
+        num = row['row']
+        if only is not None and num not in only:
+            continue
 
         # Output filename: tier1_001.mp3, tier1_002.mp3, etc.
         output_path = output_dir / f"tier{tier}_{num:03d}.mp3"
 
-        # Skip if already exists (use --force to regenerate)
-        if output_path.exists() and not force:
+        # Skip if already exists (use --force to regenerate; changed rows are always rendered)
+        if output_path.exists() and not force and only is None:
             print(f"[{num}/{total}] Skipping (exists): {output_path.name}")
             continue
 
         print(f"[{num}/{total}] {tts_input[:50]}{'...' if len(tts_input) > 50 else ''}")
 
         try:
-            # Generate audio
-            audio_chunks = []
-            for gs, ps, audio in pipeline(tts_input, voice=voice):
-                # Convert PyTorch tensor to numpy array
-                audio_chunks.append(audio.numpy() if hasattr(audio, 'numpy') else audio)
-
-            # Concatenate audio chunks
-            if len(audio_chunks) == 1:
-                audio_data = audio_chunks[0]
-            else:
-                audio_data = np.concatenate(audio_chunks)
-
-            # Convert float32 audio to int16 for MP3 encoding
-            audio_int16 = (audio_data * 32767).astype(np.int16)
-
-            # Encode directly to MP3 using lameenc (no ffmpeg needed)
-            encoder = lameenc.Encoder()
-            encoder.set_bit_rate(128)
-            encoder.set_in_sample_rate(24000)
-            encoder.set_channels(1)
-            encoder.set_quality(2)  # 2 = high quality, 7 = fast
-
-            mp3_data = encoder.encode(audio_int16.tobytes()) + encoder.flush()
-
-            with open(output_path, 'wb') as f:
-                f.write(mp3_data)
+            # Encoded chunk by chunk as Kokoro yields them
+            write_mp3(synth.stream(tts_input, voice), output_path)
 
         except Exception as e:
             print(f"    Error: {e}")
@@ -125,7 +107,16 @@ def generate_tier_audio(tier: int, voice: str = VOICE_MALE, force: bool = False,
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Generate audio for vocabulary tiers")
+    parser = argparse.ArgumentParser(
+        description="Generate audio for vocabulary tiers",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/generate_audio.py --all
+  uv run python scripts/generate_audio.py --tier 1 --female
+  uv run python scripts/generate_audio.py --all --since origin/main   # Only rows changed since a commit
+        """
+    )
     parser.add_argument("--tier", type=int, choices=[1, 2, 3, 4, 5, 6],
                         help="Tier number to generate (1-6)")
     parser.add_argument("--all", action="store_true",
@@ -136,14 +127,16 @@ def main():
                         help=f"Voice to use (default: {VOICE_MALE})")
     parser.add_argument("--force", action="store_true",
                         help="Regenerate audio even if files exist")
+    parser.add_argument("--since", type=str, metavar="REF",
+                        help="Only regenerate rows added or modified since this git ref")
 
     args = parser.parse_args()
 
     if args.all:
         for tier in range(1, 7):
-            generate_tier_audio(tier, args.voice, args.force, args.female)
+            generate_tier_audio(tier, args.voice, args.force, args.female, args.since)
     elif args.tier:
-        generate_tier_audio(args.tier, args.voice, args.force, args.female)
+        generate_tier_audio(args.tier, args.voice, args.force, args.female, args.since)
     else:
         parser.print_help()
         sys.exit(1)
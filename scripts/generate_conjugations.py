@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
-"""Generate verb/adjective conjugation tables for Anki cards.
+"""Generate verb/adjective conjugation keys for Anki cards.
 
-This script analyzes the Cloze word from each vocabulary entry and generates
-HTML conjugation tables for verbs and い-adjectives.
+This script analyzes the Cloze word from each vocabulary entry and writes a
+compact conjugation key (word type + dictionary form) for verbs and
+い-adjectives:
+
+    完了 → suru_verb:完了する
+    取り組んで → godan_verb:取り組む
+
+Every form is derivable from that key, so the full HTML table is rendered on
+the card by the template script in create_deck.py instead of being stored in
+each row. generate_conjugation_html() remains the reference implementation
+of that rendering.
 
 Uses fugashi for morphological analysis to identify word types.
 """
@@ -313,31 +322,55 @@ def generate_conjugation_html(word: str, conjugations: dict, word_type: str) ->
     return ''.join(parts)
 
 
-def get_conjugations_for_word(word: str) -> str:
-    """Main function to get HTML conjugation table for a word."""
+def get_conjugations(word_type: str, base: str) -> dict:
+    """Build the conjugation dict for a word type and dictionary form."""
+    if word_type == 'suru_verb':
+        return conjugate_suru_verb(base[:-2])
+    if word_type == 'godan_verb':
+        return conjugate_godan_verb(base)
+    if word_type == 'ichidan_verb':
+        return conjugate_ichidan_verb(base, '')
+    if word_type == 'kuru_verb':
+        return conjugate_kuru_verb()
+    if word_type == 'i_adj':
+        return conjugate_i_adjective(base[:-1])
+    # No conjugation for nouns, な-adjectives in this simple form, etc.
+    return {}
+
+
+def get_conjugation_key(word: str) -> str:
+    """Main function to get the compact conjugation key for a word.
+
+    Returns 'type:base' (e.g. 'godan_verb:取り組む'), or '' if the word
+    has no conjugation table.
+    """
     info = get_word_info(word)
+    if not get_conjugations(info['type'], info['base']):
+        return ''
+    return f"{info['type']}:{info['base']}"
+
+
+def parse_conjugation_key(key: str) -> tuple[str, str]:
+    """Split a conjugation key into (word_type, base)."""
+    word_type, _, base = key.partition(':')
+    return word_type, base
 
-    conjugations = {}
-
-    if info['type'] == 'suru_verb':
-        conjugations = conjugate_suru_verb(info['stem'])
-    elif info['type'] == 'godan_verb':
-        conjugations = conjugate_godan_verb(info['base'])
-    elif info['type'] == 'ichidan_verb':
-        conjugations = conjugate_ichidan_verb(info['base'], info['stem'])
-    elif info['type'] == 'kuru_verb':
-        conjugations = conjugate_kuru_verb()
-    elif info['type'] == 'i_adj':
-        conjugations = conjugate_i_adjective(info['stem'])
-    else:
-        # No conjugation for nouns, な-adjectives in this simple form, etc.
+
+def render_conjugation_key(word: str, key: str) -> str:
+    """Render the HTML table for a conjugation key (same output as the card script)."""
+    if not key:
         return ''
+    word_type, base = parse_conjugation_key(key)
+    return generate_conjugation_html(word, get_conjugations(word_type, base), word_type)
+
 
-    return generate_conjugation_html(word, conjugations, info['type'])
+def get_conjugations_for_word(word: str) -> str:
+    """Get the full HTML conjugation table for a word."""
+    return render_conjugation_key(word, get_conjugation_key(word))
 
 
 def process_csv(tier: int) -> None:
-    """Process a tier CSV file and add conjugations column."""
+    """Process a tier CSV file and fill the Conjugations column with keys."""
     csv_path = ROOT / f"tier{tier}-vocabulary.csv"
 
     if not csv_path.exists():
@@ -359,9 +392,9 @@ def process_csv(tier: int) -> None:
     for row in rows:
         cloze = row.get('Cloze', '')
         if cloze:
-            conjugation_html = get_conjugations_for_word(cloze)
-            row['Conjugations'] = conjugation_html
-            if conjugation_html:
+            conjugation_key = get_conjugation_key(cloze)
+            row['Conjugations'] = conjugation_key
+            if conjugation_key:
                 processed += 1
         else:
             row['Conjugations'] = ''
@@ -377,7 +410,7 @@ def process_csv(tier: int) -> None:
 
 def main():
     """Process all tier CSV files."""
-    print("Generating conjugation tables...")
+    print("Generating conjugation keys...")
 
     for tier in range(1, 7):
         process_csv(tier)
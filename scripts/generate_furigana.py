@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Generate Pronunciation (furigana) and TTSPronunciation for new rows.
+
+Annotates each kanji run of a Sentence with its UniDic reading, in the
+format extract_furigana() reads:
+
+    支払いフローに問題を見つけました。
+    → 支払【しはら】いフローに問題【もんだい】を見【み】つけました。
+
+Readings come per word and are aligned with the word's okurigana, so only
+the kanji carry a reading (取り組んで → 取【と】り組【く】んで). Words that
+cannot be aligned, and counters after numbers (2日【ふつか】), are left
+unannotated and listed for review.
+
+Only empty fields are filled: Pronunciation from Sentence, then
+TTSPronunciation from Pronunciation with the pause policy (pause_policy.py).
+Tagger output is cached in .cache/furigana-tokens.json by sentence hash,
+so re-runs only tag sentences that are new or edited.
+
+Generated readings are UniDic's first guess (今日 may come out as こんにち);
+review them with validate.py --readings.
+
+Usage:
+    uv run python scripts/generate_furigana.py                 # Dry run: show rows that would be filled
+    uv run python scripts/generate_furigana.py --apply         # Fill empty fields in all tiers
+    uv run python scripts/generate_furigana.py --text 見積もりを更新しました。
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import re
+from importlib.metadata import version
+from pathlib import Path
+
+import jaconv
+
+from corpus import CACHE_DIR, TIERS, tier_csv_path
+
+CACHE_PATH = CACHE_DIR / "furigana-tokens.json"
+
+# Bump when the cached token fields change
+TOKENS_VERSION = 1
+
+# Characters that take furigana (same range as extract_furigana, plus 々 〆 ヶ)
+KANJI = r'一-鿿々〆ヶ'
+KANJI_RUN = re.compile(rf'[{KANJI}]+|[^{KANJI}]+')
+HAS_KANJI = re.compile(rf'[{KANJI}]')
+ALL_KANJI = re.compile(rf'[{KANJI}]+')
+
+# Kanji affixes annotated together with their word (基本的【きほんてき】, 不安定【ふあんてい】)
+SUFFIX_POS = '接尾辞'
+PREFIX_POS = '接頭辞'
+
+_tagger = None
+
+
+def get_tagger():
+    """Shared fugashi tagger (created on first use; loading UniDic is slow)."""
+    global _tagger
+    if _tagger is None:
+        import fugashi
+        _tagger = fugashi.Tagger()
+    return _tagger
+
+
+class TokenCache:
+    """Tagger output per sentence hash: [white_space, surface, kana, pos1] per token."""
+
+    def __init__(self, path: Path = CACHE_PATH):
+        self.path = path
+        self.version = f"{TOKENS_VERSION}:unidic-lite-{version('unidic-lite')}"
+        self.sentences = {}
+        self.dirty = False
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            data = {}
+        if data.get('version') == self.version:
+            self.sentences = data.get('sentences', {})
+
+    @staticmethod
+    def key(sentence: str) -> str:
+        return hashlib.sha256(sentence.encode('utf-8')).hexdigest()
+
+    def tokens(self, sentence: str) -> list[list]:
+        key = self.key(sentence)
+        if key not in self.sentences:
+            self.sentences[key] = [[token.white_space, token.surface, token.feature.kana, token.feature.pos1]
+                                   for token in get_tagger()(sentence)]
+            self.dirty = True
+        return self.sentences[key]
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(exist_ok=True)
+        self.path.write_text(json.dumps({'version': self.version, 'sentences': self.sentences},
+                                        ensure_ascii=False), encoding='utf-8')
+        self.dirty = False
+
+
+def align_reading(surface: str, reading: str) -> str | None:
+    """Annotate the kanji runs of one word, or None if okurigana don't fit.
+
+    取り組ん + とりくん → 取【と】り組【く】ん
+    """
+    segments = KANJI_RUN.findall(surface)
+    pattern = ''.join('(.+?)' if HAS_KANJI.match(segment) else re.escape(jaconv.kata2hira(segment))
+                      for segment in segments)
+    match = re.fullmatch(pattern, jaconv.kata2hira(reading))
+    if not match:
+        return None
+
+    groups = iter(match.groups())
+    return ''.join(f"{segment}【{next(groups)}】" if HAS_KANJI.match(segment) else segment
+                   for segment in segments)
+
+
+def join_affixes(tokens: list[list]) -> list[list]:
+    """Merge kanji prefixes and suffixes into the kanji word they attach to."""
+    words = []
+    for white_space, surface, kana, pos1 in tokens:
+        if words and not white_space and ALL_KANJI.fullmatch(surface):
+            previous = words[-1]
+            if ALL_KANJI.fullmatch(previous[1]) and (pos1 == SUFFIX_POS or previous[3] == PREFIX_POS):
+                reading = previous[2] + kana if previous[2] and kana and '*' not in (previous[2], kana) else None
+                words[-1] = [previous[0], previous[1] + surface, reading, pos1 if previous[3] == PREFIX_POS else previous[3]]
+                continue
+        words.append([white_space, surface, kana, pos1])
+    return words
+
+
+def annotate_tokens(tokens: list[list]) -> tuple[str, list[str]]:
+    """Pronunciation for tagged tokens, and the words left for review."""
+    parts = []
+    review = []
+    previous_pos = None
+    previous_surface = ''
+    for white_space, surface, kana, pos1 in join_affixes(tokens):
+        parts.append(white_space)
+        annotated = None
+        if HAS_KANJI.search(surface):
+            # Numbers change counter readings (2日 ふつか, 3分 さんぷん)
+            counter = previous_pos == '名詞' and previous_surface.isdigit()
+            if kana and kana != '*' and not counter:
+                annotated = align_reading(surface, kana)
+            if annotated is None:
+                review.append(previous_surface + surface if counter else surface)
+        parts.append(annotated or surface)
+        previous_pos, previous_surface = pos1, surface
+    return ''.join(parts), review
+
+
+def generate_batch(sentences, cache: TokenCache | None = None) -> list[tuple[str, list[str]]]:
+    """(Pronunciation, review words) per sentence, tagging only uncached ones."""
+    cache = cache or TokenCache()
+    results = [annotate_tokens(cache.tokens(sentence)) for sentence in sentences]
+    cache.save()
+    return results
+
+
+def fill_pronunciations(rows: list[dict], cache: TokenCache | None = None) -> dict[int, list[str]]:
+    """Fill empty Pronunciation fields in place. Returns row number → review words."""
+    missing = [(num, row) for num, row in enumerate(rows, 1)
+               if row.get('Sentence') and not row.get('Pronunciation')]
+    filled = {}
+    if not missing:
+        return filled
+    generated = generate_batch((row['Sentence'] for _, row in missing), cache)
+    for (num, row), (pronunciation, review) in zip(missing, generated):
+        row['Pronunciation'] = pronunciation
+        filled[num] = review
+    return filled
+
+
+def fill_rows(rows: list[dict], cache: TokenCache | None = None) -> list[tuple[int, list[str]]]:
+    """Fill empty Pronunciation/TTSPronunciation fields in place.
+
+    Returns (row number, review words) for each row that changed.
+    """
+    from pause_policy import apply_pauses
+
+    filled = fill_pronunciations(rows, cache)
+    for num, row in enumerate(rows, 1):
+        if row.get('Pronunciation') and not row.get('TTSPronunciation'):
+            row['TTSPronunciation'] = apply_pauses(row['Pronunciation'])
+            filled.setdefault(num, [])
+    return sorted(filled.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fill empty Pronunciation and TTSPronunciation fields from Sentence",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/generate_furigana.py                  # Dry run
+  uv run python scripts/generate_furigana.py --apply
+  uv run python scripts/generate_furigana.py --tier 3 --apply
+  uv run python scripts/generate_furigana.py --text 見積もりを更新しました。
+        """
+    )
+    parser.add_argument("--tier", type=int, choices=TIERS,
+                        help="Only this tier")
+    parser.add_argument("--text", type=str,
+                        help="Annotate one sentence and print it")
+    parser.add_argument("--apply", action="store_true",
+                        help="Write the filled fields (default is a dry run)")
+
+    args = parser.parse_args()
+
+    if args.text:
+        (pronunciation, review), = generate_batch([args.text])
+        print(pronunciation)
+        if review:
+            print(f"Review: {', '.join(review)}")
+        return
+
+    if not args.apply:
+        print("DRY RUN - use --apply to make changes\n")
+
+    cache = TokenCache()
+    total = 0
+    for tier in [args.tier] if args.tier else TIERS:
+        csv_path = tier_csv_path(tier)
+        if not csv_path.exists():
+            continue
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames
+            rows = list(reader)
+        if 'TTSPronunciation' not in fieldnames:
+            print(f"  Warning: TTSPronunciation column not found in {csv_path.name}")
+            continue
+
+        filled = fill_rows(rows, cache)
+        for num, review in filled:
+            print(f"  [tier {tier} row {num}] {rows[num - 1]['TTSPronunciation']}")
+            if review:
+                print(f"      review: {', '.join(review)}")
+        total += len(filled)
+
+        if filled and args.apply:
+            with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(rows)
+
+    print(f"\n{'Filled' if args.apply else 'Would fill'} {total} rows")
+
+
+if __name__ == "__main__":
+    main()
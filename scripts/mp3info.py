@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Fast MP3 inspection from frame headers, without decoding audio.
+
+Walks the MPEG Layer III frame headers of a file (memory-mapped) to get:
+- Duration (from frame count, or the Xing/Info + LAME tag when present)
+- Truncation (last frame cut short, or fewer frames than the Xing tag says)
+- Corruption (lost frame sync mid-file)
+- Silence (frames whose side info carries no audio data)
+- Quiet frames (audio data at a very low global gain; a hint, not proof)
+
+Used by validate.py --deep-audio. Can also be run directly:
+    uv run python scripts/mp3info.py tier1-audio/tier1_001.mp3
+"""
+
+import mmap
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Layer III bitrates in kbps, indexed by the 4-bit bitrate field
+BITRATES_MPEG1 = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+BITRATES_MPEG2 = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+
+# Sample rates by version bits (0 = MPEG 2.5, 2 = MPEG 2, 3 = MPEG 1)
+SAMPLE_RATES = {
+    0: [11025, 12000, 8000],
+    2: [22050, 24000, 16000],
+    3: [44100, 48000, 32000],
+}
+
+# Frames with no audio data above this share make the clip "silent"
+# (and quiet frames above it make it "quiet")
+SILENT_FRAME_RATIO = 0.9
+
+# global_gain is the frame's quantizer step: ~170 for speech, ~143 for noise
+# at -60 dBFS. It also drops for tonal audio at normal loudness (a 220 Hz tone
+# at -23 dBFS encodes at ~134), so a low gain only makes a frame "quiet".
+QUIET_GLOBAL_GAIN = 140
+
+# Frame classes returned by classify_frame()
+AUDIBLE, QUIET, SILENT = 'audible', 'quiet', 'silent'
+
+
+class FrameHeader:
+    """Decoded 4-byte MPEG Layer III frame header."""
+
+    __slots__ = ('mpeg1', 'bitrate', 'sample_rate', 'channels', 'crc', 'length', 'samples')
+
+    def __init__(self, mpeg1: bool, bitrate: int, sample_rate: int, channels: int, crc: bool, padding: int):
+        self.mpeg1 = mpeg1
+        self.bitrate = bitrate
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.crc = crc
+        self.samples = 1152 if mpeg1 else 576
+        self.length = (144 if mpeg1 else 72) * bitrate * 1000 // sample_rate + padding
+
+    @property
+    def side_info_size(self) -> int:
+        if self.mpeg1:
+            return 17 if self.channels == 1 else 32
+        return 9 if self.channels == 1 else 17
+
+
+def parse_header(data, pos: int) -> FrameHeader | None:
+    """Parse a Layer III frame header at pos, or None if there is no valid one."""
+    if pos + 4 > len(data):
+        return None
+
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    if data[pos] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_idx = b2 >> 4
+    rate_idx = (b2 >> 2) & 0x03
+
+    # Reserved version, non-Layer III, free/bad bitrate, reserved sample rate
+    if version == 1 or layer != 1 or bitrate_idx in (0, 15) or rate_idx == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = (BITRATES_MPEG1 if mpeg1 else BITRATES_MPEG2)[bitrate_idx]
+
+    return FrameHeader(
+        mpeg1=mpeg1,
+        bitrate=bitrate,
+        sample_rate=SAMPLE_RATES[version][rate_idx],
+        channels=1 if (b3 >> 6) == 3 else 2,
+        crc=not (b1 & 0x01),
+        padding=(b2 >> 1) & 0x01,
+    )
+
+
+def classify_frame(data, pos: int, header: FrameHeader) -> str:
+    """SILENT if no granule/channel of the frame carries audio data, QUIET
+    if those that do all have a low global gain, else AUDIBLE.
+
+    Reads part2_3_length, big_values and global_gain from the side info: a
+    granule without Huffman-coded values decodes to digital silence.
+    """
+    start = pos + 4 + (2 if header.crc else 0)
+    size = header.side_info_size
+    bits = int.from_bytes(data[start:start + size], 'big')
+    total_bits = size * 8
+
+    if header.mpeg1:
+        offset = 9 + (5 if header.channels == 1 else 3) + 4 * header.channels
+        blocks = 2 * header.channels
+        block_bits = 59
+    else:
+        offset = 8 + (1 if header.channels == 1 else 2)
+        blocks = header.channels
+        block_bits = 63
+
+    result = SILENT
+    for block in range(blocks):
+        # part2_3_length (12 bits), big_values (9), global_gain (8)
+        shift = total_bits - (offset + block * block_bits)
+        part2_3_length = (bits >> (shift - 12)) & 0xFFF
+        big_values = (bits >> (shift - 21)) & 0x1FF
+        global_gain = (bits >> (shift - 29)) & 0xFF
+        if not (part2_3_length or big_values):
+            continue
+        if global_gain >= QUIET_GLOBAL_GAIN:
+            return AUDIBLE
+        result = QUIET
+    return result
+
+
+def skip_id3v2(data) -> int:
+    """Offset of the first byte after a leading ID3v2 tag (0 if none)."""
+    if len(data) >= 10 and data[:3] == b'ID3':
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if data[5] & 0x10 else 0
+        return 10 + size + footer
+    return 0
+
+
+def parse_xing(data, pos: int, header: FrameHeader) -> tuple[int | None, int, int] | None:
+    """Parse a Xing/Info tag in the frame at pos.
+
+    Returns (frame_count, encoder_delay, encoder_padding), or None if the
+    frame is a regular audio frame.
+    """
+    tag = pos + 4 + header.side_info_size
+    if data[tag:tag + 4] not in (b'Xing', b'Info'):
+        return None
+
+    flags = int.from_bytes(data[tag + 4:tag + 8], 'big')
+    cursor = tag + 8
+    frames = None
+    if flags & 0x1:
+        frames = int.from_bytes(data[cursor:cursor + 4], 'big')
+        cursor += 4
+    if flags & 0x2:
+        cursor += 4
+    if flags & 0x4:
+        cursor += 100
+    if flags & 0x8:
+        cursor += 4
+
+    delay = padding = 0
+    if data[cursor:cursor + 4] == b'LAME':
+        packed = int.from_bytes(data[cursor + 21:cursor + 24], 'big')
+        delay, padding = packed >> 12, packed & 0xFFF
+
+    return frames, delay, padding
+
+
+class Mp3Info:
+    """Result of scanning one MP3 file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.size = 0
+        self.frames = 0
+        self.silent_frames = 0
+        self.quiet_frames = 0
+        self.duration = 0.0
+        self.sample_rate = 0
+        self.bitrate = 0
+        self.errors = []
+
+    @property
+    def silent(self) -> bool:
+        return self.frames > 0 and self.silent_frames / self.frames >= SILENT_FRAME_RATIO
+
+    @property
+    def quiet(self) -> bool:
+        """Mostly frames with a low gain (or none): possibly near-silent."""
+        return (self.frames > 0 and not self.silent
+                and (self.silent_frames + self.quiet_frames) / self.frames >= SILENT_FRAME_RATIO)
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+def scan_mp3(path: Path) -> Mp3Info:
+    """Walk all frame headers of an MP3 file."""
+    info = Mp3Info(path)
+
+    try:
+        with open(path, 'rb') as f:
+            info.size = f.seek(0, 2)
+            if info.size == 0:
+                info.errors.append("empty file")
+                return info
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                _walk_frames(data, info)
+    except OSError as e:
+        info.errors.append(str(e))
+
+    return info
+
+
+def _walk_frames(data, info: Mp3Info):
+    """Fill info from the frames in data."""
+    pos = skip_id3v2(data)
+    end = len(data)
+
+    # ID3v1 tag at the end is not frame data
+    if end >= 128 and data[end - 128:end - 125] == b'TAG':
+        end -= 128
+
+    header = parse_header(data, pos)
+    if header is None:
+        info.errors.append("no MPEG Layer III frame at start of audio")
+        return
+
+    info.sample_rate = header.sample_rate
+    info.bitrate = header.bitrate
+
+    expected_frames = None
+    delay = padding = 0
+    xing = parse_xing(data, pos, header)
+    if xing is not None:
+        expected_frames, delay, padding = xing
+        pos += header.length
+
+    samples = 0
+    while pos < end:
+        header = parse_header(data, pos)
+        if header is None:
+            info.errors.append(f"lost frame sync at byte {pos}")
+            break
+        if pos + header.length > end:
+            info.errors.append(f"truncated: last frame needs {header.length} bytes, {end - pos} left")
+            break
+
+        info.frames += 1
+        samples += header.samples
+        kind = classify_frame(data, pos, header)
+        if kind == SILENT:
+            info.silent_frames += 1
+        elif kind == QUIET:
+            info.quiet_frames += 1
+        pos += header.length
+
+    if expected_frames is not None and info.frames < expected_frames:
+        info.errors.append(f"truncated: {info.frames} of {expected_frames} frames")
+
+    if info.frames == 0 and not info.errors:
+        info.errors.append("no audio frames")
+
+    if info.sample_rate:
+        info.duration = max(samples - delay - padding, 0) / info.sample_rate
+
+
+def scan_files(paths: Iterable[Path], workers: int = 8) -> list[Mp3Info]:
+    """Scan many MP3 files in parallel (results in input order)."""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(scan_mp3, paths))
+
+
+if __name__ == '__main__':
+    for info in scan_files(Path(p) for p in sys.argv[1:]):
+        status = "OK" if info.valid else "; ".join(info.errors)
+        silent = " (silent)" if info.silent else " (quiet)" if info.quiet else ""
+        print(f"{info.path}: {info.duration:.2f}s, {info.frames} frames, "
+              f"{info.bitrate}kbps {info.sample_rate}Hz{silent} - {status}")
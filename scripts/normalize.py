@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Canonical character forms for the text fields, before TTS and validation.
+
+The same text can be typed several ways. normalize() picks one, so later
+regexes only need to handle that form:
+
+- Full-width letters and digits become ASCII: ＡＰＩ → API, ３ → 3
+  (convert_english_terms only matches ASCII)
+- Half-width katakana and punctuation become full-width: ｻｰﾊﾞｰ｡ → サーバー。
+- Furigana of kanji are hiragana: 設定【セッテイ】 → 設定【せってい】
+  (readings of Latin words stay katakana: API【エーピーアイ】)
+
+Japanese punctuation (？！、) and spaces are left alone. The conversions
+use mojimoji and jaconv, and results are memoized per string, so
+preprocess_for_tts and validate.py can normalize every row they read.
+
+Usage:
+    uv run python scripts/normalize.py             # Dry run: show rows that are not canonical
+    uv run python scripts/normalize.py --apply     # Rewrite them in the tier CSVs
+"""
+
+import argparse
+import csv
+import re
+from functools import lru_cache
+
+import jaconv
+import mojimoji
+
+from corpus import TIERS, tier_csv_path
+
+# Fields written by hand (TTSPronunciation is derived from Pronunciation)
+NORMALIZED_FIELDS = ('Sentence', 'Cloze', 'Pronunciation')
+
+FULLWIDTH_ALNUM = re.compile(r'[０-９Ａ-Ｚａ-ｚ]+')
+HALFWIDTH_KANA = re.compile(r'[｡-ﾟ]+')
+# Reading after a kanji base (Latin bases keep katakana readings)
+KANJI_READING = re.compile(r'(?<=[一-鿿々〆ヶ])【([^】]*)】')
+
+
+@lru_cache(maxsize=8192)
+def normalize(text: str) -> str:
+    """Canonical form of a text field (idempotent)."""
+    if FULLWIDTH_ALNUM.search(text):
+        text = FULLWIDTH_ALNUM.sub(lambda m: mojimoji.zen_to_han(m.group(0), kana=False), text)
+    if HALFWIDTH_KANA.search(text):
+        text = HALFWIDTH_KANA.sub(lambda m: mojimoji.han_to_zen(m.group(0), ascii=False, digit=False), text)
+    if '【' in text:
+        text = KANJI_READING.sub(lambda m: f"【{jaconv.kata2hira(m.group(1))}】", text)
+    return text
+
+
+def normalize_tiers(dry_run: bool) -> list[tuple[int, int, str, str, str]]:
+    """Normalize NORMALIZED_FIELDS in all tiers. Returns (tier, row, field, old, new)."""
+    changes = []
+    for tier in TIERS:
+        csv_path = tier_csv_path(tier)
+        if not csv_path.exists():
+            continue
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames
+            rows = list(reader)
+
+        changed = False
+        for num, row in enumerate(rows, 1):
+            for field in NORMALIZED_FIELDS:
+                value = row.get(field)
+                if value and normalize(value) != value:
+                    changes.append((tier, num, field, value, normalize(value)))
+                    row[field] = normalize(value)
+                    changed = True
+
+        if changed and not dry_run:
+            with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(rows)
+
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Normalize full-width ASCII, half-width kana and katakana furigana in the tier CSVs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/normalize.py            # Dry run
+  uv run python scripts/normalize.py --apply
+        """
+    )
+    parser.add_argument("--apply", action="store_true",
+                        help="Write the changes (default is a dry run)")
+
+    args = parser.parse_args()
+
+    if not args.apply:
+        print("DRY RUN - use --apply to make changes\n")
+
+    changes = normalize_tiers(not args.apply)
+    for tier, num, field, old, new in changes:
+        print(f"  [tier {tier} row {num}] {field}: {old} → {new}")
+    print(f"\n{'Normalized' if args.apply else 'Would normalize'} {len(changes)} fields")
+
+
+if __name__ == "__main__":
+    main()
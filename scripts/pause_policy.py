@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""Pause-comma policy for TTSPronunciation, tunable from measured pauses.
+
+The rules that used to be hardcoded in three places (を in pronunciation.py,
+the が heuristics and the adverb list of the former fix_ga_commas.py and
+fix_adverb_commas.py) live in data/pause_policy.csv, one row per case:
+
+    Target    word or particle (may span several tokens: 次に, その前に)
+    POS       required part of speech of its last token (助詞), or *
+    Position  any, or initial (start of a sentence)
+    Context   part of speech of the next token (動詞, 名詞, ...), END, or *
+    Pattern   baseline (no pause), comma_after or comma_before
+    GainMs    measured pause gain of the pattern (empty for manual rows)
+    Source    manual (listening session) or measured (analyze_pauses.py)
+
+The policy is compiled into a lookup by target and applied in one pass: the
+Pronunciation field is tagged once (furigana readings removed), each token
+position is matched against the targets, longest first, and the most
+specific matching rule decides. A pause is only inserted where OpenJTalk
+ends an accent phrase (see accent_phrases.py), so a rule never splits words
+read as one phrase. TTSPronunciation is the result, so re-tuning the policy
+also removes commas it no longer wants.
+
+Tuning loop (measurements are cached, see the experiment README):
+    generate_grid.py --tier N → generate_experiment.py → analyze_pauses.py
+    uv run python scripts/pause_policy.py learn    # Measured rows from pause_scores.csv
+
+Usage:
+    uv run python scripts/pause_policy.py apply            # Dry run: show changed rows
+    uv run python scripts/pause_policy.py apply --apply    # Rewrite TTSPronunciation
+    uv run python scripts/pause_policy.py show まず、次にテストします。
+"""
+
+import argparse
+import csv
+import hashlib
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from accent_phrases import PHRASING_VERSION, Phrasing, phrase_all, phrasing
+
+ROOT = Path(__file__).parent.parent
+
+POLICY_PATH = ROOT / "data" / "pause_policy.csv"
+SCORES_PATH = ROOT / "experiments" / "kokoro-pause-test" / "pause_scores.csv"
+
+FIELDNAMES = ['Target', 'POS', 'Position', 'Context', 'Pattern', 'GainMs', 'Source']
+
+# Patterns that can be written into TTSPronunciation: (before, after) the target.
+# Spaces, ellipses and SSML were measured too but change what Kokoro reads.
+PATTERNS = {
+    'baseline': ('', ''),
+    'comma_after': ('', '、'),
+    'comma_before': ('、', ''),
+}
+
+# No comma next to existing punctuation. Periods and ellipses are not
+# included: '.' also ends "..." and "v1.2", and Kokoro does not reliably pause
+# on an ellipsis, so 例えば... keeps its comma.
+PUNCTUATION = set('、。！？!?,')
+SENTENCE_END = set('。！？!?')
+
+# Learning: a pattern must add at least this much pause over the baseline...
+MIN_GAIN_MS = 80
+# ...without making Kokoro say noticeably more
+MAX_EXTRA_SPEECH_MS = 150
+# A baseline that already pauses this long needs no comma
+NATURAL_PAUSE_MS = 120
+
+# Experiment categories: A = particles, B = sentence-initial adverbs
+CATEGORY_RULES = {
+    'A': ('助詞', 'any'),
+    'B': ('*', 'initial'),
+}
+
+READING = re.compile(r'【[^】]*】')
+
+
+class Rule:
+    """One row of the policy."""
+
+    __slots__ = ('target', 'pos', 'position', 'context', 'pattern', 'gain', 'source')
+
+    def __init__(self, target: str, pos: str = '*', position: str = 'any', context: str = '*',
+                 pattern: str = 'baseline', gain: str = '', source: str = 'manual'):
+        if pattern not in PATTERNS:
+            raise ValueError(f"Unknown pause pattern '{pattern}' for {target}")
+        self.target = target
+        self.pos = pos
+        self.position = position
+        self.context = context
+        self.pattern = pattern
+        self.gain = gain
+        self.source = source
+
+    @property
+    def key(self) -> tuple[str, str, str, str]:
+        return self.target, self.pos, self.position, self.context
+
+    @property
+    def specificity(self) -> tuple[int, int, int]:
+        return self.context != '*', self.position != 'any', self.pos != '*'
+
+    def matches(self, last_pos: str, initial: bool, context: str) -> bool:
+        return (self.pos in ('*', last_pos)
+                and (self.position == 'any' or initial)
+                and self.context in ('*', context))
+
+    def as_row(self) -> dict:
+        return dict(zip(FIELDNAMES, (self.target, self.pos, self.position, self.context,
+                                     self.pattern, self.gain, self.source)))
+
+
+def read_policy(path: Path = POLICY_PATH) -> list[Rule]:
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return [Rule(*(row[name] for name in FIELDNAMES)) for row in csv.DictReader(f)]
+
+
+def write_policy(rules: list[Rule], path: Path = POLICY_PATH):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rule.as_row() for rule in rules)
+
+
+def policy_version(path: Path = POLICY_PATH) -> str:
+    """Hash of the policy file and phrasing rules (build fingerprints include it)."""
+    digest = hashlib.sha256(path.read_bytes())
+    digest.update(f"phrasing:{PHRASING_VERSION}".encode())
+    return digest.hexdigest()[:16]
+
+
+_tagger = None
+
+
+def get_tagger():
+    """Shared fugashi tagger (created on first use; loading UniDic is slow)."""
+    global _tagger
+    if _tagger is None:
+        import fugashi
+        _tagger = fugashi.Tagger()
+    return _tagger
+
+
+def tokenize(text: str) -> list[tuple[int, int, str, str]]:
+    """(start, end, surface, pos1) of each token, offsets into text."""
+    tokens = []
+    pos = 0
+    for token in get_tagger()(text):
+        pos += len(token.white_space)
+        tokens.append((pos, pos + len(token.surface), token.surface, token.feature.pos1))
+        pos += len(token.surface)
+    return tokens
+
+
+def context_after(tokens: list[tuple[int, int, str, str]], end: int) -> str:
+    """Part of speech of the first token starting at or after end (END if none)."""
+    return next((pos1 for start, _, _, pos1 in tokens if start >= end), 'END')
+
+
+def strip_readings(text: str) -> tuple[str, list[int]]:
+    """Text without 【reading】 annotations, with offsets back into text.
+
+    ends[i] is the offset in text just after plain character i and any
+    reading that follows it.
+    """
+    plain = []
+    ends = []
+    idx = 0
+    for match in [*READING.finditer(text), None]:
+        stop = match.start() if match else len(text)
+        for pos in range(idx, stop):
+            plain.append(text[pos])
+            ends.append(pos + 1)
+        if match:
+            if ends:
+                ends[-1] = match.end()
+            idx = match.end()
+    return ''.join(plain), ends
+
+
+class PausePolicy:
+    """Compiled policy: rules by target, most specific first."""
+
+    def __init__(self, rules: list[Rule]):
+        self.rules = defaultdict(list)
+        for rule in rules:
+            self.rules[rule.target].append(rule)
+        for candidates in self.rules.values():
+            candidates.sort(key=lambda rule: rule.specificity, reverse=True)
+        self.max_length = max((len(target) for target in self.rules), default=0)
+
+    def decide(self, target: str, last_pos: str, initial: bool, context: str) -> Rule | None:
+        return next((rule for rule in self.rules.get(target, ())
+                     if rule.matches(last_pos, initial, context)), None)
+
+    def pauses(self, plain: str, phrases: Phrasing | None = None) -> list[tuple[int, str]]:
+        """(position, text) insertions for a text without readings.
+
+        With phrases, only at accent-phrase boundaries.
+        """
+        tokens = tokenize(plain)
+        inserts = []
+        idx = 0
+        while idx < len(tokens):
+            start = tokens[idx][0]
+            initial = start == 0 or plain[start - 1] in SENTENCE_END
+
+            # Longest target made of whole tokens starting here
+            matched = None
+            candidates = []
+            for end_idx in range(idx, len(tokens)):
+                surface = plain[start:tokens[end_idx][1]]
+                if len(surface) > self.max_length:
+                    break
+                if surface in self.rules:
+                    candidates.append((end_idx, surface))
+            for end_idx, surface in reversed(candidates):
+                end = tokens[end_idx][1]
+                rule = self.decide(surface, tokens[end_idx][3], initial, context_after(tokens, end))
+                if rule:
+                    matched = (end_idx, rule, end)
+                    break
+
+            if matched is None:
+                idx += 1
+                continue
+
+            end_idx, rule, end = matched
+            before, after = PATTERNS[rule.pattern]
+            if before and start > 0 and plain[start - 1] not in PUNCTUATION and self.at_boundary(start, phrases):
+                inserts.append((start, before))
+            if after and end < len(plain) and plain[end] not in PUNCTUATION and self.at_boundary(end, phrases):
+                inserts.append((end, after))
+            idx = end_idx + 1
+
+        return inserts
+
+    @staticmethod
+    def at_boundary(pos: int, phrases: Phrasing | None) -> bool:
+        return phrases is None or pos in phrases.accent
+
+    def apply(self, pronunciation: str) -> str:
+        """TTSPronunciation for a Pronunciation field (furigana kept in place)."""
+        plain, ends = strip_readings(pronunciation)
+        result = pronunciation
+        # Insert right to left so earlier offsets stay valid
+        for pos, text in sorted(self.pauses(plain, phrasing(plain)), reverse=True):
+            # After the reading of the preceding character
+            offset = ends[pos - 1] if pos else 0
+            result = result[:offset] + text + result[offset:]
+        return result
+
+
+_policy = None
+
+
+def load_policy(path: Path = POLICY_PATH) -> PausePolicy:
+    """The compiled policy (reloaded when the file changes)."""
+    global _policy
+    version = policy_version(path)
+    if _policy is None or _policy[0] != version:
+        _policy = (version, PausePolicy(read_policy(path)))
+    return _policy[1]
+
+
+def apply_pauses(pronunciation: str) -> str:
+    """TTSPronunciation from Pronunciation under the current policy."""
+    return load_policy().apply(pronunciation)
+
+
+def learn(scores_path: Path, rules: list[Rule]) -> tuple[list[Rule], list[str]]:
+    """Replace measured rules with the winners in a pause_scores.csv.
+
+    Groups clips by (target, category, context); manual rules for the same
+    key are kept. Returns (rules, report lines).
+    """
+    with open(scores_path, 'r', encoding='utf-8', newline='') as f:
+        scores = [row for row in csv.DictReader(f) if row.get('gain_ms') not in (None, '')]
+
+    groups = defaultdict(lambda: defaultdict(list))
+    baselines = defaultdict(list)
+    for row in scores:
+        if row['category'] not in CATEGORY_RULES:
+            continue
+        key = (row['target_word'], row['category'], row.get('context') or '*')
+        groups[key][row['pattern']].append(row)
+        if row['pattern'] == 'baseline':
+            baselines[key].append(float(row['target_pause_ms']))
+
+    manual = {rule.key: rule for rule in rules if rule.source == 'manual'}
+    learned = {}
+    report = []
+    for (target, category, context), patterns in sorted(groups.items()):
+        pos, position = CATEGORY_RULES[category]
+        key = (target, pos, position, context)
+
+        natural = baselines[target, category, context]
+        best, best_gain = 'baseline', 0.0
+        if not natural or sum(natural) / len(natural) < NATURAL_PAUSE_MS:
+            for pattern, rows in patterns.items():
+                if pattern == 'baseline' or pattern not in PATTERNS:
+                    continue
+                gain = sum(float(r['gain_ms']) for r in rows) / len(rows)
+                extra = sum(float(r['extra_speech_ms']) for r in rows) / len(rows)
+                if gain >= MIN_GAIN_MS and extra <= MAX_EXTRA_SPEECH_MS and gain > best_gain:
+                    best, best_gain = pattern, gain
+
+        clips = sum(len(rows) for rows in patterns.values())
+        if key in manual:
+            if manual[key].pattern != best:
+                report.append(f"{target} ({position}, before {context}): measured {best}, "
+                              f"keeping manual {manual[key].pattern}")
+            continue
+        learned[key] = Rule(target, pos, position, context, best, f"{best_gain:.0f}", 'measured')
+        report.append(f"{target} ({position}, before {context}): {best} (+{best_gain:.0f}ms, {clips} clips)")
+
+    kept = [rule for rule in rules if rule.source != 'measured']
+    return kept + list(learned.values()), report
+
+
+def apply_to_tiers(dry_run: bool, since: str | None = None) -> list[tuple[int, str, str]]:
+    """Regenerate TTSPronunciation from Pronunciation in all tiers."""
+    from corpus import changed_rows, tier_csv_path
+
+    policy = load_policy()
+    changes = []
+    for tier in range(1, 7):
+        csv_path = tier_csv_path(tier)
+        if not csv_path.exists():
+            continue
+        only = changed_rows(tier, since) if since else None
+
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames
+            rows = list(reader)
+        if 'TTSPronunciation' not in fieldnames:
+            print(f"  Warning: TTSPronunciation column not found in {csv_path.name}")
+            continue
+
+        selected = [row for num, row in enumerate(rows, 1) if only is None or num in only]
+        # One batch through OpenJTalk for the rows not parsed before
+        phrase_all(strip_readings(row['Pronunciation'])[0] for row in selected)
+
+        changed = False
+        for row in selected:
+            new_tts = policy.apply(row['Pronunciation'])
+            if new_tts != row['TTSPronunciation']:
+                changes.append((tier, row['TTSPronunciation'], new_tts))
+                row['TTSPronunciation'] = new_tts
+                changed = True
+
+        if changed and not dry_run:
+            with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(rows)
+
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Apply or learn the TTS pause-comma policy (data/pause_policy.csv)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/pause_policy.py apply                  # Dry run
+  uv run python scripts/pause_policy.py apply --apply
+  uv run python scripts/pause_policy.py apply --since HEAD --apply
+  uv run python scripts/pause_policy.py learn                  # From the experiment's pause_scores.csv
+  uv run python scripts/pause_policy.py show 問題【もんだい】が発生【はっせい】しました。
+        """
+    )
+    parser.add_argument("command", choices=["apply", "learn", "show"])
+    parser.add_argument("text", nargs="?", help="Pronunciation text (show)")
+    parser.add_argument("--apply", action="store_true",
+                        help="Write changes (apply, learn); default is a dry run")
+    parser.add_argument("--since", type=str, metavar="REF",
+                        help="Only rows added or modified since this git ref (apply)")
+    parser.add_argument("--scores", type=Path, default=SCORES_PATH,
+                        help="Measured scores for learn (default: experiment pause_scores.csv)")
+
+    args = parser.parse_args()
+
+    if args.command == "show":
+        if not args.text:
+            print("Error: show needs text")
+            sys.exit(1)
+        print(apply_pauses(args.text))
+        plain = strip_readings(args.text)[0]
+        phrases = phrasing(plain)
+        print(phrases.describe(plain) if phrases else "(accent phrases unavailable: OpenJTalk output not aligned)")
+
+    elif args.command == "learn":
+        if not args.scores.exists():
+            print(f"Error: {args.scores} not found (run analyze_pauses.py first)")
+            sys.exit(1)
+        rules, report = learn(args.scores, read_policy())
+        for line in report:
+            print(f"  {line}")
+        if args.apply:
+            write_policy(rules)
+            print(f"\nWrote {len(rules)} rules → {POLICY_PATH.relative_to(ROOT)}")
+        else:
+            print("\nDRY RUN - use --apply to update the policy")
+
+    elif args.command == "apply":
+        if not args.apply:
+            print("DRY RUN - use --apply to make changes\n")
+        try:
+            changes = apply_to_tiers(not args.apply, args.since)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        for tier, old, new in changes:
+            print(f"  [tier {tier}] - {old}")
+            print(f"  [tier {tier}] + {new}")
+        print(f"\n{'Would change' if not args.apply else 'Changed'} {len(changes)} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,30 +5,22 @@ This module converts the Pronunciation field (with furigana annotations)
 into clean text that TTS engines can read correctly.
 
 Handles:
+0. Normalization: full-width ASCII, half-width kana (see normalize.py)
 1. Furigana extraction: 昼食【ちゅうしょく】 → ちゅうしょく
 2. English acronyms: API → エーピーアイ
 3. Common IT terms: bug → バグ (already in Japanese, but ensures consistency)
-4. Particle pauses: を → を、 (for natural TTS rhythm)
 
 ## TTS Pause Pattern Notes (from Kokoro TTS experiments)
 
-### Particles that need comma for natural pause:
-- を (object marker): ALWAYS add comma after (を → を、)
-  Scripted: を is always a particle, safe to auto-insert.
-
-- が (subject marker): NEEDS comma after for natural pause, BUT requires
-  LLM to determine if が is a particle vs. part of a word/grammar.
-  Example particle: "バグが発生" → "バグが、発生" (sounds natural)
-  Example non-particle: "ながら" (while) - don't insert comma
-
-### Particles that sound fine without comma:
-- は (topic marker): baseline sounds good
-- に (direction/time): baseline sounds good
-- で (location/means): baseline sounds good
+Pause commas (を → を、, が before verbs, introductory adverbs) are already
+in the TTSPronunciation field: pause_policy.py writes them from the rules
+in data/pause_policy.csv, tuned with experiments/kokoro-pause-test/.
 """
 
 import re
 
+from normalize import normalize
+
 # English letter → Japanese katakana mapping
 LETTER_MAP = {
     'A': 'エー',
@@ -223,9 +215,9 @@ def extract_furigana(text: str) -> str:
     All other text is preserved as-is.
     """
     # Pattern matches: optional digits + one or more kanji followed by 【reading】
-    # Kanji range: \u4e00-\u9fff (CJK Unified Ideographs)
+    # Kanji range: \u4e00-\u9fff (CJK Unified Ideographs), plus 々 〆 ヶ (徐々【じょじょ】)
     # This handles cases like 2日【ふつか】, 3時【さんじ】, 10人【じゅうにん】
-    pattern = r'([0-9]*[\u4e00-\u9fff]+)【([^】]+)】'
+    pattern = r'([0-9]*[\u4e00-\u9fff々〆ヶ]+)【([^】]+)】'
 
     def replace_with_reading(match):
         # Return just the reading (group 2), discard the kanji+digits (group 1)
@@ -270,42 +262,26 @@ def convert_english_terms(text: str) -> str:
     return re.sub(pattern, convert_acronym, text)
 
 
-def insert_particle_pauses(text: str) -> str:
-    """Insert commas after particles for natural TTS pauses.
-
-    Based on Kokoro TTS experiments (see experiments/kokoro-pause-test/):
-    - を (object marker): Always insert comma - を is always a particle
-    - が (subject marker): Requires LLM - not handled here (see docstring notes)
-    """
-    # を is always the object marker particle in Japanese
-    # Insert comma after を unless already followed by punctuation
-    text = re.sub(r'を([^、。！？\s])', r'を、\1', text)
-
-    return text
-
-
 def preprocess_for_tts(pronunciation_field: str) -> str:
     """Full preprocessing pipeline for TTS input.
 
+    0. Normalize to canonical characters (ASCII letters, full-width kana)
     1. Extract furigana readings
     2. Convert English terms to katakana
-    3. Insert particle pauses (を → を、)
-    4. Clean up any remaining issues
+    3. Clean up any remaining issues
 
-    Note: が (subject marker) also benefits from comma insertion but requires
-    LLM context to distinguish particle vs. non-particle usage. See module
-    docstring for details.
+    Pause commas come from the TTSPronunciation field (see pause_policy.py).
     """
+    # Step 0: Canonical characters, so the patterns below only see ASCII letters
+    text = normalize(pronunciation_field)
+
     # Step 1: Extract furigana
-    text = extract_furigana(pronunciation_field)
+    text = extract_furigana(text)
 
     # Step 2: Convert English terms
     text = convert_english_terms(text)
 
-    # Step 3: Insert particle pauses for natural TTS rhythm
-    text = insert_particle_pauses(text)
-
-    # Step 4: Clean up
+    # Step 3: Clean up
     # Remove any remaining brackets that might have been missed
     text = re.sub(r'【[^】]*】', '', text)
 
@@ -328,10 +304,7 @@ if __name__ == '__main__':
         'RESTful APIです。',
         'AWS Lambdaを使【つか】ってください。',
         'TypeScriptをJSにトランスパイルしてください。',
-        # Particle pause tests (を → を、)
-        'ハッピーパスをテストしてください。',
-        'データベースをバックアップしてください。',
-        'コードレビューをお願いします。',
+        'ＡＰＩのｻｰﾊﾞｰを設定【セッテイ】してください。',
     ]
 
     print("Pronunciation Preprocessing Test\n")
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """Generate sample audio files from tier 1 vocabulary."""
 
-import csv
-import os
 from pathlib import Path
 
 import soundfile as sf
-from kokoro import KPipeline
+
+from corpus import load_rows
+from tts import SAMPLE_RATE, get_synthesizer
 
 # Project root
 ROOT = Path(__file__).parent.parent
@@ -27,48 +27,30 @@ def main():
     print("(First run downloads the model, this may take a minute)")
     print(f"Using voice: {VOICE}")
 
-    # Initialize pipeline with Japanese language
-    pipeline = KPipeline(lang_code='j')
+    # Uses the TTS daemon (tts.py serve) if running, else loads Kokoro here
+    synth = get_synthesizer()
 
     # Create output directory
     output_dir = ROOT / "samples"
     output_dir.mkdir(exist_ok=True)
 
     # Read tier 1 vocabulary
-    tier1_path = ROOT / "tier1-vocabulary.csv"
-    with open(tier1_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        sentences = list(reader)
+    sentences = load_rows(1, ['Sentence', 'Translation'])
 
-    print(f"\nGenerating {len(SAMPLE_INDICES)} sample audio files...\n")
+    samples = [idx for idx in SAMPLE_INDICES if idx < len(sentences)]
+    print(f"\nGenerating {len(samples)} sample audio files...\n")
 
-    for idx in SAMPLE_INDICES:
-        if idx >= len(sentences):
-            continue
+    # One batch request for all samples
+    audio = synth.synthesize([sentences[idx]['Sentence'] for idx in samples], VOICE)
 
+    for idx, audio_data in zip(samples, audio):
         row = sentences[idx]
-        japanese = row['Sentence']
-        english = row['Translation']
-
-        print(f"[{idx + 1}] {japanese}")
-        print(f"    → {english}")
-
-        # Generate audio
-        # The pipeline returns a generator of (graphemes, phonemes, audio) tuples
-        audio_chunks = []
-        for gs, ps, audio in pipeline(japanese, voice=VOICE):
-            audio_chunks.append(audio)
-
-        # Concatenate audio chunks if multiple
-        if len(audio_chunks) == 1:
-            audio_data = audio_chunks[0]
-        else:
-            import numpy as np
-            audio_data = np.concatenate(audio_chunks)
+        print(f"[{idx + 1}] {row['Sentence']}")
+        print(f"    → {row['Translation']}")
 
         # Save audio file
         output_path = output_dir / f"sample_{idx + 1:03d}.wav"
-        sf.write(str(output_path), audio_data, 24000)
+        sf.write(str(output_path), audio_data, SAMPLE_RATE)
         print(f"    ✓ Saved: {output_path.name}\n")
 
     print(f"Done! Sample audio files saved to: {output_dir}")
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Search the tiers for a word before adding a sentence.
+
+An inverted index maps each character 1-gram and 2-gram to the fields
+containing it, over Sentence, the reading of Pronunciation (furigana
+replace their kanji), Translation, Cloze and KeyMeaning. Text is folded
+before indexing and querying (normalize.py, lower case, katakana →
+hiragana), so API, ＡＰＩ and api match, and so do テスト and てすと.
+
+A query is split on spaces; a row matches when every term occurs in one
+of its fields. Candidates come from intersecting the posting lists of the
+term's n-grams and are then checked as substrings, so a query only touches
+rows that share all of its n-grams. Rows are ranked by the fields that
+matched (Cloze, then KeyMeaning, Sentence, reading, Translation) and by how
+much of the field the term covers. When nothing contains a term, rows
+sharing most of its n-grams are listed instead.
+
+The index is kept in .cache/search-index.pickle, per tier, stamped with the
+CSV's mtime and size; only tiers whose CSV changed are re-indexed.
+
+Usage:
+    uv run python scripts/search_index.py 完了                 # Rows containing 完了
+    uv run python scripts/search_index.py かんりょう           # By reading
+    uv run python scripts/search_index.py "merge request"      # Both words, any field
+    uv run python scripts/search_index.py --field Cloze 完了   # Only Cloze
+"""
+
+import argparse
+import pickle
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import jaconv
+import numpy as np
+
+from corpus import CACHE_DIR, TIERS, load_rows, source_versions
+from normalize import normalize
+from pronunciation import extract_furigana
+
+INDEX_PATH = CACHE_DIR / "search-index.pickle"
+
+# Bump when folding, fields or the stored layout change
+INDEX_VERSION = 1
+
+# Indexed fields and their rank weight ('Reading' is Pronunciation without kanji)
+FIELD_WEIGHTS = {
+    'Cloze': 5.0,
+    'KeyMeaning': 4.0,
+    'Sentence': 3.0,
+    'Reading': 2.0,
+    'Translation': 1.0,
+}
+FIELDS = list(FIELD_WEIGHTS)
+
+MAX_GRAM = 2
+
+# Fuzzy fallback: share of a term's n-grams a field must contain
+MIN_OVERLAP = 0.6
+
+DEFAULT_LIMIT = 20
+
+
+def fold(text: str) -> str:
+    """Search form of a text (also applied to queries)."""
+    return jaconv.kata2hira(normalize(text).lower())
+
+
+def field_texts(row) -> dict[str, str]:
+    """Indexed field values of a corpus row, before folding."""
+    return {
+        'Cloze': row.Cloze,
+        'KeyMeaning': row.KeyMeaning,
+        'Sentence': row.Sentence,
+        'Reading': extract_furigana(normalize(row.Pronunciation)),
+        'Translation': row.Translation,
+    }
+
+
+def grams(text: str, sizes=range(1, MAX_GRAM + 1)) -> set[str]:
+    return {text[i:i + size] for size in sizes for i in range(len(text) - size + 1)}
+
+
+def query_grams(term: str) -> set[str]:
+    """N-grams looked up for a term: its bigrams, or the character itself."""
+    return grams(term, [min(len(term), MAX_GRAM)])
+
+
+class TierIndex:
+    """Postings for one tier: n-gram → sorted document numbers.
+
+    A document is one field of one row; docs[n] is (row, field, folded text).
+    Postings are stored as uint32 bytes so the pickle loads quickly.
+    """
+
+    def __init__(self, tier: int, source: list[int], docs: list[tuple[int, str, str]],
+                 postings: dict[str, bytes], display: dict[int, tuple[str, str]]):
+        self.tier = tier
+        self.source = source
+        self.docs = docs
+        self.postings = postings
+        self.display = display
+
+    @classmethod
+    def build(cls, tier: int, source: list[int]) -> 'TierIndex':
+        docs = []
+        postings = defaultdict(list)
+        display = {}
+        for row in load_rows(tier, ['Sentence', 'Translation', 'Cloze', 'Pronunciation', 'KeyMeaning']):
+            display[row.row] = (row.Sentence, row.Translation)
+            for field, text in field_texts(row).items():
+                text = fold(text)
+                if not text:
+                    continue
+                for gram in grams(text):
+                    postings[gram].append(len(docs))
+                docs.append((row.row, field, text))
+        packed = {gram: np.array(numbers, dtype=np.uint32).tobytes() for gram, numbers in postings.items()}
+        return cls(tier, source, docs, packed, display)
+
+    def posting(self, gram: str) -> np.ndarray:
+        return np.frombuffer(self.postings.get(gram, b''), dtype=np.uint32)
+
+    def containing(self, term: str) -> np.ndarray:
+        """Documents with all n-grams of the term (a superset of the matches)."""
+        lists = sorted((self.posting(gram) for gram in query_grams(term)), key=len)
+        found = lists[0]
+        for other in lists[1:]:
+            if not len(found):
+                break
+            found = np.intersect1d(found, other, assume_unique=True)
+        return found
+
+    def overlapping(self, term: str) -> dict[int, float]:
+        """Documents sharing at least MIN_OVERLAP of the term's n-grams."""
+        term_grams = query_grams(term)
+        counts = defaultdict(int)
+        for gram in term_grams:
+            for doc in self.posting(gram).tolist():
+                counts[doc] += 1
+        return {doc: count / len(term_grams) for doc, count in counts.items()
+                if count / len(term_grams) >= MIN_OVERLAP}
+
+    def as_tuple(self) -> tuple:
+        # Plain tuple, so the pickle does not depend on who imported TierIndex
+        return self.source, self.docs, self.postings, self.display
+
+
+class SearchIndex:
+    """Tier indexes loaded from disk, re-indexing tiers whose CSV changed."""
+
+    def __init__(self, path: Path = INDEX_PATH):
+        self.path = path
+        self.tiers: dict[int, TierIndex] = {}
+        self.reindexed = []
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            data = {}
+        stored = data.get('tiers', {}) if data.get('version') == INDEX_VERSION else {}
+
+        for key, source in source_versions().items():
+            tier = int(key)
+            if tier in stored and stored[tier][0] == source:
+                self.tiers[tier] = TierIndex(tier, *stored[tier])
+            else:
+                self.tiers[tier] = TierIndex.build(tier, source)
+                self.reindexed.append(tier)
+
+        if self.reindexed or set(stored) != set(self.tiers):
+            self.save()
+
+    def save(self):
+        self.path.parent.mkdir(exist_ok=True)
+        with open(self.path, 'wb') as f:
+            pickle.dump({'version': INDEX_VERSION,
+                         'tiers': {tier: index.as_tuple() for tier, index in self.tiers.items()}},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def search(self, query: str, fields: list[str] | None = None,
+               tiers: list[int] | None = None) -> tuple[list[tuple[float, int, int, list[str]]], bool]:
+        """Ranked (score, tier, row, matched fields) for a query.
+
+        Returns (matches, fuzzy); fuzzy is True when a term had no exact
+        match and rows sharing most of its n-grams were returned instead.
+        """
+        terms = fold(query).split()
+        if not terms:
+            return [], False
+        fields = set(fields or FIELDS)
+        indexes = [index for tier, index in sorted(self.tiers.items()) if not tiers or tier in tiers]
+
+        scores = None
+        matched = defaultdict(set)
+        fuzzy = False
+        for term in terms:
+            term_scores = self.score_term(indexes, term, fields, matched)
+            if not term_scores:
+                fuzzy = True
+                term_scores = self.score_term(indexes, term, fields, matched, exact=False)
+            scores = term_scores if scores is None else {
+                key: scores[key] + score for key, score in term_scores.items() if key in scores}
+            if not scores:
+                return [], fuzzy
+
+        matches = [(score, tier, row, sorted(matched[tier, row], key=FIELDS.index))
+                   for (tier, row), score in scores.items()]
+        matches.sort(key=lambda match: (-match[0], match[1], match[2]))
+        return matches, fuzzy
+
+    @staticmethod
+    def score_term(indexes: list[TierIndex], term: str, fields: set[str],
+                   matched: dict[tuple[int, int], set[str]], exact: bool = True) -> dict[tuple[int, int], float]:
+        """Best score per (tier, row) for one term, adding the fields it was found in to matched."""
+        scores = {}
+        for index in indexes:
+            if exact:
+                candidates = ((doc, 1.0) for doc in index.containing(term).tolist())
+            else:
+                candidates = index.overlapping(term).items()
+
+            for doc, overlap in candidates:
+                row, field, text = index.docs[doc]
+                if field not in fields or (exact and term not in text):
+                    continue
+                # Whole field > prefix > anywhere, then the share of the field covered
+                if text == term:
+                    bonus = 1.0
+                elif text.startswith(term):
+                    bonus = 0.5
+                else:
+                    bonus = 0.0
+                key = (index.tier, row)
+                score = FIELD_WEIGHTS[field] * overlap + bonus + len(term) / len(text)
+                if score > scores.get(key, 0.0):
+                    scores[key] = score
+                matched[key].add(field)
+        return scores
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Search Sentence, readings, Translation, Cloze and KeyMeaning across the tiers",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/search_index.py 完了
+  uv run python scripts/search_index.py かんりょう
+  uv run python scripts/search_index.py "merge request" --tier 3
+  uv run python scripts/search_index.py --field Cloze --field KeyMeaning deploy
+        """
+    )
+    parser.add_argument("query", nargs="+", help="Search terms (each query is searched separately)")
+    parser.add_argument("--field", action="append", choices=FIELDS,
+                        help="Only search this field (repeatable; 'Reading' is Pronunciation in kana)")
+    parser.add_argument("--tier", type=int, action="append", choices=TIERS,
+                        help="Only search this tier (repeatable)")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT,
+                        help=f"Rows shown per query (default: {DEFAULT_LIMIT}, 0 for all)")
+
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = SearchIndex()
+    loaded = time.perf_counter() - started
+    if index.reindexed:
+        print(f"Indexed tiers {', '.join(map(str, index.reindexed))} ({loaded * 1000:.0f} ms)\n")
+
+    for query in args.query:
+        started = time.perf_counter()
+        matches, fuzzy = index.search(query, args.field, args.tier)
+        elapsed = time.perf_counter() - started
+
+        note = ", no exact match: closest rows" if fuzzy and matches else ""
+        print(f"{query}: {len(matches)} rows ({elapsed * 1000:.1f} ms{note})")
+        for score, tier, row, fields in matches[:args.limit or None]:
+            sentence, translation = index.tiers[tier].display[row]
+            print(f"  tier {tier} row {row:>3}  [{', '.join(fields)}]  {sentence}  /  {translation}")
+        if args.limit and len(matches) > args.limit:
+            print(f"  ... {len(matches) - args.limit} more (--limit 0 shows all)")
+        print()
+
+
+if __name__ == "__main__":
+    main()
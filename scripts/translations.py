@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""Japanese → English key-meaning dictionary with a compiled lookup.
+
+The dictionary lives in data/translations.csv (Japanese, English, Section).
+On first use it is compiled to .cache/translations.bin, a sorted binary
+table that is memory-mapped and binary-searched, so loading costs a hash of
+the CSV rather than building a dict. The compiled table and the substring
+index (TermIndex) are rebuilt only when the CSV's SHA-256 changes.
+
+    table = load_translations()
+    table.get('完了')        # 'completed'
+    get_term_index().longest_match('リグレッションテスト')
+
+Usage:
+    uv run python scripts/translations.py           # Compile and report duplicates
+    uv run python scripts/translations.py 完了 修正   # Look up terms
+"""
+
+import csv
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+
+from corpus import CACHE_DIR
+
+ROOT = Path(__file__).parent.parent
+
+DATA_PATH = ROOT / "data" / "translations.csv"
+COMPILED_PATH = CACHE_DIR / "translations.bin"
+INDEX_PATH = CACHE_DIR / "translations-index.pickle"
+
+# Shortest dictionary term considered for substring matches (shorter terms
+# match too many unrelated compounds)
+MIN_SUBSTRING_LENGTH = 3
+
+# Compiled table layout (little-endian):
+#   header:  magic, format version, SHA-256 of the CSV, entry count
+#   entries: (key offset, key length, value offset, value length) in CSV order
+#   order:   entry numbers sorted by key bytes (for binary search)
+#   blob:    UTF-8 keys and values
+MAGIC = b'NITR'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sI32sI')
+ENTRY = struct.Struct('<IIII')
+
+
+def source_hash(path: Path = DATA_PATH) -> bytes:
+    """SHA-256 of the dictionary CSV."""
+    return hashlib.sha256(path.read_bytes()).digest()
+
+
+def read_source(path: Path = DATA_PATH) -> tuple[dict[str, str], list[tuple[str, str, str]]]:
+    """Read the dictionary CSV.
+
+    Returns (translations, duplicates) where translations keeps the first
+    position and last value of each term (like a dict literal), and
+    duplicates lists (term, earlier value, later value) for repeated terms.
+    """
+    translations = {}
+    duplicates = []
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            term, meaning = row['Japanese'], row['English']
+            if term in translations:
+                duplicates.append((term, translations[term], meaning))
+            translations[term] = meaning
+
+    return translations, duplicates
+
+
+def compile_translations(path: Path = DATA_PATH, output: Path = COMPILED_PATH) -> Path:
+    """Compile the dictionary CSV into the binary lookup table."""
+    digest = source_hash(path)
+    translations, _ = read_source(path)
+
+    blob = bytearray()
+    entries = []
+    for term, meaning in translations.items():
+        key = term.encode('utf-8')
+        value = meaning.encode('utf-8')
+        entries.append((len(blob), len(key), len(blob) + len(key), len(value)))
+        blob += key + value
+
+    keys = [term.encode('utf-8') for term in translations]
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+
+    output.parent.mkdir(exist_ok=True)
+    tmp = output.with_name(f"{output.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, digest, len(entries)))
+        for entry in entries:
+            f.write(ENTRY.pack(*entry))
+        f.write(struct.pack(f'<{len(order)}I', *order))
+        f.write(blob)
+    os.replace(tmp, output)
+
+    return output
+
+
+class TranslationTable:
+    """Read-only mapping over a memory-mapped compiled table."""
+
+    def __init__(self, path: Path = COMPILED_PATH):
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.source_hash, self._count = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not a compiled translation table: {path}")
+
+        self._entries = HEADER.size
+        self._order = self._entries + self._count * ENTRY.size
+        self._blob = self._order + self._count * 4
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, idx: int) -> tuple[int, int, int, int]:
+        return ENTRY.unpack_from(self._data, self._entries + idx * ENTRY.size)
+
+    def _key(self, idx: int) -> bytes:
+        key_off, key_len, _, _ = self._entry(idx)
+        start = self._blob + key_off
+        return self._data[start:start + key_len]
+
+    def _value(self, idx: int) -> str:
+        _, _, val_off, val_len = self._entry(idx)
+        start = self._blob + val_off
+        return self._data[start:start + val_len].decode('utf-8')
+
+    def _find(self, term: str) -> int | None:
+        """Entry number of a term (binary search over the sorted order)."""
+        key = term.encode('utf-8')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            idx = struct.unpack_from('<I', self._data, self._order + mid * 4)[0]
+            found = self._key(idx)
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                return idx
+        return None
+
+    def get(self, term: str, default: str | None = None) -> str | None:
+        idx = self._find(term)
+        return default if idx is None else self._value(idx)
+
+    def __getitem__(self, term: str) -> str:
+        idx = self._find(term)
+        if idx is None:
+            raise KeyError(term)
+        return self._value(idx)
+
+    def __contains__(self, term: str) -> bool:
+        return self._find(term) is not None
+
+    def __iter__(self):
+        """Terms in dictionary (CSV) order."""
+        for idx in range(self._count):
+            yield self._key(idx).decode('utf-8')
+
+    def items(self):
+        for idx in range(self._count):
+            yield self._key(idx).decode('utf-8'), self._value(idx)
+
+
+class TermIndex:
+    """Aho-Corasick automaton over dictionary terms.
+
+    Finds the longest term contained in a text in one pass over the text,
+    instead of testing every term with `in`. Ties go to the term that comes
+    first in the dictionary.
+    """
+
+    def __init__(self, terms):
+        self.goto = [{}]
+        self.fail = [0]
+        # Best (longest, then earliest) term ending at each node, as (length, -order, term)
+        self.best = [None]
+
+        for order, term in enumerate(terms):
+            node = 0
+            for char in term:
+                nxt = self.goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][char] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.best.append(None)
+                node = nxt
+            candidate = (len(term), -order, term)
+            if self.best[node] is None or candidate > self.best[node]:
+                self.best[node] = candidate
+
+        # Breadth-first: fail links, and inherit the best match of the fail target
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                inherited = self.best[self.fail[child]]
+                if inherited and (self.best[child] is None or inherited > self.best[child]):
+                    self.best[child] = inherited
+
+    @classmethod
+    def from_tables(cls, goto: list, fail: list, best: list) -> 'TermIndex':
+        """Rebuild an index from its goto/fail/best tables."""
+        index = cls.__new__(cls)
+        index.goto, index.fail, index.best = goto, fail, best
+        return index
+
+    def longest_match(self, text: str) -> str | None:
+        """Longest indexed term contained in text, or None."""
+        node = 0
+        best = None
+        for char in text:
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            found = self.best[node]
+            if found and (best is None or found > best):
+                best = found
+        return best[2] if best else None
+
+
+_table = None
+# (mtime_ns, size) of the CSV when _table was checked against its hash
+_table_source = None
+_term_index = None
+
+
+def load_translations() -> TranslationTable:
+    """The compiled dictionary, recompiled first if the CSV changed.
+
+    The CSV is only hashed again when its mtime or size changes, so repeated
+    calls (one per Cloze in add_key_meanings.py) cost a stat().
+    """
+    global _table, _table_source
+    stat = DATA_PATH.stat()
+    source = (stat.st_mtime_ns, stat.st_size)
+    if _table is not None and _table_source == source:
+        return _table
+
+    digest = source_hash()
+    if _table is not None and _table.source_hash == digest:
+        _table_source = source
+        return _table
+
+    table = None
+    if COMPILED_PATH.exists():
+        try:
+            table = TranslationTable(COMPILED_PATH)
+        except ValueError:
+            table = None
+
+    if table is None or table.source_hash != digest:
+        compile_translations()
+        table = TranslationTable(COMPILED_PATH)
+
+    _table = table
+    _table_source = source
+    return _table
+
+
+def get_term_index() -> TermIndex:
+    """Substring index over dictionary terms (cached on disk by CSV hash)."""
+    global _term_index
+    table = load_translations()
+
+    if _term_index is not None and _term_index[0] == table.source_hash:
+        return _term_index[1]
+
+    # Stored as plain tables so the pickle does not depend on who imported TermIndex
+    index = None
+    if INDEX_PATH.exists():
+        try:
+            with open(INDEX_PATH, 'rb') as f:
+                digest, goto, fail, best = pickle.load(f)
+            if digest == table.source_hash:
+                index = TermIndex.from_tables(goto, fail, best)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            index = None
+
+    if index is None:
+        index = TermIndex(term for term in table if len(term) >= MIN_SUBSTRING_LENGTH)
+        # Written aside and renamed, so a concurrent reader never loads half a pickle
+        tmp = INDEX_PATH.with_name(f"{INDEX_PATH.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump((table.source_hash, index.goto, index.fail, index.best), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, INDEX_PATH)
+
+    _term_index = (table.source_hash, index)
+    return index
+
+
+def main():
+    table = load_translations()
+
+    if len(sys.argv) > 1:
+        for term in sys.argv[1:]:
+            print(f"{term}: {table.get(term, '(not found)')}")
+        return
+
+    _, duplicates = read_source()
+    print(f"Compiled {len(table)} terms → {COMPILED_PATH}")
+    if duplicates:
+        print(f"\n{len(duplicates)} duplicate terms (last value wins):")
+        for term, earlier, later in duplicates:
+            note = "" if earlier == later else f" (was '{earlier}')"
+            print(f"  {term}: '{later}'{note}")
+
+
+if __name__ == '__main__':
+    main()
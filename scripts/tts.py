@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""Kokoro TTS shared by the audio scripts, with an optional warm daemon.
+
+Loading Kokoro (model weights, voices, G2P dictionaries) takes several
+seconds per process. `tts.py serve` keeps warm pipelines in a background
+process listening on a Unix socket (.cache/tts.sock); get_synthesizer()
+returns a client for it when it is running and a local pipeline otherwise,
+so scripts work the same either way:
+
+    synth = get_synthesizer()
+    [audio] = synth.synthesize(['こんにちは'], VOICE_MALE)   # float32 PCM, 24 kHz
+    mp3_data = encode_mp3(audio)
+
+    # Or encode chunks as Kokoro yields them (one chunk in memory at a time)
+    write_mp3(synth.stream('こんにちは', VOICE_MALE), Path('out.mp3'))
+
+Usage:
+    uv run python scripts/tts.py serve                     # Run the daemon (foreground)
+    uv run python scripts/tts.py status                    # Is it running? Which voices?
+    uv run python scripts/tts.py say 完了しました -o out.mp3
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import lameenc
+import numpy as np
+
+from corpus import CACHE_DIR
+
+SOCKET_PATH = CACHE_DIR / "tts.sock"
+AUDIO_CACHE_DIR = CACHE_DIR / "tts-audio"
+
+# Bump when the encoding changes, to invalidate cached clips
+AUDIO_CACHE_VERSION = 1
+
+SAMPLE_RATE = 24000
+
+# Japanese voice options:
+# - jf_alpha (female, best rated C+)
+# - jm_kumo (male, C-)
+VOICE_MALE = 'jm_kumo'
+VOICE_FEMALE = 'jf_alpha'
+
+# Length prefix of protocol messages
+LENGTH = struct.Struct('<I')
+
+# Write buffer for streamed MP3 files
+WRITE_BUFFER = 64 * 1024
+
+
+def new_encoder() -> lameenc.Encoder:
+    """128 kbps mono MP3 encoder (lameenc, no ffmpeg needed)."""
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(128)
+    encoder.set_in_sample_rate(SAMPLE_RATE)
+    encoder.set_channels(1)
+    encoder.set_quality(2)  # 2 = high quality, 7 = fast
+    return encoder
+
+
+def to_pcm16(audio: np.ndarray) -> bytes:
+    """Convert float32 audio to int16 for MP3 encoding."""
+    return (audio * 32767).astype(np.int16).tobytes()
+
+
+def encode_mp3(audio: np.ndarray) -> bytes:
+    """Encode float32 mono PCM as 128 kbps MP3."""
+    encoder = new_encoder()
+    return encoder.encode(to_pcm16(audio)) + encoder.flush()
+
+
+def write_mp3(chunks: Iterable[np.ndarray], path: Path) -> int:
+    """Encode float32 PCM chunks into an MP3 file as they arrive.
+
+    One encoder is fed chunk by chunk (the output is the same as encoding
+    the concatenated audio), so only the current chunk is held in memory
+    and bytes reach the disk while synthesis is still running. Writes go
+    to a temp file of their own that replaces path when complete, so a
+    failed or concurrent render never leaves a truncated clip. Returns the number of samples.
+    """
+    encoder = new_encoder()
+    samples = 0
+    # A unique temp name, so concurrent renders of one path never share a file
+    with tempfile.NamedTemporaryFile('wb', buffering=WRITE_BUFFER, dir=path.parent,
+                                     prefix=f"{path.name}.", suffix='.tmp', delete=False) as f:
+        tmp = Path(f.name)
+        try:
+            for chunk in chunks:
+                f.write(encoder.encode(to_pcm16(chunk)))
+                samples += len(chunk)
+            f.write(encoder.flush())
+        except BaseException:
+            f.close()
+            tmp.unlink(missing_ok=True)
+            raise
+    try:
+        # NamedTemporaryFile creates 0600; clips are ordinary readable files
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return samples
+
+
+class AudioCache:
+    """Content-addressed MP3 clips, one per (voice, text).
+
+    Lets experiments that render the same text many times (or across
+    runs) synthesize it once. Clips are written through write_mp3(), so
+    concurrent renders of the same text never see a partial file.
+    """
+
+    def __init__(self, root: Path = AUDIO_CACHE_DIR):
+        self.root = root
+
+    def path(self, text: str, voice: str) -> Path:
+        key = f"{AUDIO_CACHE_VERSION}\0{voice}\0{text}".encode('utf-8')
+        digest = hashlib.sha256(key).hexdigest()
+        return self.root / voice / digest[:2] / f"{digest}.mp3"
+
+    def render(self, synth, text: str, voice: str) -> tuple[Path, bool]:
+        """Cached clip for a text, synthesized first if missing. Returns (path, rendered)."""
+        path = self.path(text, voice)
+        if path.exists():
+            return path, False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_mp3(synth.stream(text, voice), path)
+        return path, True
+
+
+class LocalSynthesizer:
+    """Kokoro pipelines in this process, one per voice (loaded on first use)."""
+
+    def __init__(self):
+        self.pipelines = {}
+        self.lock = threading.Lock()
+
+    def pipeline(self, voice: str):
+        """Pipeline and lock for a voice (KPipeline is not thread-safe)."""
+        with self.lock:
+            if voice not in self.pipelines:
+                from kokoro import KPipeline
+                pipeline = KPipeline(lang_code='j')
+                pipeline.load_voice(voice)
+                self.pipelines[voice] = (pipeline, threading.Lock())
+            return self.pipelines[voice]
+
+    def stream(self, text: str, voice: str) -> Iterator[np.ndarray]:
+        """Yield float32 PCM chunks of one text as Kokoro produces them."""
+        pipeline, lock = self.pipeline(voice)
+        with lock:
+            generated = False
+            for gs, ps, audio in pipeline(text, voice=voice):
+                # Convert PyTorch tensor to numpy array
+                yield audio.numpy() if hasattr(audio, 'numpy') else audio
+                generated = True
+            if not generated:
+                raise RuntimeError(f"No audio generated for: {text}")
+
+    def synthesize(self, texts: list[str], voice: str) -> list[np.ndarray]:
+        """Render each text to float32 PCM at SAMPLE_RATE."""
+        results = []
+        for text in texts:
+            chunks = list(self.stream(text, voice))
+            results.append(chunks[0] if len(chunks) == 1 else np.concatenate(chunks))
+        return results
+
+    def warm_up(self, voice: str):
+        """Load a voice and run G2P once so the first real request is fast."""
+        self.synthesize(['テスト'], voice)
+
+
+def send_message(sock: socket.socket, header: dict, payload: bytes = b''):
+    data = json.dumps(header).encode('utf-8')
+    sock.sendall(LENGTH.pack(len(data)) + data + payload)
+
+
+def recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("TTS daemon closed the connection")
+        buf += chunk
+    return bytes(buf)
+
+
+def recv_header(sock: socket.socket) -> dict:
+    (size,) = LENGTH.unpack(recv_exact(sock, LENGTH.size))
+    return json.loads(recv_exact(sock, size))
+
+
+class DaemonSynthesizer:
+    """Client for the TTS daemon (same interface as LocalSynthesizer)."""
+
+    def __init__(self, path: Path = SOCKET_PATH):
+        self.path = path
+
+    def request(self, header: dict) -> tuple[dict, socket.socket]:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(self.path))
+        send_message(sock, header)
+        response = recv_header(sock)
+        if not response.get('ok'):
+            sock.close()
+            raise RuntimeError(f"TTS daemon: {response.get('error')}")
+        return response, sock
+
+    def synthesize(self, texts: list[str], voice: str) -> list[np.ndarray]:
+        response, sock = self.request({'command': 'synthesize', 'texts': texts, 'voice': voice})
+        with sock:
+            return [np.frombuffer(recv_exact(sock, size), dtype='<f4') for size in response['sizes']]
+
+    def stream(self, text: str, voice: str) -> Iterator[np.ndarray]:
+        response, sock = self.request({'command': 'stream', 'text': text, 'voice': voice})
+        with sock:
+            while True:
+                frame = recv_header(sock)
+                if 'error' in frame:
+                    raise RuntimeError(f"TTS daemon: {frame['error']}")
+                if frame.get('done'):
+                    return
+                yield np.frombuffer(recv_exact(sock, frame['size']), dtype='<f4')
+
+    def warm_up(self, voice: str):
+        self.synthesize(['テスト'], voice)
+
+    def status(self) -> dict:
+        response, sock = self.request({'command': 'status'})
+        sock.close()
+        return response
+
+
+def daemon_running(path: Path = SOCKET_PATH) -> bool:
+    """True if a daemon is accepting connections on the socket."""
+    if not path.exists():
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(str(path))
+        return True
+    except OSError:
+        return False
+
+
+def get_synthesizer(use_daemon: bool = True):
+    """The running daemon's client if available, else a local synthesizer."""
+    if use_daemon and daemon_running():
+        return DaemonSynthesizer()
+    return LocalSynthesizer()
+
+
+class RequestHandler(socketserver.BaseRequestHandler):
+    """One request per connection: a JSON header, answered by header + payload.
+
+    stream answers with {'ok': true}, then a {'size': n} frame plus payload
+    per chunk, and {'done': true} (or {'error': ...}) at the end.
+    """
+
+    def handle(self):
+        try:
+            request = recv_header(self.request)
+            command = request.get('command')
+
+            if command == 'status':
+                send_message(self.request, {
+                    'ok': True,
+                    'voices': sorted(self.server.synth.pipelines),
+                    'requests': self.server.requests,
+                    'uptime': time.time() - self.server.started,
+                })
+                return
+
+            if command == 'stream':
+                send_message(self.request, {'ok': True})
+                self.server.requests += 1
+                try:
+                    for chunk in self.server.synth.stream(request['text'], request.get('voice', VOICE_MALE)):
+                        payload = chunk.astype('<f4').tobytes()
+                        send_message(self.request, {'size': len(payload)}, payload)
+                except OSError:
+                    return  # Client gone mid-stream
+                except Exception as e:
+                    send_message(self.request, {'error': f"{type(e).__name__}: {e}"})
+                    return
+                send_message(self.request, {'done': True})
+                return
+
+            if command != 'synthesize':
+                send_message(self.request, {'ok': False, 'error': f"unknown command: {command}"})
+                return
+
+            texts, voice = request['texts'], request.get('voice', VOICE_MALE)
+            audio = self.server.synth.synthesize(texts, voice)
+            self.server.requests += 1
+            payloads = [a.astype('<f4').tobytes() for a in audio]
+            send_message(self.request, {'ok': True, 'sizes': [len(p) for p in payloads]}, b''.join(payloads))
+        except Exception as e:
+            try:
+                send_message(self.request, {'ok': False, 'error': f"{type(e).__name__}: {e}"})
+            except OSError:
+                pass  # Client already gone
+
+
+class TTSServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, synth: LocalSynthesizer):
+        self.synth = synth
+        self.requests = 0
+        self.started = time.time()
+        super().__init__(str(path), RequestHandler)
+
+
+def serve(voices: list[str], path: Path = SOCKET_PATH):
+    """Run the daemon until interrupted."""
+    if daemon_running(path):
+        print(f"Error: a TTS daemon is already running on {path}")
+        sys.exit(1)
+    path.parent.mkdir(exist_ok=True)
+    if path.exists():
+        path.unlink()  # Stale socket from a daemon that did not shut down
+
+    synth = LocalSynthesizer()
+    for voice in voices:
+        print(f"Warming up {voice}...")
+        synth.warm_up(voice)
+
+    server = TTSServer(path, synth)
+    # Clean up the socket on `kill` as well as Ctrl+C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"TTS daemon listening on {path} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping.")
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Kokoro TTS daemon and client",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  uv run python scripts/tts.py serve
+  uv run python scripts/tts.py serve --voice jm_kumo
+  uv run python scripts/tts.py status
+  uv run python scripts/tts.py say 完了しました -o /tmp/test.mp3 --female
+        """
+    )
+    parser.add_argument("command", choices=["serve", "status", "say"])
+    parser.add_argument("text", nargs="?", help="Text to synthesize (say)")
+    parser.add_argument("--voice", action="append",
+                        help=f"Voice to keep warm (serve, repeatable; default: {VOICE_MALE} and {VOICE_FEMALE})")
+    parser.add_argument("--female", action="store_true",
+                        help=f"Use the female voice ({VOICE_FEMALE}) for say")
+    parser.add_argument("--output", "-o", type=str, default="say.mp3",
+                        help="Output MP3 for say (default: say.mp3)")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.voice or [VOICE_MALE, VOICE_FEMALE])
+
+    elif args.command == "status":
+        if not daemon_running():
+            print("TTS daemon: not running")
+            sys.exit(1)
+        status = DaemonSynthesizer().status()
+        print(f"TTS daemon: running on {SOCKET_PATH}")
+        print(f"  Voices: {', '.join(status['voices']) or '(none loaded)'}")
+        print(f"  Requests served: {status['requests']}")
+        print(f"  Uptime: {int(status['uptime'])}s")
+
+    elif args.command == "say":
+        if not args.text:
+            print("Error: say needs text")
+            sys.exit(1)
+        synth = get_synthesizer()
+        voice = VOICE_FEMALE if args.female else VOICE_MALE
+        start = time.perf_counter()
+        samples = write_mp3(synth.stream(args.text, voice), Path(args.output))
+        source = "daemon" if isinstance(synth, DaemonSynthesizer) else "local pipeline"
+        print(f"Saved {args.output} ({samples / SAMPLE_RATE:.2f}s audio, "
+              f"{time.perf_counter() - start:.2f}s via {source})")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,30 +5,73 @@ Catches common issues:
 - Missing or incorrectly named CSV columns
 - Empty required fields
 - Invalid furigana format (unclosed brackets, invalid readings)
+- Text not in canonical form (full-width ASCII, half-width kana; see normalize.py)
 - Untranslated KeyMeaning values
+- Furigana that disagree with dictionary readings in context (--readings)
 - Missing or empty audio files
+- Corrupt, truncated, silent or oddly sized MP3s (--deep-audio)
+
+Verdicts are cached in .cache/validate-cache.json keyed by the content hash
+of the checked fields/audio and VALIDATOR_VERSION, so unchanged rows and
+files are not re-checked on the next run (--no-cache to re-check all).
+Reading verdicts also depend on the UniDic and OpenJTalk versions, and
+audio verdicts are kept per voice.
 """
 
 import argparse
-import csv
+import hashlib
+import json
 import re
 import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
 from pathlib import Path
 
+import jaconv
+
+from corpus import CACHE_DIR, changed_rows, load_rows, read_header, tier_csv_path
+from mp3info import scan_files
+from normalize import normalize
+from pronunciation import preprocess_for_tts
+
 ROOT = Path(__file__).parent.parent
 
+# Bump when a check changes so cached verdicts are discarded
+VALIDATOR_VERSION = 3
+
+CACHE_PATH = CACHE_DIR / "validate-cache.json"
+
 # Expected CSV columns
 REQUIRED_COLUMNS = {'Sentence', 'Translation', 'Cloze', 'Pronunciation', 'Note', 'KeyMeaning'}
 
+# Columns actually inspected by the checks below (only these are loaded)
+CHECKED_COLUMNS = ('Sentence', 'Cloze', 'Pronunciation', 'KeyMeaning')
+
 # Expected row counts per tier
 TIER_SIZES = {1: 150, 2: 200, 3: 250, 4: 200, 5: 100, 6: 100}
 
-# Hiragana range for validating furigana readings
-HIRAGANA_PATTERN = re.compile(r'^[\u3040-\u309F\u30A0-\u30FFー・]+$')
+# Furigana readings: kana, or ASCII for numbers and letters (normalized text)
+READING_PATTERN = re.compile(r'^[\u3040-\u309F\u30A0-\u30FF0-9A-Za-zー・]+$')
 
 # Furigana bracket pattern
 FURIGANA_PATTERN = re.compile(r'【([^】]*)】')
 
+# Furigana bases whose readings are cross-checked (numbers before kanji belong to them)
+KANJI_PATTERN = re.compile(r'[\u3400-\u9FFF々〆ヶ]')
+NUMBER_PATTERN = re.compile(r'[0-9０-９]')
+
+# Reading checks to run in the parent process; more go to a process pool
+READING_POOL_THRESHOLD = 100
+
+# Plausible clip length per spoken character of TTS input (kana are ~0.1-0.15s)
+SECONDS_PER_CHAR_MIN = 0.04
+SECONDS_PER_CHAR_MAX = 0.3
+DURATION_SLACK = 1.0  # Leading/trailing silence, in seconds
+
+# Punctuation is not spoken (commas add pauses, covered by the slack)
+PUNCTUATION_PATTERN = re.compile(r'[、。！？,.!?\s]')
+
 
 class ValidationResult:
     """Tracks validation results for a tier."""
@@ -43,8 +86,11 @@ class ValidationResult:
         self.furigana_total = 0
         self.key_meaning_valid = 0
         self.key_meaning_total = 0
+        self.reading_valid = 0
+        self.reading_total = 0
         self.audio_valid = 0
         self.audio_total = 0
+        self.audio_duration = 0.0
 
     def add_error(self, msg: str):
         self.errors.append(msg)
@@ -57,103 +103,424 @@ class ValidationResult:
         return len(self.errors) > 0
 
 
-def validate_csv_structure(csv_path: Path, result: ValidationResult) -> list[dict] | None:
+def content_hash(*values: str) -> str:
+    """Hash of the given field values."""
+    return hashlib.sha1('\x1f'.join(values).encode('utf-8')).hexdigest()
+
+
+class ValidationCache:
+    """Check verdicts keyed by content hash, persisted between runs.
+
+    A verdict is {'errors': [...], 'warnings': [...], 'valid': bool, ...}
+    with messages not yet prefixed by row number or file name, so a verdict
+    stays reusable when a row moves or a file is renamed.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, enabled: bool = True):
+        self.path = path
+        self.enabled = enabled
+        self.verdicts = {}
+        self.files = {}
+        self.used = set()
+        self.kinds = set()
+        self.hits = 0
+        self.misses = 0
+
+        if enabled and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                data = {}
+            if data.get('version') == VALIDATOR_VERSION:
+                self.verdicts = data.get('verdicts', {})
+                self.files = data.get('files', {})
+
+    def get(self, kind: str, key: str) -> dict | None:
+        """Cached verdict for a check, or None."""
+        entry = f"{kind}:{key}"
+        self.kinds.add(kind)
+        self.used.add(entry)
+        verdict = self.verdicts.get(entry) if self.enabled else None
+        if verdict is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return verdict
+
+    def put(self, kind: str, key: str, verdict: dict):
+        self.verdicts[f"{kind}:{key}"] = verdict
+
+    def file_hash(self, path: Path) -> str:
+        """SHA-1 of a file, re-read only if its size or mtime changed."""
+        stat = path.stat()
+        cached = self.files.get(str(path))
+        if cached and cached[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return cached[2]
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        self.files[str(path)] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def save(self, prune: bool = False):
+        """Write the cache.
+
+        With prune, drop verdicts of the check kinds run this time that were
+        not used (their rows or files no longer exist in that form); other
+        kinds (e.g. the other voice's audio) are kept.
+        """
+        if not self.enabled:
+            return
+        verdicts = self.verdicts
+        if prune:
+            verdicts = {k: v for k, v in verdicts.items()
+                        if k in self.used or k.split(':', 1)[0] not in self.kinds}
+            self.files = {k: v for k, v in self.files.items() if Path(k).exists()}
+        self.path.parent.mkdir(exist_ok=True)
+        self.path.write_text(json.dumps({
+            'version': VALIDATOR_VERSION,
+            'verdicts': verdicts,
+            'files': self.files,
+        }, ensure_ascii=False), encoding='utf-8')
+
+
+def validate_csv_structure(csv_path: Path, result: ValidationResult) -> list | None:
     """Validate CSV exists and has required columns."""
     if not csv_path.exists():
         result.add_error(f"CSV file not found: {csv_path}")
         return None
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    # Check columns
+    columns = set(read_header(result.tier))
+    missing = REQUIRED_COLUMNS - columns
+    if missing:
+        result.add_error(f"Missing columns: {', '.join(missing)}")
+        return None
 
-        # Check columns
-        columns = set(reader.fieldnames or [])
-        missing = REQUIRED_COLUMNS - columns
-        if missing:
-            result.add_error(f"Missing columns: {', '.join(missing)}")
-            return None
+    rows = load_rows(result.tier, CHECKED_COLUMNS)
+    result.row_count = len(rows)
 
-        rows = list(reader)
-        result.row_count = len(rows)
+    # Check row count
+    expected = TIER_SIZES.get(result.tier, 0)
+    if result.row_count != expected:
+        result.add_warning(f"Row count {result.row_count} differs from expected {expected}")
 
-        # Check row count
-        expected = TIER_SIZES.get(result.tier, 0)
-        if result.row_count != expected:
-            result.add_warning(f"Row count {result.row_count} differs from expected {expected}")
+    result.csv_valid = True
+    return rows
 
-        result.csv_valid = True
-        return rows
 
+def check_furigana(pronunciation: str) -> dict:
+    """Check furigana format of one Pronunciation value."""
+    warnings = []
+    if normalize(pronunciation) != pronunciation:
+        warnings.append("Not in canonical form (run normalize.py --apply)")
+        pronunciation = normalize(pronunciation)
 
-def validate_furigana(rows: list[dict], result: ValidationResult, verbose: bool = False):
-    """Validate furigana format in Pronunciation field."""
-    result.furigana_total = len(rows)
+    # Check bracket matching
+    open_count = pronunciation.count('【')
+    close_count = pronunciation.count('】')
+
+    if open_count != close_count:
+        return {'errors': [f"Unmatched brackets in '{pronunciation[:50]}...'"], 'warnings': warnings, 'valid': False}
 
-    for idx, row in enumerate(rows, 1):
-        pronunciation = row.get('Pronunciation', '')
+    # Check each furigana reading
+    for reading in FURIGANA_PATTERN.findall(pronunciation):
+        if reading and not READING_PATTERN.match(reading):
+            return {'errors': [f"Invalid reading '{reading}' (not hiragana/katakana)"], 'warnings': warnings,
+                    'valid': False}
 
-        # Check bracket matching
-        open_count = pronunciation.count('【')
-        close_count = pronunciation.count('】')
+    return {'errors': [], 'warnings': warnings, 'valid': True}
 
-        if open_count != close_count:
-            result.add_error(f"Row {idx}: Unmatched brackets in '{pronunciation[:50]}...'")
+
+def check_key_meaning(cloze: str, key_meaning: str) -> dict:
+    """Check the KeyMeaning translation of one Cloze."""
+    # Check empty
+    if not key_meaning.strip():
+        return {'errors': [f"Empty KeyMeaning for '{cloze}'"], 'warnings': [], 'valid': False}
+
+    # Check untranslated (same as Cloze)
+    if key_meaning == cloze:
+        # Allow if it's English (like API, JSON)
+        if not re.match(r'^[A-Za-z0-9\s\-\./]+$', cloze):
+            return {'errors': [], 'warnings': [f"KeyMeaning '{key_meaning}' same as Cloze (possibly untranslated)"],
+                    'valid': False}
+
+    warnings = []
+
+    # Check reasonable length
+    if len(key_meaning) > 50:
+        warnings.append(f"KeyMeaning too long ({len(key_meaning)} chars)")
+
+    return {'errors': [], 'warnings': warnings, 'valid': True}
+
+
+def furigana_spans(pronunciation: str) -> tuple[str, list[tuple[int, int, str]]]:
+    """Text without readings, and (start, end, reading) of each kanji base."""
+    plain = ''
+    spans = []
+    idx = 0
+    for match in FURIGANA_PATTERN.finditer(pronunciation):
+        plain += pronunciation[idx:match.start()]
+        idx = match.end()
+        start = len(plain)
+        while start > 0 and KANJI_PATTERN.match(plain[start - 1]):
+            start -= 1
+        if start == len(plain):
+            continue  # Katakana or Latin base (API【エーピーアイ】)
+        while start > 0 and NUMBER_PATTERN.match(plain[start - 1]):
+            start -= 1
+        spans.append((start, len(plain), match.group(1)))
+    return plain + pronunciation[idx:], spans
+
+
+def comparable_kana(text: str) -> str:
+    """Hiragana without voicing marks, so rendaku (づけ/つけ, ぷん/ふん) is not a mismatch."""
+    decomposed = unicodedata.normalize('NFD', jaconv.kata2hira(text))
+    return decomposed.replace('\u3099', '').replace('\u309a', '')
+
+
+_tagger = None
+
+
+def get_tagger():
+    """Shared fugashi tagger (created on first use; loading UniDic is slow)."""
+    global _tagger
+    if _tagger is None:
+        import fugashi
+        _tagger = fugashi.Tagger()
+    return _tagger
+
+
+def reading_dictionaries() -> str:
+    """Dictionary versions the reading checks depend on (part of their cache key)."""
+    import pyopenjtalk
+    return f"unidic-lite-{version('unidic-lite')}:pyopenjtalk-{pyopenjtalk.__version__}"
+
+
+def fugashi_readings(text: str) -> list[tuple[int, int, str | None]]:
+    """(start, end, katakana reading) per UniDic token (None if unknown)."""
+    units = []
+    pos = 0
+    for token in get_tagger()(text):
+        pos += len(token.white_space)
+        reading = getattr(token.feature, 'kana', None)
+        units.append((pos, pos + len(token.surface), reading if reading and reading != '*' else None))
+        pos += len(token.surface)
+    return units
+
+
+def openjtalk_readings(text: str) -> list[tuple[int, int, str | None]]:
+    """(start, end, katakana reading) per OpenJTalk word ([] if not aligned)."""
+    import pyopenjtalk
+    from accent_phrases import align
+
+    nodes = pyopenjtalk.run_frontend(text)
+    starts = align(text, [node['string'] for node in nodes])
+    if starts is None:
+        return []
+    return [(start, start + len(node['string']), node['read'] if node['read'] != '*' else None)
+            for node, start in zip(nodes, starts)]
+
+
+def compare_readings(plain: str, spans: list[tuple[int, int, str]],
+                     units: list[tuple[int, int, str | None]]) -> dict[int, tuple[str, str, str]]:
+    """Annotated vs dictionary reading around each span.
+
+    A span is widened to whole words (and to other spans those words touch),
+    so 見【み】つけました is compared as a whole. Returns span index →
+    (surface, furigana reading, dictionary reading) for comparable spans.
+    """
+    compared = {}
+    for num, (start, end, _) in enumerate(spans):
+        low, high = start, end
+        while True:
+            covering = [unit for unit in units if unit[0] < high and unit[1] > low]
+            new_low = min([low] + [unit[0] for unit in covering])
+            new_high = max([high] + [unit[1] for unit in covering])
+            for other_start, other_end, _ in spans:
+                if other_start < new_high and other_end > new_low:
+                    new_low, new_high = min(new_low, other_start), max(new_high, other_end)
+            if (new_low, new_high) == (low, high):
+                break
+            low, high = new_low, new_high
+
+        if not covering or any(unit[2] is None for unit in covering):
+            continue
+        annotated = ''
+        pos = low
+        for other_start, other_end, reading in spans:
+            if low <= other_start and other_end <= high:
+                annotated += plain[pos:other_start] + reading
+                pos = other_end
+        annotated += plain[pos:high]
+        if KANJI_PATTERN.search(annotated):
+            continue  # A kanji in the words has no furigana
+        compared[num] = (plain[low:high], jaconv.kata2hira(annotated),
+                         jaconv.kata2hira(''.join(unit[2] for unit in covering)))
+    return compared
+
+
+def check_readings(sentence: str, pronunciation: str) -> dict:
+    """Check furigana against UniDic and OpenJTalk readings of the sentence.
+
+    A reading passes if either dictionary agrees with it in context.
+    Mismatches are warnings: both dictionaries miss some valid readings.
+    """
+    plain, spans = furigana_spans(normalize(pronunciation))
+    if plain != normalize(sentence):
+        return {'errors': [], 'warnings': [f"Pronunciation text '{plain[:30]}' differs from Sentence"],
+                'valid': False}
+
+    sources = [compare_readings(plain, spans, fugashi_readings(plain)),
+               compare_readings(plain, spans, openjtalk_readings(plain))]
+    warnings = []
+    reported = set()
+    for num in range(len(spans)):
+        results = [source[num] for source in sources if num in source]
+        if not results or any(comparable_kana(annotated) == comparable_kana(expected)
+                              for _, annotated, expected in results):
             continue
+        surface, annotated, _ = results[0]
+        if surface in reported:
+            continue
+        reported.add(surface)
+        expected = ' / '.join(dict.fromkeys(expected for _, _, expected in results))
+        warnings.append(f"Reading '{annotated}' for {surface} differs from dictionary '{expected}'")
 
-        # Check each furigana reading
-        readings = FURIGANA_PATTERN.findall(pronunciation)
-        valid = True
+    return {'errors': [], 'warnings': warnings, 'valid': not warnings}
 
-        for reading in readings:
-            # Allow hiragana, katakana, and common punctuation
-            if reading and not HIRAGANA_PATTERN.match(reading):
-                # Allow mixed readings with numbers/letters for edge cases
-                if not re.match(r'^[\u3040-\u309F\u30A0-\u30FF0-9A-Za-zー・]+$', reading):
-                    result.add_error(f"Row {idx}: Invalid reading '{reading}' (not hiragana/katakana)")
-                    valid = False
-                    break
 
-        if valid:
-            result.furigana_valid += 1
+def check_readings_row(fields: tuple[str, str]) -> dict:
+    return check_readings(*fields)
 
 
-def validate_key_meaning(rows: list[dict], result: ValidationResult, verbose: bool = False):
-    """Validate KeyMeaning translations."""
-    result.key_meaning_total = len(rows)
+def apply_verdict(verdict: dict, result: ValidationResult, prefix: str = '', suffix: str = ''):
+    """Record a verdict's errors and warnings on the result."""
+    for msg in verdict['errors']:
+        result.add_error(f"{prefix}{msg}{suffix}")
+    for msg in verdict['warnings']:
+        result.add_warning(f"{prefix}{msg}{suffix}")
 
-    for idx, row in enumerate(rows, 1):
-        cloze = row.get('Cloze', '')
-        key_meaning = row.get('KeyMeaning', '')
 
-        # Check empty
-        if not key_meaning.strip():
-            result.add_error(f"Row {idx}: Empty KeyMeaning for '{cloze}'")
-            continue
+def validate_furigana(rows: list, result: ValidationResult, verbose: bool = False,
+                      cache: ValidationCache | None = None):
+    """Validate furigana format in Pronunciation field."""
+    cache = cache or ValidationCache(enabled=False)
+    result.furigana_total = len(rows)
+
+    for row in rows:
+        idx = row.row
+        pronunciation = row.get('Pronunciation', '')
+
+        key = content_hash(pronunciation)
+        verdict = cache.get('furigana', key)
+        if verdict is None:
+            verdict = check_furigana(pronunciation)
+            cache.put('furigana', key, verdict)
 
-        # Check untranslated (same as Cloze)
-        if key_meaning == cloze:
-            # Allow if it's English (like API, JSON)
-            if not re.match(r'^[A-Za-z0-9\s\-\./]+$', cloze):
-                result.add_warning(f"Row {idx}: KeyMeaning '{key_meaning}' same as Cloze (possibly untranslated)")
-                continue
+        apply_verdict(verdict, result, prefix=f"Row {idx}: ")
+        if verdict['valid']:
+            result.furigana_valid += 1
 
-        # Check reasonable length
-        if len(key_meaning) > 50:
-            result.add_warning(f"Row {idx}: KeyMeaning too long ({len(key_meaning)} chars)")
 
-        result.key_meaning_valid += 1
+def validate_key_meaning(rows: list, result: ValidationResult, verbose: bool = False,
+                         cache: ValidationCache | None = None):
+    """Validate KeyMeaning translations."""
+    cache = cache or ValidationCache(enabled=False)
+    result.key_meaning_total = len(rows)
 
+    for row in rows:
+        idx = row.row
+        cloze = row.get('Cloze', '')
+        key_meaning = row.get('KeyMeaning', '')
 
-def validate_audio(tier: int, row_count: int, result: ValidationResult, verbose: bool = False, female: bool = False):
-    """Validate audio files exist and are not empty."""
+        key = content_hash(cloze, key_meaning)
+        verdict = cache.get('key_meaning', key)
+        if verdict is None:
+            verdict = check_key_meaning(cloze, key_meaning)
+            cache.put('key_meaning', key, verdict)
+
+        apply_verdict(verdict, result, prefix=f"Row {idx}: ")
+        if verdict['valid']:
+            result.key_meaning_valid += 1
+
+
+def validate_readings(rows: list, result: ValidationResult, verbose: bool = False,
+                      cache: ValidationCache | None = None):
+    """Cross-check furigana readings against dictionary readings in context."""
+    cache = cache or ValidationCache(enabled=False)
+    result.reading_total = len(rows)
+
+    dictionaries = reading_dictionaries()
+    verdicts = {}
+    pending = []
+    for row in rows:
+        fields = (row.get('Sentence', ''), row.get('Pronunciation', ''))
+        key = f"{dictionaries}:{content_hash(*fields)}"
+        verdict = cache.get('reading', key)
+        if verdict is None:
+            pending.append((row.row, key, fields))
+        else:
+            verdicts[row.row] = verdict
+
+    # Each worker loads UniDic and the OpenJTalk dictionary once
+    fields = [fields for _, _, fields in pending]
+    if len(pending) < READING_POOL_THRESHOLD:
+        checked = [check_readings_row(row_fields) for row_fields in fields]
+    else:
+        with ProcessPoolExecutor() as pool:
+            checked = list(pool.map(check_readings_row, fields, chunksize=32))
+    for (idx, key, _), verdict in zip(pending, checked):
+        cache.put('reading', key, verdict)
+        verdicts[idx] = verdict
+
+    for row in rows:
+        verdict = verdicts[row.row]
+        apply_verdict(verdict, result, prefix=f"Row {row.row}: ")
+        if verdict['valid']:
+            result.reading_valid += 1
+
+
+def check_mp3(info, text: str) -> dict:
+    """Check a scanned MP3 against the length of its TTS input."""
+    if not info.valid:
+        return {'errors': [f"Corrupt audio ({'; '.join(info.errors)})"], 'warnings': [], 'valid': False}
+
+    if info.silent:
+        return {'errors': [f"Silent audio ({info.silent_frames}/{info.frames} frames)"], 'warnings': [],
+                'valid': False}
+
+    warnings = []
+    if info.quiet:
+        quiet = info.silent_frames + info.quiet_frames
+        warnings.append(f"Very quiet audio ({quiet}/{info.frames} frames with a low gain)")
+    spoken = PUNCTUATION_PATTERN.sub('', preprocess_for_tts(text))
+    if info.duration < len(spoken) * SECONDS_PER_CHAR_MIN:
+        warnings.append(f"Audio too short ({info.duration:.1f}s for {len(spoken)} chars)")
+    elif info.duration > len(spoken) * SECONDS_PER_CHAR_MAX + DURATION_SLACK:
+        warnings.append(f"Audio too long ({info.duration:.1f}s for {len(spoken)} chars)")
+
+    return {'errors': [], 'warnings': warnings, 'valid': True, 'duration': info.duration}
+
+
+def validate_audio(tier: int, row_count: int, result: ValidationResult, verbose: bool = False,
+                   female: bool = False, deep: bool = False, cache: ValidationCache | None = None,
+                   only: set[int] | None = None):
+    """Validate audio files exist and are not empty.
+
+    With deep=True, also parse MP3 frame headers to catch corrupt, truncated
+    and silent files, and compare durations against the sentence length.
+    With only, just the files of those row numbers are checked.
+    """
+    cache = cache or ValidationCache(enabled=False)
     audio_dir = ROOT / f"tier{tier}-audio-female" if female else ROOT / f"tier{tier}-audio"
-    result.audio_total = row_count
+    numbers = [idx for idx in range(1, row_count + 1) if only is None or idx in only]
+    result.audio_total = len(numbers)
 
     if not audio_dir.exists():
         result.add_warning(f"Audio directory not found: {audio_dir}")
         return
 
-    for idx in range(1, row_count + 1):
+    present = []
+    for idx in numbers:
         audio_file = audio_dir / f"tier{tier}_{idx:03d}.mp3"
 
         if not audio_file.exists():
@@ -166,28 +533,75 @@ def validate_audio(tier: int, row_count: int, result: ValidationResult, verbose:
             result.add_error(f"Audio too small ({size} bytes): {audio_file.name}")
             continue
 
-        result.audio_valid += 1
+        present.append((idx, audio_file))
 
+    if not deep:
+        result.audio_valid += len(present)
+        return
 
-def validate_tier(tier: int, check_audio: bool = False, verbose: bool = False, female: bool = False) -> ValidationResult:
-    """Validate a single tier."""
+    rows = load_rows(tier, ['TTSPronunciation'])
+
+    # Kept apart per voice, so a run over one voice does not prune the other
+    kind = 'audio-female' if female else 'audio'
+
+    # Look up cached verdicts; scan only new or changed files
+    verdicts = {}
+    pending = []
+    for idx, audio_file in present:
+        text = rows[idx - 1].TTSPronunciation
+        key = f"{cache.file_hash(audio_file)}:{content_hash(text)}"
+        verdict = cache.get(kind, key)
+        if verdict is None:
+            pending.append((idx, audio_file, key, text))
+        else:
+            verdicts[idx] = verdict
+
+    infos = scan_files(audio_file for _, audio_file, _, _ in pending)
+    for (idx, _, key, text), info in zip(pending, infos):
+        verdicts[idx] = check_mp3(info, text)
+        cache.put(kind, key, verdicts[idx])
+
+    for idx, audio_file in present:
+        verdict = verdicts[idx]
+        apply_verdict(verdict, result, suffix=f": {audio_file.name}")
+        if verdict['valid']:
+            result.audio_duration += verdict['duration']
+            result.audio_valid += 1
+
+
+def validate_tier(tier: int, check_audio: bool = False, verbose: bool = False, female: bool = False,
+                  deep_audio: bool = False, cache: ValidationCache | None = None,
+                  only: set[int] | None = None, audio_only: set[int] | None = None,
+                  readings: bool = False) -> ValidationResult:
+    """Validate a single tier.
+
+    only / audio_only restrict the row and audio checks to those row numbers
+    (the structure check always covers the whole file).
+    """
     result = ValidationResult(tier)
-    csv_path = ROOT / f"tier{tier}-vocabulary.csv"
+    csv_path = tier_csv_path(tier)
 
     # Step 1: CSV structure
     rows = validate_csv_structure(csv_path, result)
     if rows is None:
         return result
+    row_count = len(rows)
+    if only is not None:
+        rows = [row for row in rows if row.row in only]
 
     # Step 2: Furigana format
-    validate_furigana(rows, result, verbose)
+    validate_furigana(rows, result, verbose, cache)
 
     # Step 3: KeyMeaning
-    validate_key_meaning(rows, result, verbose)
+    validate_key_meaning(rows, result, verbose, cache)
+
+    # Step 4: Furigana readings (optional)
+    if readings:
+        validate_readings(rows, result, verbose, cache)
 
-    # Step 4: Audio (optional)
+    # Step 5: Audio (optional)
     if check_audio:
-        validate_audio(tier, len(rows), result, verbose, female)
+        validate_audio(tier, row_count, result, verbose, female, deep_audio, cache, audio_only)
 
     return result
 
@@ -212,10 +626,19 @@ def print_result(result: ValidationResult, verbose: bool = False):
         status = "✓" if result.key_meaning_valid == result.key_meaning_total else "✗"
         print(f"  KeyMeaning: {result.key_meaning_valid}/{result.key_meaning_total} translated {status}")
 
+    # Readings
+    if result.reading_total > 0:
+        status = "✓" if result.reading_valid == result.reading_total else "✗"
+        print(f"  Readings: {result.reading_valid}/{result.reading_total} match dictionary {status}")
+
     # Audio
     if result.audio_total > 0:
         status = "✓" if result.audio_valid == result.audio_total else "✗"
-        print(f"  Audio: {result.audio_valid}/{result.audio_total} files exist {status}")
+        label = "valid" if result.audio_duration else "exist"
+        print(f"  Audio: {result.audio_valid}/{result.audio_total} files {label} {status}")
+        if result.audio_duration:
+            minutes, seconds = divmod(int(result.audio_duration), 60)
+            print(f"  Audio duration: {minutes}m {seconds:02d}s")
 
     # Errors
     if result.errors and verbose:
@@ -243,15 +666,27 @@ Examples:
   uv run python scripts/validate.py              # Validate all tiers
   uv run python scripts/validate.py --tier 1     # Validate tier 1 only
   uv run python scripts/validate.py --check-audio # Include audio validation
+  uv run python scripts/validate.py --deep-audio  # Also parse MP3 headers (corrupt/silent/duration)
   uv run python scripts/validate.py --verbose    # Show all errors/warnings
+  uv run python scripts/validate.py --readings -v # Cross-check furigana with dictionary readings
+  uv run python scripts/validate.py --no-cache   # Re-check everything
+  uv run python scripts/validate.py --since origin/main --deep-audio  # Only rows changed since a commit
         """
     )
     parser.add_argument("--tier", type=int, choices=[1, 2, 3, 4, 5, 6],
                         help="Validate specific tier only")
     parser.add_argument("--check-audio", action="store_true",
                         help="Also validate audio files")
+    parser.add_argument("--deep-audio", action="store_true",
+                        help="Parse MP3 frame headers: corruption, truncation, silence, duration (implies --check-audio)")
+    parser.add_argument("--readings", action="store_true",
+                        help="Cross-check furigana against UniDic/OpenJTalk readings in context (warnings)")
     parser.add_argument("--female", action="store_true",
                         help="Validate female voice audio (tier*-audio-female/)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-check every row and file, ignoring cached verdicts")
+    parser.add_argument("--since", type=str, metavar="REF",
+                        help="Only check rows added or modified since this git ref")
     parser.add_argument("--verbose", "-v", action="store_true",
                         help="Show detailed errors and warnings")
 
@@ -265,17 +700,38 @@ Examples:
     print(f"Vocabulary & Audio Validation{voice_label}")
     print("=" * 50)
 
+    cache = ValidationCache(enabled=not args.no_cache)
+
+    # Audio files are named by row number, so rows that moved count as changed for audio
+    try:
+        only = {tier: changed_rows(tier, args.since) for tier in tiers} if args.since else {}
+        # Clips only depend on TTSPronunciation (and are named by row number)
+        audio_only = {tier: changed_rows(tier, args.since, positional=True, columns=['TTSPronunciation'])
+                      for tier in tiers} if args.since else {}
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if args.since:
+        print(f"Only rows changed since {args.since}: {sum(len(rows) for rows in only.values())} "
+              f"({sum(len(rows) for rows in audio_only.values())} audio files)")
+
     all_results = []
     for tier in tiers:
-        result = validate_tier(tier, args.check_audio, args.verbose, args.female)
+        result = validate_tier(tier, args.check_audio or args.deep_audio, args.verbose, args.female,
+                               args.deep_audio, cache, only.get(tier), audio_only.get(tier), args.readings)
         all_results.append(result)
         print_result(result, args.verbose)
 
+    # Only a full run knows which cached verdicts are obsolete
+    cache.save(prune=not args.tier and not args.since)
+
     # Summary
     total_errors = sum(len(r.errors) for r in all_results)
     total_warnings = sum(len(r.warnings) for r in all_results)
 
     print("\n" + "=" * 50)
+    if cache.enabled:
+        print(f"Cache: {cache.hits} reused, {cache.misses} checked")
     if total_errors == 0:
         print(f"All validations passed! ({total_warnings} warnings)")
         sys.exit(0)